@@ -8,15 +8,23 @@ import matplotlib.pyplot as plt
 import numpy as np
 import json
 import os
+from matplotlib.collections import LineCollection
 
 from src.drivers.rocketDrawing import RocketDrawing  # Custom drawing class
 from src.drivers.aeroCalcs import AeroCalcs  # Aero calculations
 from src.drivers.physCalcs import PhysCalcs
+from src.drivers.trajectoryAnalytics import TrajectoryAnalytics
+from src.drivers.flightPlayback import FlightPlayback
+from src.drivers.livePreview import LivePreview
+from src.drivers.rocketSpec import RocketSpec
+from src.drivers.runHistory import RunHistory, RunOverlay
+from src.drivers.resultsTable import COLUMNS, ResultsTable, ResultsTableModel
+from src.drivers.latencyTrace import LatencyTracer, TracedMainWindow, load_script, replay
 
 class Ui_MainWindow(object):
 
     def setupUi(self, MainWindow):
-        self.json_path = os.path.join(os.path.dirname(__file__), "src\\config\\rocket_specs.json")
+        self.json_path = os.path.join(os.path.dirname(__file__), "src", "config", "rocket_specs.json")
         MainWindow.setObjectName("MainWindow")
 
         # Get screen dimensions
@@ -256,15 +264,78 @@ class Ui_MainWindow(object):
         self.plot_button = QtWidgets.QPushButton("Plot Z Position")
         self.plot_button.clicked.connect(self.plot_y_position)
 
-        self.graph_layout2.addWidget(self.flight_toolbar)
-        self.graph_layout2.addWidget(self.flight_canvas)
-        self.graph_layout2.addWidget(self.plot_button)
+        # Earlier runs, kept in a bounded history and optionally overlaid on the flight plot
+        self.run_history = RunHistory()
+        self.flight_ax = None  # Created with its reusable artists on the first plot
+        self.overlay_checkbox = QtWidgets.QCheckBox("Overlay Previous Runs")
+        self.overlay_checkbox.toggled.connect(self.toggle_overlay)
+
+        # Flight playback, animated on its own canvas from the last plotted flight
+        self.playback_figure = plt.figure()
+        self.playback_canvas = FigureCanvas(self.playback_figure)
+        self.play_button = QtWidgets.QPushButton("Play Flight")
+        self.play_button.clicked.connect(self.play_flight)
+        self.playback_label = QtWidgets.QLabel("")  # Readout outside the canvas keeps text out of the blit
+        self.playback_label.setFont(QFont("Monospace"))
+        # Fixed size, so changing text never relayouts (and fully redraws) the canvas above it
+        self.playback_label.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Fixed)
+        self.playback_label.setFixedHeight(self.playback_label.fontMetrics().height() + 4)
+        self.last_flight = None
+        self.playback = None
+
+        # Altitude plot and playback share the group as tabs
+        self.flight_tabs = QtWidgets.QTabWidget()
+        self.altitude_page = QtWidgets.QWidget()
+        self.altitude_layout = QtWidgets.QVBoxLayout(self.altitude_page)
+        self.altitude_layout.addWidget(self.flight_toolbar)
+        self.altitude_layout.addWidget(self.flight_canvas)
+        self.flight_tabs.addTab(self.altitude_page, "Altitude")
+        self.playback_page = QtWidgets.QWidget()
+        self.playback_layout = QtWidgets.QVBoxLayout(self.playback_page)
+        self.playback_layout.addWidget(self.playback_canvas)
+        self.playback_layout.addWidget(self.playback_label)
+        self.flight_tabs.addTab(self.playback_page, "Playback")
+
+        self.flight_buttons = QtWidgets.QHBoxLayout()
+        self.flight_buttons.addWidget(self.plot_button)
+        self.flight_buttons.addWidget(self.play_button)
+        self.flight_buttons.addWidget(self.overlay_checkbox)
+
+        self.graph_layout2.addWidget(self.flight_tabs)
+        self.graph_layout2.addLayout(self.flight_buttons)
 
         self.sim_layout.addWidget(self.graph_group2, 2, 1, 2, 1)
 
+        # Live Preview: estimates that refine in the background as inputs change
+        self.preview_group = QtWidgets.QGroupBox("Live Preview")
+        self.preview_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        self.preview_group.setFont(graph_font)
+        self.preview_layout = QtWidgets.QHBoxLayout(self.preview_group)
+
+        self.margin_label = QtWidgets.QLabel("Static Margin: -")
+        self.margin_label.setFont(label_font)
+        self.apogee_label = QtWidgets.QLabel("Apogee: -")
+        self.apogee_label.setFont(label_font)
+        self.burnout_label = QtWidgets.QLabel("Burnout Velocity: -")
+        self.burnout_label.setFont(label_font)
+        self.preview_layout.addWidget(self.margin_label)
+        self.preview_layout.addWidget(self.apogee_label)
+        self.preview_layout.addWidget(self.burnout_label)
+
+        self.sim_layout.addWidget(self.preview_group, 5, 0, 1, 2)
+
+        self.live_preview = LivePreview(parent=MainWindow)
+        self.live_preview.updated.connect(self.show_preview)
+
         # Add Simulation Tab to Tab Widget
         self.tabWidget.addTab(self.Simulation, "Simulation Tab")
 
+        ##### Results Tab ##################
+        self.Results = QtWidgets.QWidget()
+        self.Results.setObjectName("Results")
+        self.tabWidget.addTab(self.Results, "Results Tab")
+        self.setup_results_tab()
+
         ##### Information Tab ##################
         self.Information = QtWidgets.QWidget()
         self.Information.setObjectName("Information")
@@ -313,6 +384,25 @@ class Ui_MainWindow(object):
         # Parachute connections
         self.parachute_list.itemClicked.connect(self.update_parachute)
 
+        # Live preview, connected last so it sees the JSON written by the slots above
+        for spinbox in (self.af_d_input, self.af_l_input, self.nc_l_input, self.sweep_angle_input,
+                        self.tip_chord_input, self.semi_span_input, self.root_chord_input):
+            spinbox.valueChanged.connect(self.refresh_preview)
+        for list_widget in (self.nc_list, self.material_list, self.motor_list, self.parachute_list):
+            list_widget.itemClicked.connect(self.refresh_preview)
+
+    def enable_latency_trace(self, MainWindow):
+        """Trace input-to-paint latency of editor edits, Display Rocket Design and Plot; MainWindow is a TracedMainWindow."""
+        tracer = LatencyTracer(MainWindow)
+        for name in ("af_d_input", "af_l_input", "nc_l_input", "sweep_angle_input", "tip_chord_input",
+                     "semi_span_input", "root_chord_input"):
+            tracer.track(getattr(self, name), "spinbox_edit", name)
+        for name in ("nc_list", "material_list", "motor_list", "parachute_list"):
+            tracer.track(getattr(self, name), "list_select", name)
+        tracer.track(self.display_button, "display_rocket", "display_button")
+        tracer.track(self.plot_button, "simulate", "plot_button")
+        return tracer
+
     def update_json(self, section, key, value):
         """Update the JSON file with the specified key-value pair."""
         
@@ -424,6 +514,24 @@ class Ui_MainWindow(object):
             self.update_json("motor", "diameter", 3.5)
 
 
+    def refresh_preview(self, *args):
+        """Restart the live preview from the current JSON specs."""
+        try:
+            with open(self.json_path, "r") as file:
+                rocket_specs = json.load(file)
+            self.live_preview.request(rocket_specs)
+        except Exception as e:
+            print(f"Error in refresh_preview: {e}")
+
+    def show_preview(self, fidelity, estimate):
+        """Show a live preview result; closed-form estimates are marked with a tilde."""
+        if fidelity == "margin":
+            self.margin_label.setText(f"Static Margin: {estimate['static_margin']:.2f} cal")
+            return
+        prefix = "" if fidelity == "full" else "~"
+        self.apogee_label.setText(f"Apogee: {prefix}{estimate['apogee']:.0f} m")
+        self.burnout_label.setText(f"Burnout Velocity: {prefix}{estimate['burnout_velocity']:.0f} m/s")
+
     def display_rocket_design(self):
         """
         Display the rocket design in the embedded Matplotlib graph.
@@ -435,66 +543,287 @@ class Ui_MainWindow(object):
         with open(self.json_path, "r") as file:
             rocket_specs = json.load(file)
 
+        # Compile the specs once and share them with AeroCalcs and RocketDrawing
+        try:
+            spec = RocketSpec.from_dict(rocket_specs)
+        except ValueError as e:
+            print(f"Error in display_rocket_design: {e}")
+            ax.axis("off")
+            ax.text(0.5, 0.5, f"Cannot draw this design:\n{e}", ha="center", va="center", wrap=True,
+                    transform=ax.transAxes)
+            self.design_canvas.draw()
+            return
+
         # Create an instance of AeroCalcs to calculate CG and CP
-        aero_calcs = AeroCalcs(rocket_specs)
+        aero_calcs = AeroCalcs(spec)
         cg = aero_calcs.calculate_center_of_gravity()
         cp = aero_calcs.calculate_center_of_pressure()
 
         # Draw the rocket using RocketDrawing
-        rocket_drawing = RocketDrawing(rocket_specs, cg, cp)
+        rocket_drawing = RocketDrawing(spec, cg, cp)
         rocket_drawing.plot_rocket(ax)  # Pass the axis for plotting
 
         # Update the canvas in the GUI
         self.design_canvas.draw()
 
-    def plot_y_position(self):
-        """Plot Y position with gradient in the embedded Matplotlib graph."""
+    def setup_flight_plot(self):
+        """Create the flight plot axes and the artists every run reuses."""
         self.flight_figure.clear()
         ax = self.flight_figure.add_subplot(111)
-        
-        phys_calcs = PhysCalcs(self.json_path)
-        try:
-            # Simulate and get data
-            time, x, y, vx, vy = phys_calcs.simulate()
 
-            # Compute velocity magnitude
-            
-            velocity = np.sqrt(vx**2 + vy**2)
-            
+        # Gradient line of the current run, colored by velocity
+        self.flight_lc = LineCollection([], cmap="viridis", norm=plt.Normalize(0, 1))
+        self.flight_lc.set_linewidth(2)
+        ax.add_collection(self.flight_lc)
+
+        # Add colorbar and set labels
+        ax.set_title("Rocket Y-Position Over Time with Velocity Gradient")
+        ax.set_xlabel("Time (s)")
+        ax.set_ylabel("Z Position (ft)")
+        ax.grid()
+        cbar = self.flight_figure.colorbar(self.flight_lc, ax=ax)
+        cbar.set_label("Velocity (ft/s)")
+
+        # Burnout, apogee and landing markers
+        self.event_markers = [
+            (ax.axvline(0, color="gray", linestyle=":", linewidth=1, visible=False),
+             ax.annotate(label, (0, 0), rotation=90, fontsize=8, xytext=(2, -2), textcoords="offset points",
+                         va="top", visible=False))
+            for label in ("Burnout", "Apogee", "Landing")
+        ]
+        self.run_overlay = RunOverlay(ax, self.run_history.capacity)
+        # Shown instead of a new run when the design cannot be simulated
+        self.flight_message = ax.text(0.5, 0.5, "", ha="center", va="center", wrap=True, transform=ax.transAxes,
+                                      bbox={"facecolor": "white", "edgecolor": "red"}, visible=False)
+        self.flight_ax = ax
+
+    def plot_y_position(self):
+        """Plot Y position with gradient in the embedded Matplotlib graph."""
+        if self.flight_ax is None:
+            self.setup_flight_plot()
 
-            # Normalize velocities for color gradient
-            norm = plt.Normalize(velocity.min(), velocity.max())
+        try:
+            phys_calcs = PhysCalcs(self.json_path)
+        except ValueError as e:
+            print(f"Error in plot_y_position: {e}")
+            self.last_flight = None  # Playback must not animate the previous design as if it were this one
+            self.flight_message.set_text(f"Cannot simulate this design:\n{e}")
+            self.flight_message.set_visible(True)
+            self.flight_canvas.draw()
+            return
+        self.flight_message.set_visible(False)
+        try:
+            # Simulate and derive speed and flight events in one pass
+            analytics = TrajectoryAnalytics.run(phys_calcs)
+            time, y, velocity = analytics.t, analytics.y, analytics.speed
+            events = analytics.events()
+            self.last_flight = (phys_calcs, time, analytics.x, y, analytics.vx, analytics.vy)
+            self.run_history.add(phys_calcs.rocket_specs, time, y, velocity,
+                                 {"apogee": events.apogee, "flight_time": events.landing_time,
+                                  "max_velocity": float(velocity.max())})
+
+            # Gradient segments, colored by the normalized velocity
             points = np.array([time, y]).T.reshape(-1, 1, 2)
             segments = np.concatenate([points[:-1], points[1:]], axis=1)
+            self.flight_lc.set_segments(segments)
+            self.flight_lc.set_array(velocity)
+            self.flight_lc.set_clim(velocity.min(), velocity.max())
 
-            # Create LineCollection for gradient
-            from matplotlib.collections import LineCollection
-            lc = LineCollection(segments, cmap="viridis", norm=norm)
-            lc.set_array(velocity)
-            lc.set_linewidth(2)
-            ax.add_collection(lc)
-
-            # Add colorbar and set labels
-            ax.set_title("Rocket Y-Position Over Time with Velocity Gradient")
-            ax.set_xlabel("Time (s)")
-            ax.set_ylabel("Z Position (ft)")
-            ax.grid()
-            cbar = self.flight_figure.colorbar(lc, ax=ax)
-            cbar.set_label("Velocity (ft/s)")
-
-            # Set plot limits
-            ax.set_xlim(time.min(), time.max())
-            ax.set_ylim(y.min() - 10, y.max() + 10)
+            # Mark burnout, apogee and landing
+            for (line, note), event_time in zip(self.event_markers, (events.burnout_time, events.apogee_time,
+                                                                     events.landing_time)):
+                line.set_xdata([event_time, event_time])
+                note.xy = (event_time, y.max())
+                line.set_visible(True)
+                note.set_visible(True)
+
+            self.flight_limits = (time.min(), time.max(), y.min(), y.max())
+            self.update_overlay()
 
             # Update the canvas in the GUI
             self.flight_canvas.draw()
         except Exception as e:
             print(f"Error in plot_y_position: {e}")
 
+    def play_flight(self):
+        """Animate the last plotted flight, simulating the current design first if there is none."""
+        if self.last_flight is None:
+            self.plot_y_position()
+            if self.last_flight is None:
+                return
+        phys_calcs, time, x, y, vx, vy = self.last_flight
+        if self.playback is not None:
+            self.playback.stop()
+
+        self.playback_figure.clear()
+        ax = self.playback_figure.add_subplot(111)
+        aero_calcs = phys_calcs.aero_calcs
+        rocket_drawing = RocketDrawing(phys_calcs.spec, aero_calcs.calculate_center_of_gravity(),
+                                       aero_calcs.calculate_center_of_pressure())
+        self.playback = FlightPlayback(ax, rocket_drawing, time, x, y, vx, vy,
+                                       readout=lambda text: self.playback_label.setText(text.replace("\n", "   ")))
+        self.flight_tabs.setCurrentWidget(self.playback_page)
+        self.playback_canvas.draw()
+        self.playback.start()
+
+    def update_overlay(self):
+        """Show or hide the earlier runs and fit the plot limits to what is shown."""
+        t_min, t_max, y_min, y_max = self.flight_limits
+        shown = []
+        if self.overlay_checkbox.isChecked():
+            shown = self.run_overlay.update(self.run_history.runs()[:-1])
+        else:
+            self.run_overlay.hide()
+        for line in shown:
+            t, y = line.get_data()
+            t_max, y_min, y_max = max(t_max, t[-1]), min(y_min, y.min()), max(y_max, y.max())
+
+        legend = self.flight_ax.get_legend()
+        if shown:
+            self.flight_ax.legend(handles=shown, title="Apogee (m)", fontsize=8, title_fontsize=8)
+        elif legend is not None:
+            legend.remove()
+
+        # Set plot limits
+        self.flight_ax.set_xlim(t_min, t_max)
+        self.flight_ax.set_ylim(y_min - 10, y_max + 10)
+
+    def toggle_overlay(self, checked):
+        """Redraw the flight plot with or without the earlier runs."""
+        if self.flight_ax is not None and len(self.run_history):
+            self.update_overlay()
+            self.flight_canvas.draw_idle()
+
+    def setup_results_tab(self):
+        """Sweep results table with column filters; selecting a row loads that design."""
+        self.results_layout = QtWidgets.QVBoxLayout(self.Results)
+        self.results_controls = QtWidgets.QHBoxLayout()
+
+        self.open_results_button = QtWidgets.QPushButton("Open Results...")
+        self.open_results_button.clicked.connect(self.open_results)
+        self.filter_column = QtWidgets.QComboBox()
+        self.filter_min = QtWidgets.QLineEdit()
+        self.filter_min.setPlaceholderText("min")
+        self.filter_max = QtWidgets.QLineEdit()
+        self.filter_max.setPlaceholderText("max")
+        self.filter_button = QtWidgets.QPushButton("Apply Filter")
+        self.filter_button.clicked.connect(self.apply_results_filter)
+        self.valid_checkbox = QtWidgets.QCheckBox("Valid Only")
+        self.valid_checkbox.toggled.connect(self.toggle_valid_results)
+        self.results_count = QtWidgets.QLabel("No results loaded")
+        for widget in (self.open_results_button, self.filter_column, self.filter_min, self.filter_max,
+                       self.filter_button, self.valid_checkbox, self.results_count):
+            self.results_controls.addWidget(widget)
+        self.results_controls.addStretch()
+
+        # Model/view table: only the visible cells are ever formatted
+        self.results_model = ResultsTableModel(parent=self.Results)
+        self.results_view = QtWidgets.QTableView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setSortingEnabled(True)
+        self.results_view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.results_view.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.results_view.verticalHeader().hide()
+        # Fixed row heights, so the view never measures rows it is not showing
+        self.results_view.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.results_view.selectionModel().currentRowChanged.connect(self.load_result_design)
+
+        self.results_layout.addLayout(self.results_controls)
+        self.results_layout.addWidget(self.results_view)
+
+    def open_results(self):
+        """Open a sweep results directory (or a sharded sweep directory) in the results table."""
+        path = QtWidgets.QFileDialog.getExistingDirectory(self.Results, "Open Results")
+        if not path:
+            return
+        try:
+            table = ResultsTable.open(path)
+        except Exception as e:
+            self.results_count.setText(f"Failed to open results: {e}")
+            return
+        table.set_valid_only(self.valid_checkbox.isChecked())
+        self.results_model.set_table(table)
+        header = self.results_view.horizontalHeader()  # Keep the sort the header shows
+        self.results_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+        self.filter_column.clear()
+        for name in table.names:
+            self.filter_column.addItem(COLUMNS[name][0], name)
+        self.update_results_count()
+
+    def apply_results_filter(self):
+        """Filter the results on the chosen column; empty bounds clear that column's filter."""
+        name = self.filter_column.currentData()
+        if name is None:
+            return
+        try:
+            low, high = (float(edit.text()) if edit.text().strip() else None
+                         for edit in (self.filter_min, self.filter_max))
+        except ValueError:
+            self.results_count.setText("Filter bounds must be numbers")
+            return
+        self.results_model.set_filter(name, low, high)
+        self.update_results_count()
+
+    def toggle_valid_results(self, checked):
+        self.results_model.set_valid_only(checked)
+        self.update_results_count()
+
+    def update_results_count(self):
+        table = self.results_model.table
+        self.results_count.setText(f"{len(table):,} of {table.n_rows:,} designs")
+
+    def load_result_design(self, current, previous=None):
+        """Load the selected design into the spec editor and redraw its plots."""
+        if not current.isValid():
+            return
+        try:
+            rocket_specs = self.results_model.table.design(current.row())
+        except Exception as e:
+            self.results_count.setText(f"Cannot load design: {e}")
+            return
+        with open(self.json_path, "w") as file:
+            json.dump(rocket_specs, file, indent=4)
+        self.set_editor_values(rocket_specs)
+        self.display_rocket_design()
+        self.plot_y_position()
+        self.refresh_preview()
+
+    def set_editor_values(self, rocket_specs):
+        """Show specs in the editor widgets without writing them back one field at a time."""
+        spinboxes = {
+            self.af_d_input: ("air_frame", "diameter"),
+            self.af_l_input: ("air_frame", "length"),
+            self.nc_l_input: ("nose_cone", "length"),
+            self.sweep_angle_input: ("fins", "sweep_angle"),
+            self.tip_chord_input: ("fins", "tip_chord"),
+            self.semi_span_input: ("fins", "semi_span"),
+            self.root_chord_input: ("fins", "root_chord"),
+        }
+        for spinbox, (section, key) in spinboxes.items():
+            spinbox.blockSignals(True)
+            spinbox.setValue(rocket_specs.get(section, {}).get(key, 0.0))
+            spinbox.blockSignals(False)
+
+        # List selections, where the specs match one of the presets
+        presets = {
+            self.nc_list: ("nose_cone", "shape", {"tangent ogive": "tangent_ogive", "elliptic": "elliptic",
+                                                  "conic": "conic"}),
+            self.material_list: ("material", "density", {"fiberglass": 1.8, "blue tube": 1.15}),
+            self.motor_list: ("motor", "thrust", {"g": 100, "h": 500, "i": 1000, "j": 1500, "k": 2000, "l": 4000}),
+            self.parachute_list: ("parachute", "area", {"small": 48, "medium": 72, "larger": 120}),
+        }
+        for list_widget, (section, key, values) in presets.items():
+            list_widget.clearSelection()
+            value = rocket_specs.get(section, {}).get(key)
+            for row in range(list_widget.count()):
+                if values[list_widget.item(row).text().lower()] == value:
+                    list_widget.setCurrentRow(row)
+                    break
+
     def setup_info_tab(self, screen_height, ):
         """ Sets up info tab based on json file"""
-        info_path = os.path.join(os.path.dirname(__file__), "src\\config\\info_content.json")
-        pictures_folder = os.path.join(os.path.dirname(__file__), "src\\pictures")
+        info_path = os.path.join(os.path.dirname(__file__), "src", "config", "info_content.json")
+        pictures_folder = os.path.join(os.path.dirname(__file__), "src", "pictures")
         
         # Create a scroll area
         scroll_area = QtWidgets.QScrollArea(self.Information)
@@ -555,10 +884,44 @@ class Ui_MainWindow(object):
 
 
 if __name__ == "__main__":
+    import argparse
+    import shutil
     import sys
-    app = QtWidgets.QApplication(sys.argv)
-    MainWindow = QtWidgets.QMainWindow()
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Rocket design GUI.")
+    parser.add_argument("--trace-latency", metavar="SCRIPT",
+                        help="Record input-to-paint latencies, save the session as a replay script and print them on exit")
+    parser.add_argument("--replay", metavar="SCRIPT",
+                        help="Replay a recorded script offscreen and print its latency percentiles")
+    parser.add_argument("--repeat", type=int, default=1, help="Times to run the replay script")
+    parser.add_argument("--delays", action="store_true", help="Keep the recorded pauses between replayed steps")
+    args, qt_args = parser.parse_known_args()
+
+    if args.replay:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+    tracing = args.trace_latency or args.replay
+    MainWindow = TracedMainWindow() if tracing else QtWidgets.QMainWindow()
     ui = Ui_MainWindow()
     ui.setupUi(MainWindow)
+    tracer = ui.enable_latency_trace(MainWindow) if tracing else None
     MainWindow.show()
-    sys.exit(app.exec_())
+
+    if args.replay:
+        # Edits go to a scratch copy, leaving the real specs file untouched
+        scratch = tempfile.mkdtemp()
+        ui.json_path = shutil.copy(ui.json_path, os.path.join(scratch, "rocket_specs.json"))
+        steps = load_script(args.replay)
+        for _ in range(args.repeat):
+            replay(tracer, ui, steps, delays=args.delays)
+        ui.live_preview.shutdown()
+        print(tracer.format_summary())
+        shutil.rmtree(scratch)
+        sys.exit(0)
+
+    status = app.exec_()
+    if tracer is not None:
+        tracer.save_script(args.trace_latency)
+        print(tracer.format_summary())
+    sys.exit(status)
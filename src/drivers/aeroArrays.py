@@ -0,0 +1,173 @@
+import numpy as np
+from src.drivers.rocketSpec import GRAM, INCH, MILLIMETER, SQUARE_INCH, RocketSpec, field_column
+
+# Spec fields the aerodynamic calculations read: attribute name -> (section, key)
+FIELDS = {
+    "motor_mass": ("motor", "mass"),
+    "motor_length": ("motor", "length"),
+    "motor_diameter": ("motor", "diameter"),
+    "fin_tip_chord": ("fins", "tip_chord"),
+    "fin_semi_span": ("fins", "semi_span"),
+    "fin_root_chord": ("fins", "root_chord"),
+    "airframe_diameter": ("air_frame", "diameter"),
+    "airframe_length": ("air_frame", "length"),
+    "nose_cone_length": ("nose_cone", "length"),
+    "parachute_cd": ("parachute", "cd"),
+    "parachute_mass": ("parachute", "mass"),
+    "parachute_area": ("parachute", "area"),
+    "material_density": ("material", "density"),
+    "material_thickness": ("material", "thickness"),
+}
+
+
+class AeroArrays:
+    """
+    Struct-of-arrays AeroCalcs for screening many designs at once.
+
+    Every spec field is a NumPy column over N designs (SI units, as in
+    RocketSpec), and each method evaluates all N designs in one vectorized pass.
+    These are the model's only mass, CG, CP, drag and parachute formulas:
+    AeroCalcs evaluates a single design through them.
+    """
+
+    def __init__(self, columns):
+        missing = [name for name in FIELDS if name not in columns]
+        if missing:
+            raise ValueError(f"Missing design columns: {', '.join(missing)}.")
+        for name in FIELDS:
+            setattr(self, name, np.asarray(columns[name], dtype=float))
+        lengths = {getattr(self, name).shape for name in FIELDS}
+        if len(lengths) != 1 or len(next(iter(lengths))) != 1:
+            raise ValueError("All design columns must be 1-D arrays of the same length.")
+        self.n_designs = len(self.airframe_diameter)
+        self.specs = None  # Compiled RocketSpecs, when built from_specs
+
+    @classmethod
+    def from_specs(cls, rocket_specs_list):
+        """Build the columns from spec dicts or compiled RocketSpecs."""
+        specs = [s if isinstance(s, RocketSpec) else RocketSpec.from_dict(s) for s in rocket_specs_list]
+        arrays = cls({name: [getattr(getattr(s, section), key) for s in specs]
+                      for name, (section, key) in FIELDS.items()})
+        arrays.specs = specs
+        return arrays
+
+    @classmethod
+    def from_json_columns(cls, columns):
+        """
+        Build from columns in rocket_specs.json units (inches, mm, g, ...), keyed like FIELDS.
+
+        The columns are checked like RocketSpec checks a single design: values
+        must be finite and positive (fin tip chords may be zero) and the wall
+        thinner than the airframe radius, or ValueError names the first bad design.
+        """
+        arrays = cls({name: field_column(*FIELDS[name], columns[name]) for name in FIELDS if name in columns})
+        thick = arrays.material_thickness >= arrays.airframe_diameter / 2
+        if thick.any():
+            raise ValueError(f"material.thickness must be smaller than the airframe radius; "
+                             f"design {int(np.argmax(thick))} is not.")
+        return arrays
+
+    def frontal_area(self):
+        """Frontal area in m² of every design."""
+        return np.pi * (self.airframe_diameter / 2) ** 2
+
+    def component_masses(self):
+        """Mass (kg) and center position (m from the aft end) of every component of every design."""
+        radius = self.airframe_diameter / 2
+        thickness = self.material_thickness
+        density = self.material_density
+
+        # Masses in kg
+        airframe_volume = np.pi * (radius ** 2 - (radius - thickness) ** 2) * self.airframe_length
+        airframe_mass = airframe_volume * density
+        nose_cone_volume = (1 / 3) * np.pi * radius ** 2 * self.nose_cone_length
+        nose_cone_mass = nose_cone_volume * density * (thickness / radius)
+        # The model reads the fin planform area in square inches as if it were in cm²
+        fin_area = self.fin_root_chord * self.fin_semi_span / SQUARE_INCH * 1e-4
+        fin_mass = 3 * fin_area * thickness * density
+
+        # Center positions in m from the aft end
+        cg_airframe = self.airframe_length / 2
+        cg_nose_cone = self.airframe_length + self.nose_cone_length / 3
+        cg_fins = self.fin_root_chord / 2
+        cg_motor = self.motor_length / 2
+        cg_parachute = self.airframe_length + self.nose_cone_length
+
+        return {
+            "airframe": (airframe_mass, cg_airframe),
+            "nose_cone": (nose_cone_mass, cg_nose_cone),
+            "fins": (fin_mass, cg_fins),
+            "motor": (self.motor_mass, cg_motor),
+            "parachute": (self.parachute_mass, cg_parachute),
+        }
+
+    def calculate_center_of_gravity(self):
+        """CG in inches of every design."""
+        components = self.component_masses()
+        total_mass = sum(mass for mass, _ in components.values())
+        cg = sum(mass * position for mass, position in components.values()) / total_mass
+        return cg / INCH
+
+    def calculate_center_of_pressure(self):
+        """CP in inches of every design."""
+        nose_length = self.nose_cone_length / INCH
+        body_length = self.airframe_length / INCH
+        root_chord = self.fin_root_chord / INCH
+        tip_chord = self.fin_tip_chord / INCH
+        semi_span = self.fin_semi_span / INCH
+
+        fin_area = (root_chord + tip_chord) / 2 * semi_span
+        cp_nose = body_length + (nose_length * 0.5)
+        cp_body = body_length * 0.5
+        cp_fins = ((root_chord - tip_chord) / 2) * fin_area
+        return (cp_nose + cp_body + cp_fins) / (1 + fin_area)
+
+    def calculate_static_margin(self):
+        """Static margin in calibers of every design."""
+        cg = self.calculate_center_of_gravity()
+        cp = self.calculate_center_of_pressure()
+        return (cg - cp) / (self.airframe_diameter / INCH)
+
+    def calculate_drag_coefficient(self):
+        """Barrowman drag coefficient of every design."""
+        nose_cone_cd, fin_cd, base_cd = self.drag_components()
+        return nose_cone_cd + fin_cd + base_cd
+
+    def drag_components(self):
+        """Nose cone, fin and base terms of the Barrowman drag coefficient of every design."""
+        airframe_diameter = self.airframe_diameter
+        nose_cone_cd = 0.5 * (self.nose_cone_length / airframe_diameter)
+        fin_cd = (
+            2 * self.fin_semi_span ** 2 / (airframe_diameter * self.fin_root_chord) *
+            (1 + np.sqrt(1 + (self.fin_semi_span / self.fin_root_chord) ** 2))
+        )
+        # The model compares the airframe diameter in inches with the motor diameter in mm
+        base_cd = 0.029 * (airframe_diameter / INCH) / (self.motor_diameter / MILLIMETER)
+        return nose_cone_cd, fin_cd, base_cd
+
+    def chute_coefficient(self):
+        """Parachute descent-rate coefficient of every design (v_t = coefficient / sqrt(rho))."""
+        return np.sqrt(2 * (self.parachute_mass / GRAM) * 9.81
+                       / (self.parachute_cd * self.parachute_area / SQUARE_INCH))
+
+
+if __name__ == "__main__":
+    import json
+    import time
+
+    with open("../config/rocket_specs.json", "r") as file:
+        rocket_specs = json.load(file)
+
+    # Score a million random geometry variations of the default design
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    columns = {name: np.full(n, rocket_specs[section][key], dtype=float) for name, (section, key) in FIELDS.items()}
+    for name in ("airframe_length", "nose_cone_length", "fin_root_chord", "fin_semi_span", "fin_tip_chord"):
+        columns[name] *= rng.uniform(0.5, 1.5, n)
+
+    start = time.perf_counter()
+    designs = AeroArrays.from_json_columns(columns)
+    margin = designs.calculate_static_margin()
+    cd = designs.calculate_drag_coefficient()
+    print(f"Scored {n} designs in {time.perf_counter() - start:.2f} s")
+    print(f"{np.count_nonzero((margin > 1) & (margin < 2))} have a static margin between 1 and 2 calibers")
@@ -1,118 +1,57 @@
 import numpy as np
+from src.drivers.aeroArrays import AeroArrays
+from src.drivers.atmosphere import air_density
+from src.drivers.dragTable import DragTable
+from src.drivers.rocketSpec import GRAM_PER_CM3, RocketSpec
 
 class AeroCalcs:
-    def __init__(self, rocket_specs): # change later
-        self.rocket_specs = rocket_specs
-
-        # Load airframe, nose cone, fins, materials, and motor details
-        self.airframe = self.rocket_specs["air_frame"]
-        self.nose_cone = self.rocket_specs["nose_cone"]
-        self.fins = self.rocket_specs["fins"]
-        self.motor = self.rocket_specs["motor"]
-        self.parachute = self.rocket_specs["parachute"]
-        self.material = self.rocket_specs["material"]
-
-        # Material properties
-        self.density = self.material["density"] 
-        self.thickness = self.material["thickness"] / 10  # Convert mm to cm for calculations
+    def __init__(self, rocket_specs):
+        # Accept a compiled RocketSpec or a raw specs dict, which is compiled (and validated) once here
+        self.spec = rocket_specs if isinstance(rocket_specs, RocketSpec) else RocketSpec.from_dict(rocket_specs)
+        # The formulas live in AeroArrays; this is its one-design case
+        self.arrays = AeroArrays.from_specs([self.spec])
+
+        # Constants of the flight model, computed once instead of on every call
+        self.frontal_area = float(self.arrays.frontal_area()[0])  # m²
+        self.drag_coefficient = float(self.arrays.calculate_drag_coefficient()[0])
+        # Parachute terms in the model's legacy units (g, in², g/cm³): v_t = coefficient / sqrt(rho)
+        self.chute_coefficient = float(self.arrays.chute_coefficient()[0])
+        self.drag_table = None  # Built on first Mach-dependent drag lookup
 
     def calculate_air_density(self, altitude):
         """Calculate air density at a given altitude in g/cm³."""
-        if altitude <= 11000:  # Troposphere
-            temp = 288.15 - 0.0065 * altitude  # Temperature in Kelvin
-            pressure = 101325 * (temp / 288.15) ** 5.2561  # Pressure in Pascals
-        else:  # Above troposphere, simplified model
-            temp = 216.65  # Temperature constant in Kelvin
-            pressure = 22632 * np.exp(-0.0001577 * (altitude - 11000))  # Pressure in Pascals
-
-        density_kg_m3 = pressure / (287.05 * temp)  # Air density in kg/m³
-        density_g_cm3 = density_kg_m3 / 1000  # Convert to g/cm³
-        return density_g_cm3
+        return air_density(altitude)
 
     def calculate_center_of_gravity(self):
         """Calculate the center of gravity (CG) in inches."""
-        airframe_diameter = self.airframe["diameter"] * 2.54  # Inches to cm
-        airframe_length = self.airframe["length"] * 2.54  # Inches to cm
-        nose_cone_length = self.nose_cone["length"] * 2.54  # Inches to cm
-        motor_length = self.motor["length"] / 10  # mm to cm
-        motor_mass = self.motor["mass"]  # Already in grams
-
-        # Calculate masses
-        airframe_volume = np.pi * ((airframe_diameter / 2) ** 2 - ((airframe_diameter / 2) - self.thickness) ** 2) * airframe_length
-        airframe_mass = airframe_volume * self.density
-        nose_cone_volume = (1 / 3) * np.pi * (airframe_diameter / 2) ** 2 * nose_cone_length
-        nose_cone_mass = nose_cone_volume * self.density * (self.thickness / (airframe_diameter / 2))
-        fin_area = self.fins["root_chord"] * self.fins["semi_span"]
-        fin_mass = 3 * fin_area * self.thickness * self.density
-        parachute_mass = self.parachute["mass"]
-
-        # Center positions in cm
-        cg_airframe = airframe_length / 2
-        cg_nose_cone = airframe_length + nose_cone_length / 3
-        cg_fins = self.fins["root_chord"] / 2 * 2.54
-        cg_motor = motor_length / 2
-        cg_parachute = airframe_length + nose_cone_length
-
-        total_mass = airframe_mass + nose_cone_mass + fin_mass + motor_mass + parachute_mass
-        cg_cm = (
-            (airframe_mass * cg_airframe) +
-            (nose_cone_mass * cg_nose_cone) +
-            (fin_mass * cg_fins) +
-            (motor_mass * cg_motor) +
-            (parachute_mass * cg_parachute)
-        ) / total_mass
-
-        return cg_cm / 2.54  # Convert CG to inches
+        return float(self.arrays.calculate_center_of_gravity()[0])
 
     def calculate_center_of_pressure(self):
         """Calculate the center of pressure (CP) in inches."""
+        return float(self.arrays.calculate_center_of_pressure()[0])
 
-        # Dimensions in inches
-        nose_length = self.nose_cone["length"]
-        body_length = self.airframe["length"]
-        root_chord = self.fins["root_chord"]
-        tip_chord = self.fins["tip_chord"]
-        semi_span = self.fins["semi_span"]
-
-        # Fin area
-        fin_area = (root_chord + tip_chord) / 2 * semi_span
-
-        # CP components
-        cp_nose = body_length + (nose_length * 0.5)
-        cp_body = body_length * 0.5
-        cp_fins = ((root_chord - tip_chord) / 2) * fin_area
+    def calculate_static_margin(self):
+        """Calculate the static margin in calibers (positive when CP is aft of CG)."""
+        return float(self.arrays.calculate_static_margin()[0])
 
-        # Total CP
-        cp_total = (cp_nose + cp_body + cp_fins) / (1 + fin_area)
-        
+    def calculate_drag_coefficient(self, altitude, mach=None):
+        """
+        Calculate the drag coefficient (Cd) using Barrowman's model.
 
-        return cp_total
-
-    def calculate_drag_coefficient(self, altitude):
-        """Calculate the drag coefficient (Cd) using Barrowman's model."""
-        airframe_diameter = self.airframe["diameter"]
-        nose_cone_cd = 0.5 * (self.nose_cone["length"] / airframe_diameter)
-        fin_cd = (
-            2 * self.fins["semi_span"] ** 2 / (airframe_diameter * self.fins["root_chord"]) *
-            (1 + np.sqrt(1 + (self.fins["semi_span"] / self.fins["root_chord"]) ** 2))
-        )
-        base_cd = 0.029 * (airframe_diameter / self.motor["diameter"])
-        total_cd = nose_cone_cd + fin_cd + base_cd
-        return total_cd
+        Without a Mach number this is the constant low-speed value used by the
+        default flight model; with one it is read from the design's DragTable.
+        """
+        if mach is None:
+            return self.drag_coefficient
+        if self.drag_table is None:
+            self.drag_table = DragTable(self.spec)
+        return self.drag_table.lookup(mach, altitude)
 
     def calculate_drag_force(self, altitude, velocity):
-        """Calculate drag force at a given altitude and velocity."""
-        cd = self.calculate_drag_coefficient(altitude)
-        air_density = self.calculate_air_density(altitude)
-        frontal_area = np.pi * (self.airframe["diameter"] * 2.54 / 2) ** 2  # cm²
-        drag_force = 0.5 * cd * air_density * frontal_area * (velocity * 100) ** 2  # Velocity in cm/s
-        return drag_force / 300  # Convert drag force to N
-    
+        """Calculate drag force in N at a given altitude (m) and velocity (m/s)."""
+        air_density = self.calculate_air_density(altitude) * GRAM_PER_CM3  # kg/m³
+        return 0.5 * self.drag_coefficient * air_density * self.frontal_area * velocity ** 2
+
     def calculate_v_terminal_parachute(self, altitude):
-        chute_cd = self.parachute["cd"]
-        chute_mass = self.parachute["mass"]
-        chute_area = self.parachute["area"]
-        air_density = self.calculate_air_density(altitude)
-        g = 9.81
-        chute_vt = np.sqrt((2* chute_mass *g )/(chute_cd * air_density * chute_area))
-        return chute_vt
+        """Calculate the descent rate under the parachute at a given altitude."""
+        return self.chute_coefficient / np.sqrt(self.calculate_air_density(altitude))
@@ -0,0 +1,59 @@
+import math
+import numpy as np
+
+# The flight model's atmosphere: a standard troposphere with a simplified isothermal layer above it
+TROPOPAUSE = 11000  # m
+SEA_LEVEL_TEMPERATURE = 288.15  # K
+LAPSE_RATE = 0.0065  # K/m
+SEA_LEVEL_PRESSURE = 101325  # Pa
+PRESSURE_EXPONENT = 5.2561
+TROPOPAUSE_TEMPERATURE = 216.65  # K
+TROPOPAUSE_PRESSURE = 22632  # Pa
+PRESSURE_DECAY = 0.0001577  # 1/m, above the tropopause
+GAS_CONSTANT = 287.05  # J/(kg K), dry air
+GAMMA_GAS_CONSTANT = 401.8735  # gamma * R, for the speed of sound
+
+
+def atmosphere(altitude):
+    """Temperature (K) and density (kg/m³) at altitudes (m); works on arrays."""
+    altitude = np.asarray(altitude, dtype=float)
+    troposphere = altitude <= TROPOPAUSE
+    temp = np.where(troposphere, SEA_LEVEL_TEMPERATURE - LAPSE_RATE * np.minimum(altitude, TROPOPAUSE),
+                    TROPOPAUSE_TEMPERATURE)
+    pressure = np.where(
+        troposphere,
+        SEA_LEVEL_PRESSURE * (temp / SEA_LEVEL_TEMPERATURE) ** PRESSURE_EXPONENT,
+        TROPOPAUSE_PRESSURE * np.exp(-PRESSURE_DECAY * (np.maximum(altitude, TROPOPAUSE) - TROPOPAUSE)),
+    )
+    return temp, pressure / (GAS_CONSTANT * temp)
+
+
+def air_density_array(altitude):
+    """Air density in the model's g/cm³ at altitudes (m); works on arrays."""
+    return atmosphere(altitude)[1] / 1000
+
+
+def speed_of_sound_array(altitude):
+    """Speed of sound in m/s at altitudes (m); works on arrays."""
+    return np.sqrt(GAMMA_GAS_CONSTANT * atmosphere(altitude)[0])
+
+
+# Scalar versions of the same model for the per-step PhysCalcs right-hand side, where NumPy's
+# per-call overhead on a single value costs about 40 times the arithmetic
+def _temperature(altitude):
+    return SEA_LEVEL_TEMPERATURE - LAPSE_RATE * altitude if altitude <= TROPOPAUSE else TROPOPAUSE_TEMPERATURE
+
+
+def air_density(altitude):
+    """Air density in the model's g/cm³ at a scalar altitude (m)."""
+    temp = _temperature(altitude)
+    if altitude <= TROPOPAUSE:
+        pressure = SEA_LEVEL_PRESSURE * (temp / SEA_LEVEL_TEMPERATURE) ** PRESSURE_EXPONENT
+    else:
+        pressure = TROPOPAUSE_PRESSURE * math.exp(-PRESSURE_DECAY * (altitude - TROPOPAUSE))
+    return pressure / (GAS_CONSTANT * temp) / 1000
+
+
+def speed_of_sound(altitude):
+    """Speed of sound in m/s at a scalar altitude (m)."""
+    return math.sqrt(GAMMA_GAS_CONSTANT * _temperature(altitude))
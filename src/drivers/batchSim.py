@@ -0,0 +1,230 @@
+import numpy as np
+from scipy.integrate import RK45, solve_ivp
+from src.drivers.aeroArrays import AeroArrays
+from src.drivers.atmosphere import air_density_array, speed_of_sound_array
+from src.drivers.dragTable import DragTable
+from src.drivers.massProperties import MassPropertiesTable
+from src.drivers.outputPolicy import OutputPolicy, StreamingSummary, crossing_fraction, parabolic_peak
+from src.drivers.physCalcs import GRAVITY, GROUND_LEVEL
+from src.drivers.windBank import WindProfiles
+
+
+class BatchPhysCalcs:
+    """
+    Integrate many rocket designs together with one vectorized right-hand side.
+
+    Uses the same flight model as PhysCalcs, but every design is a column of a
+    (5, N) state array so a whole batch costs one solve_ivp call instead of N.
+    """
+
+    def __init__(self, rocket_specs_list, drag_table=False, mass_table=False, wind_bank=None, wind_profiles=None):
+        self.rocket_specs_list = list(rocket_specs_list)
+        self.n_designs = len(self.rocket_specs_list)
+        if self.n_designs == 0:
+            raise ValueError("At least one rocket design is required.")
+
+        # Compile (and validate) every design up front; RocketSpec objects are used as they are
+        aero = AeroArrays.from_specs(self.rocket_specs_list)
+        self.specs = aero.specs
+        motors = [spec.motor for spec in self.specs]
+
+        # Per-design constants, evaluated once instead of on every RHS call
+        self.drag_constant = 0.5 * aero.calculate_drag_coefficient() * aero.frontal_area()  # m²
+        self.burn_time = np.array([m.burn_time for m in motors])
+        self.thrust = np.array([m.thrust for m in motors])
+        self.mass_loss_rate = np.array([m.mass / m.burn_time for m in motors])  # kg/s
+        self.initial_mass = aero.calculate_center_of_gravity() + aero.motor_mass
+
+        # Parachute descent rate is chute_coefficient / sqrt(rho)
+        self.chute_coefficient = aero.chute_coefficient()
+
+        # Optional Cd(Mach, altitude) tables in place of the constant drag coefficients
+        self.drag_table = DragTable(self.specs) if drag_table else None
+        self.half_frontal_area = 0.5 * aero.frontal_area()  # m²
+
+        # Optional mass properties from the component masses, as in PhysCalcs
+        self.mass_table = MassPropertiesTable(self.specs) if mass_table else None
+        if self.mass_table is not None:
+            self.initial_mass = self.mass_table.mass[:, 0]
+            self.mass_loss_rate = self.mass_table.mass_flow
+
+        # Wind profiles as in PhysCalcs; wind_profiles holds one bank index per design
+        if wind_bank is not None:
+            if wind_profiles is None or len(wind_profiles) != self.n_designs:
+                raise ValueError("wind_profiles must give one wind bank index per design.")
+            self.wind = wind_bank.select(wind_profiles)
+        elif any(spec.launch_conditions.wind for spec in self.specs):
+            self.wind = WindProfiles.from_specs(self.specs)
+        else:
+            self.wind = None
+
+    @classmethod
+    def from_phys_calcs(cls, phys_calcs):
+        """Single-design batch with the same drag table, mass table and wind as a PhysCalcs."""
+        batch = cls([phys_calcs.spec], mass_table=phys_calcs.mass_table is not None)
+        batch.drag_table = phys_calcs.drag_table
+        batch.wind = phys_calcs.wind
+        return batch
+
+    @staticmethod
+    def calculate_air_density(altitude):
+        """Vectorized AeroCalcs.calculate_air_density, in g/cm³."""
+        return air_density_array(altitude)
+
+    def calculate_v_terminal_parachute(self, altitude):
+        """Vectorized AeroCalcs.calculate_v_terminal_parachute for (N, T) altitudes."""
+        return self.chute_coefficient[:, None] / np.sqrt(self.calculate_air_density(altitude))
+
+    def dynamics(self, t, state):
+        """
+        Compute the dynamics of every design; state is the flattened (5, N) array.
+
+        A single-design batch also takes a flattened (5, T) array of states at the
+        times t (T,), evaluating a whole trajectory in one call.
+        """
+        x, y_pos, vx, vy, mass = state.reshape(5, -1)
+        if self.mass_table is not None:
+            mass = self.mass_table.mass_array(t)
+
+        # Drag and thrust act along the velocity relative to the air
+        vx_air = vx - self.wind.lookup_array(y_pos) if self.wind is not None else vx
+
+        velocity = np.sqrt(vx_air**2 + vy**2)
+        moving = velocity > 0
+        safe_velocity = np.where(moving, velocity, 1.0)
+        ux = np.where(moving, vx_air / safe_velocity, 0.0)
+        uy = np.where(moving, vy / safe_velocity, 0.0)
+
+        # Drag and gravity
+        rho = self.calculate_air_density(y_pos)
+        if self.drag_table is not None:
+            cd = self.drag_table.lookup_array(velocity / speed_of_sound_array(y_pos), y_pos)
+            drag = self.half_frontal_area * cd * rho * velocity**2
+        else:
+            drag = self.drag_constant * rho * velocity**2
+        drag_x = -drag * ux
+        drag_y = -drag * uy - mass * GRAVITY
+
+        # Thrust and mass loss during burn
+        burning = t <= self.burn_time
+        current_thrust = np.where(burning, self.thrust, 0.0)
+        ax = (current_thrust * ux + drag_x) / mass
+        ay = (current_thrust * uy + drag_y) / mass
+        dm_dt = np.where(burning, -self.mass_loss_rate, 0.0)
+
+        derivatives = np.stack([vx, vy, ax, ay, dm_dt])
+        # Designs that reached the ground stop evolving
+        derivatives[:, y_pos <= 0] = 0
+        return derivatives.ravel()
+
+    def simulate(self, t_span=(0, 100), max_step=0.1, output="full"):
+        """
+        Simulate every design in one integration.
+
+        Returns the shared time vector (T,) and x, y, vx, vy arrays of shape (N, T),
+        post-processed for the parachute descent exactly like PhysCalcs.simulate.
+        output is an OutputPolicy or its name: "full" keeps every step, "fixed"
+        and "adaptive" resample them, and "summary" returns only the summarize()
+        dict, reduced step by step without storing the trajectories.
+        """
+        policy = OutputPolicy.coerce(output)
+        initial_state = np.zeros((5, self.n_designs))
+        initial_state[0] = 1  # x
+        initial_state[1] = 1  # y
+        initial_state[2] = 1  # vx
+        initial_state[3] = 100  # vy
+        initial_state[4] = self.initial_mass
+
+        if policy.kind == "summary":
+            return self._simulate_summary(t_span, initial_state.ravel(), max_step)
+
+        result = solve_ivp(self.dynamics, t_span, initial_state.ravel(), max_step=max_step,
+                           t_eval=policy.t_eval(t_span))
+        t = result.t
+        x, y, vx, vy, mass = result.y.reshape(5, self.n_designs, -1)
+        self.mass = mass  # (N, T) mass history, kept for callers that record it
+        if self.mass_table is not None:
+            self.mass = self.mass_table.history(t)
+        vy = vy.copy()
+
+        # Descent under parachute after apogee, zero vertical speed on the ground
+        time_apogee = t[np.argmax(y, axis=1)]
+        after_apogee = t[None, :] > time_apogee[:, None]
+        vy = np.where(after_apogee, self.calculate_v_terminal_parachute(y), vy)
+        vy[y <= GROUND_LEVEL] = 0
+
+        keep = policy.select(t, x, y)
+        self.mass = self.mass[:, keep]
+        return t[keep], x[:, keep], y[:, keep], vx[:, keep], vy[:, keep]
+
+    def _simulate_summary(self, t_span, initial_state, max_step):
+        """Step the same solver as solve_ivp, reducing each step into a StreamingSummary."""
+        chute_speed = lambda altitude: self.chute_coefficient / np.sqrt(self.calculate_air_density(altitude))
+        summary = StreamingSummary(self.n_designs, chute_speed, GROUND_LEVEL)
+        solver = RK45(self.dynamics, t_span[0], initial_state, t_span[1], max_step=max_step)
+        summary.update(solver.t, *solver.y.reshape(5, self.n_designs)[:4])
+        while solver.status == "running":
+            message = solver.step()
+            if solver.status == "failed":
+                raise RuntimeError(message)
+            summary.update(solver.t, *solver.y.reshape(5, self.n_designs)[:4])
+        self.mass = None
+        return summary.result()
+
+    @staticmethod
+    def summarize(t, y, vx=None, vy=None, x=None):
+        """
+        Compute apogee (m) and flight time (s) for each row of an (N, T) altitude array.
+
+        The apogee is refined with a parabola through the three samples around the
+        maximum and the landing time is interpolated at GROUND_LEVEL, so both vary
+        smoothly with the design parameters instead of jumping between solver steps.
+        When the velocity components are given, the peak speed is reported as well,
+        and when x is given, so is the downrange landing position.
+        """
+        y = np.atleast_2d(y)
+        rows = np.arange(y.shape[0])
+        peak, first, has_landed = BatchPhysCalcs.flight_steps(y)
+
+        # Parabolic refinement of the maximum
+        apogee = parabolic_peak(t[peak - 1], t[peak], t[peak + 1],
+                                y[rows, peak - 1], y[rows, peak], y[rows, peak + 1])
+
+        # First ground crossing after apogee, linearly interpolated
+        prev = np.maximum(first - 1, 0)
+        frac = crossing_fraction(y[rows, prev], y[rows, first], GROUND_LEVEL, has_landed)
+        flight_time = t[prev] + frac * (t[first] - t[prev])
+
+        summary = {"apogee": apogee, "flight_time": flight_time}
+        if vx is not None and vy is not None:
+            summary["max_velocity"] = np.sqrt(np.atleast_2d(vx) ** 2 + np.atleast_2d(vy) ** 2).max(axis=1)
+        if x is not None:
+            x = np.atleast_2d(x)
+            summary["landing_x"] = x[rows, prev] + frac * (x[rows, first] - x[rows, prev])
+        return summary
+
+    @staticmethod
+    def flight_steps(y):
+        """
+        Steps bracketing the apogee and landing of each row of an (N, T) altitude array.
+
+        Returns the highest step (kept off the array's ends, so it has a step on
+        either side), the first step at or below GROUND_LEVEL after it (the last
+        step if the design never landed) and whether it landed.
+        """
+        y = np.atleast_2d(y)
+        peak = np.clip(np.argmax(y, axis=1), 1, y.shape[1] - 2)
+        landed = (y <= GROUND_LEVEL) & (np.arange(y.shape[1])[None, :] > peak[:, None])
+        has_landed = landed.any(axis=1)
+        first = np.where(has_landed, np.argmax(landed, axis=1), y.shape[1] - 1)
+        return peak, first, has_landed
+
+
+def simulate_summaries(rocket_specs_list, chunk_size=256, max_step=0.1):
+    """Simulate any number of designs in batches and return their summary arrays."""
+    rocket_specs_list = list(rocket_specs_list)
+    chunks = []
+    for start in range(0, len(rocket_specs_list), chunk_size):
+        batch = BatchPhysCalcs(rocket_specs_list[start:start + chunk_size])
+        chunks.append(batch.simulate(max_step=max_step, output="summary"))
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
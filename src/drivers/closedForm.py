@@ -0,0 +1,193 @@
+import numpy as np
+from src.drivers.aeroArrays import AeroArrays
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.physCalcs import GRAVITY
+from src.drivers.rocketSpec import field_column
+
+# Launch state of the flight model: altitude (m) and vertical speed (m/s), as in PhysCalcs.simulate
+LAUNCH_ALTITUDE = 1.0
+LAUNCH_VELOCITY = 100.0
+DENSITY_ITERATIONS = 3  # Passes refining each phase's air density from the previous pass' flight
+DENSITY_NODES = 8  # Gauss-Legendre nodes of each phase's mean air density
+
+# Largest relative errors against the integrator (BatchPhysCalcs, max_step 0.1) over SCREENING_RANGE,
+# checked by the tests; outside that range they are not guaranteed
+APOGEE_ERROR = 0.03
+TIME_ERROR = 0.02
+
+# (section, key, low, high) of the parameter ranges the error bounds are checked over
+SCREENING_RANGE = [
+    ("motor", "thrust", 100.0, 4000.0),
+    ("motor", "burn_time", 2.5, 3.75),
+    ("air_frame", "diameter", 2.0, 8.0),
+    ("air_frame", "length", 20.0, 100.0),
+]
+
+
+def _mean_density(base, height, start_speed, end_speed):
+    """
+    Drag-weighted mean air density (g/cm³) over a climb of `height` from `base`.
+
+    The speed squared is taken as linear in height between its start and end
+    values (exact without drag), so the mean weights each altitude's density
+    by the v² the drag sees there.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(DENSITY_NODES)
+    share = (nodes + 1) / 2  # (K,) points along the climb
+    speed_squared = start_speed[:, None] ** 2 + (end_speed[:, None] ** 2 - start_speed[:, None] ** 2) * share
+    density = BatchPhysCalcs.calculate_air_density(base[:, None] + height[:, None] * share)
+    total = speed_squared @ weights
+    # A phase flown at no speed (a stalled climb) has no drag to weight; take the density at its base
+    return np.where(total > 0, (density * speed_squared) @ weights / np.where(total > 0, total, 1.0), density[:, 0])
+
+
+def _powered_flight(velocity, force, drag, mass, duration):
+    """
+    Closed-form vertical flight under a constant net force plus quadratic drag.
+
+    Solves m dv/dt = force - drag v² from upward speed `velocity` for up to
+    `duration` seconds, stopping early where v reaches zero. Returns the final
+    speed, the height gained and the time flown. Every argument is an (N,) array.
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Accelerating (force > 0): v approaches the terminal speed q from below (tanh) or above (coth)
+        q = np.sqrt(np.abs(force) / drag)
+        rate = drag * q / mass
+        below = velocity < q
+        phase = np.where(below, np.arctanh(np.minimum(velocity / q, 1 - 1e-12)),
+                         np.arctanh(np.minimum(q / velocity, 1 - 1e-12)))
+        end = phase + rate * duration
+        up_speed = np.where(below, q * np.tanh(end), q / np.tanh(end))
+        # ln(cosh(end) / cosh(phase)) and ln(sinh(end) / sinh(phase)) without overflow
+        up_height = (mass / drag) * np.where(
+            below,
+            end - phase + np.log1p(np.exp(-2 * end)) - np.log1p(np.exp(-2 * phase)),
+            end - phase + np.log(-np.expm1(-2 * end)) - np.log(-np.expm1(-2 * phase)),
+        )
+
+        # Decelerating (force < 0): v = q tan(phase - rate t) until it reaches zero
+        phase_down = np.arctan(velocity / q)
+        stop = np.minimum(duration, phase_down / rate)
+        end_down = phase_down - rate * stop
+        down_speed = q * np.tan(end_down)
+        down_height = (mass / drag) * np.log(np.cos(end_down) / np.cos(phase_down))
+
+    accelerating = force > 0
+    speed = np.where(accelerating, up_speed, down_speed)
+    height = np.where(accelerating, up_height, down_height)
+    time = np.where(accelerating, duration, stop)
+    return speed, height, time
+
+
+class ClosedFormApogee:
+    """
+    Instant apogee estimates from the classic boost/coast solutions with quadratic drag.
+
+    Each design flies straight up from the launch state of PhysCalcs with the
+    same drag (0.5 Cd A rho v², rho in the model's g/cm³), gravity and legacy
+    initial mass. During the burn the thrust, the mean burn mass and the drag are
+    constant, which gives v(t) in tanh form; the coast to apogee then has the
+    arctan solution. Air density is held constant within each phase at its
+    drag-weighted mean over the altitudes the previous pass flew through,
+    refined over DENSITY_ITERATIONS passes.
+
+    All designs are evaluated together in a few array operations, so an estimate
+    costs microseconds per design. Wind and the small horizontal launch velocity
+    are ignored. The errors against the integrator stay within APOGEE_ERROR and
+    TIME_ERROR over SCREENING_RANGE, about half of it the integrator's own: its
+    step across burnout keeps thrusting for part of a step. Use the full
+    simulation for final answers.
+    """
+
+    def __init__(self, aero, thrust, burn_time):
+        self.aero = aero
+        self.thrust = np.asarray(thrust, dtype=float)
+        self.burn_time = np.asarray(burn_time, dtype=float)
+        self.drag_constant = 0.5 * aero.calculate_drag_coefficient() * aero.frontal_area()  # m²
+        initial_mass = aero.calculate_center_of_gravity() + aero.motor_mass
+        self.boost_mass = initial_mass - aero.motor_mass / 2  # Mean mass over the burn
+        self.coast_mass = initial_mass - aero.motor_mass
+
+    @classmethod
+    def from_specs(cls, rocket_specs_list):
+        """Estimator for spec dicts or compiled RocketSpecs."""
+        aero = AeroArrays.from_specs(rocket_specs_list)
+        return cls(aero, [s.motor.thrust for s in aero.specs], [s.motor.burn_time for s in aero.specs])
+
+    @classmethod
+    def from_json_columns(cls, columns):
+        """
+        Estimator for columns in rocket_specs.json units, keyed like AeroArrays' FIELDS plus thrust and burn_time.
+
+        Bad values raise ValueError, as in AeroArrays.from_json_columns.
+        """
+        return cls(AeroArrays.from_json_columns(columns), field_column("motor", "thrust", columns["thrust"]),
+                   field_column("motor", "burn_time", columns["burn_time"]))
+
+    def estimate(self):
+        """
+        Estimate every design's flight; returns a dict of (N,) arrays.
+
+        burnout_altitude (m) and burnout_velocity (m/s) at the end of the burn
+        (or where the rocket stopped climbing, if the thrust never overcomes its
+        weight), coast_height (m) gained after burnout, apogee (m) and
+        time_to_apogee (s), with apogee_error and time_error bounds in the same units.
+        """
+        n = len(self.thrust)
+        launch_velocity = np.full(n, LAUNCH_VELOCITY)
+        launch_altitude = np.full(n, LAUNCH_ALTITUDE)
+        # First pass at sea-level density, later passes at each phase's mean density over the previous flight
+        boost_density = coast_density = BatchPhysCalcs.calculate_air_density(launch_altitude)
+        for _ in range(DENSITY_ITERATIONS):
+            burnout_velocity, boost_height, boost_time = _powered_flight(
+                launch_velocity, self.thrust - self.boost_mass * GRAVITY, self.drag_constant * boost_density,
+                self.boost_mass, self.burn_time)
+            burnout_altitude = launch_altitude + boost_height
+            _, coast_height, coast_time = _powered_flight(
+                burnout_velocity, -self.coast_mass * GRAVITY, self.drag_constant * coast_density,
+                self.coast_mass, np.inf)
+            boost_density = _mean_density(launch_altitude, boost_height, launch_velocity, burnout_velocity)
+            coast_density = _mean_density(burnout_altitude, coast_height, burnout_velocity, np.zeros(n))
+
+        apogee = burnout_altitude + coast_height
+        time_to_apogee = boost_time + coast_time
+        return {
+            "burnout_altitude": burnout_altitude,
+            "burnout_velocity": burnout_velocity,
+            "coast_height": coast_height,
+            "apogee": apogee,
+            "time_to_apogee": time_to_apogee,
+            "apogee_error": APOGEE_ERROR * apogee,
+            "time_error": TIME_ERROR * time_to_apogee,
+        }
+
+
+def estimate_apogee(rocket_specs_list):
+    """Closed-form flight estimates for a list of designs; see ClosedFormApogee.estimate."""
+    return ClosedFormApogee.from_specs(rocket_specs_list).estimate()
+
+
+if __name__ == "__main__":
+    import json
+    import time
+    from src.drivers.aeroArrays import FIELDS
+    from src.drivers.batchSim import simulate_summaries
+
+    with open("../config/rocket_specs.json", "r") as file:
+        rocket_specs = json.load(file)
+
+    estimate = estimate_apogee([rocket_specs])
+    summary = simulate_summaries([rocket_specs])
+    print(f"Closed form: apogee {estimate['apogee'][0]:.1f} +/- {estimate['apogee_error'][0]:.0f} m "
+          f"at {estimate['time_to_apogee'][0]:.2f} s, burnout {estimate['burnout_velocity'][0]:.1f} m/s")
+    print(f"Integrator:  apogee {summary['apogee'][0]:.1f} m")
+
+    # Thrust screening over many designs straight from columns
+    n = 100_000
+    columns = {name: np.full(n, rocket_specs[section][key]) for name, (section, key) in FIELDS.items()}
+    columns["thrust"] = np.linspace(100, 4000, n)
+    columns["burn_time"] = np.full(n, rocket_specs["motor"]["burn_time"])
+    start = time.perf_counter()
+    ClosedFormApogee.from_json_columns(columns).estimate()
+    elapsed = time.perf_counter() - start
+    print(f"{n} designs in {elapsed * 1e3:.0f} ms ({elapsed / n * 1e6:.2f} us per design)")
@@ -0,0 +1,124 @@
+import math
+import numpy as np
+from src.drivers.aeroArrays import AeroArrays
+from src.drivers.atmosphere import atmosphere, speed_of_sound_array
+from src.drivers.gridLookup import ScalarRows, grid_cell, grid_cells
+from src.drivers.rocketSpec import RocketSpec
+
+MACH_RANGE = (0.0, 5.0, 251)  # start, stop, points
+ALTITUDE_RANGE = (0.0, 40000.0, 81)  # m
+SUBSONIC_LIMIT = 0.8  # Prandtl-Glauert is used up to here...
+SUPERSONIC_LIMIT = 1.2  # ...and Ackeret from here, bridged linearly in between
+
+
+def compressibility_factor(mach):
+    """Pressure-drag scaling with Mach: Prandtl-Glauert below, Ackeret above the transonic bridge."""
+    mach = np.asarray(mach, dtype=float)
+    subsonic = 1 / np.sqrt(1 - np.minimum(mach, SUBSONIC_LIMIT) ** 2)
+    supersonic = 1 / np.sqrt(np.maximum(mach, SUPERSONIC_LIMIT) ** 2 - 1)
+    low = 1 / math.sqrt(1 - SUBSONIC_LIMIT ** 2)
+    high = 1 / math.sqrt(SUPERSONIC_LIMIT ** 2 - 1)
+    bridge = low + (high - low) * (mach - SUBSONIC_LIMIT) / (SUPERSONIC_LIMIT - SUBSONIC_LIMIT)
+    return np.where(mach <= SUBSONIC_LIMIT, subsonic, np.where(mach >= SUPERSONIC_LIMIT, supersonic, bridge))
+
+
+def base_drag_factor(mach):
+    """Base drag relative to its low-speed value (0.12 + 0.13 M² subsonic, 0.25 / M supersonic)."""
+    mach = np.asarray(mach, dtype=float)
+    return np.where(mach < 1, 0.12 + 0.13 * mach ** 2, 0.25 / np.maximum(mach, 1)) / 0.12
+
+
+def skin_friction_coefficient(reynolds, mach):
+    """Turbulent skin friction coefficient with its compressibility correction."""
+    reynolds = np.maximum(reynolds, 1e4)
+    cf = 1 / (1.50 * np.log(reynolds) - 5.6) ** 2
+    return np.where(mach < 1, cf * (1 - 0.1 * mach ** 2), cf / (1 + 0.15 * mach ** 2) ** 0.58)
+
+
+class DragTable:
+    """
+    Precomputed Cd(Mach, altitude) tables for one or more designs.
+
+    The table is built once per design from the same Barrowman component terms
+    as AeroCalcs: the nose cone and fin pressure terms are scaled by
+    compressibility_factor, the base term by base_drag_factor, and a skin
+    friction term is added whose Reynolds number follows from the Mach number,
+    the altitude and the body length. Lookups interpolate bilinearly on the
+    uniform grid (clamped at its edges), either one design at a time with
+    lookup() or for every design at once with lookup_array().
+    """
+
+    def __init__(self, rocket_specs, mach_range=MACH_RANGE, altitude_range=ALTITUDE_RANGE):
+        specs_list = rocket_specs if isinstance(rocket_specs, (list, tuple)) else [rocket_specs]
+        specs_list = [s if isinstance(s, RocketSpec) else RocketSpec.from_dict(s) for s in specs_list]
+        self.mach = np.linspace(*mach_range)
+        self.altitude = np.linspace(*altitude_range)
+        self.n_designs = len(specs_list)
+        self.cd = self._build(specs_list)  # (N, n_mach, n_altitude)
+
+        # Grid geometry for index arithmetic in the lookups
+        self._mach_start, self._mach_step = float(self.mach[0]), float(self.mach[1] - self.mach[0])
+        self._altitude_start = float(self.altitude[0])
+        self._altitude_step = float(self.altitude[1] - self.altitude[0])
+        self._mach_last, self._altitude_last = len(self.mach) - 2, len(self.altitude) - 2
+        self._rows = ScalarRows(self.cd)
+
+    def _build(self, specs_list):
+        aero = AeroArrays.from_specs(specs_list)
+        # The Barrowman component terms of the constant drag coefficient
+        nose_cd, fin_cd, base_cd = aero.drag_components()
+
+        # Wetted area of the body, nose cone and both sides of every fin, over the frontal area
+        radius = aero.airframe_diameter / 2
+        forms = np.array([spec.fins.form for spec in specs_list])
+        wetted = (
+            np.pi * aero.airframe_diameter * aero.airframe_length +
+            np.pi * radius * np.sqrt(aero.nose_cone_length ** 2 + radius ** 2) +
+            2 * forms * (aero.fin_root_chord + aero.fin_tip_chord) / 2 * aero.fin_semi_span
+        )
+        wetted_ratio = (wetted / aero.frontal_area())[:, None, None]
+        length = (aero.airframe_length + aero.nose_cone_length)[:, None, None]
+
+        mach = self.mach[None, :, None]
+        temp, density = atmosphere(self.altitude)
+        sound = speed_of_sound_array(self.altitude)[None, None, :]
+        viscosity = (1.458e-6 * temp ** 1.5 / (temp + 110.4))[None, None, :]  # Sutherland's law
+        reynolds = density[None, None, :] * mach * sound * length / viscosity
+
+        pressure = (nose_cd + fin_cd)[:, None, None] * compressibility_factor(mach)
+        base = base_cd[:, None, None] * base_drag_factor(mach)
+        friction = skin_friction_coefficient(reynolds, mach) * wetted_ratio
+        return pressure + base + friction
+
+    def lookup(self, mach, altitude, design=0):
+        """Cd of one design at a scalar Mach number and altitude (m)."""
+        i, u = grid_cell(mach, self._mach_start, self._mach_step, self._mach_last)
+        j, v = grid_cell(altitude, self._altitude_start, self._altitude_step, self._altitude_last)
+        rows = self._rows[design]
+        low, high = rows[i], rows[i + 1]
+        return ((low[j] * (1 - v) + low[j + 1] * v) * (1 - u) +
+                (high[j] * (1 - v) + high[j + 1] * v) * u)
+
+    def lookup_array(self, mach, altitude):
+        """Cd of every design at once; mach and altitude are (N,) arrays."""
+        i, u = grid_cells(mach, self._mach_start, self._mach_step, self._mach_last)
+        j, v = grid_cells(altitude, self._altitude_start, self._altitude_step, self._altitude_last)
+        n = np.arange(self.n_designs)
+        low = self.cd[n, i, j] * (1 - v) + self.cd[n, i, j + 1] * v
+        high = self.cd[n, i + 1, j] * (1 - v) + self.cd[n, i + 1, j + 1] * v
+        return low * (1 - u) + high * u
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    table = DragTable(RocketSpec.load("../config/rocket_specs.json"))
+    for altitude in (0, 5000, 15000, 30000):
+        cd = [table.lookup(m, altitude) for m in table.mach]
+        plt.plot(table.mach, cd, label=f"{altitude} m")
+    plt.xlabel("Mach")
+    plt.ylabel("Cd")
+    plt.title("Drag coefficient vs Mach")
+    plt.legend()
+    plt.grid()
+    plt.show()
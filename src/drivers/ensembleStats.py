@@ -0,0 +1,197 @@
+import numpy as np
+from scipy.stats import chi2
+
+
+class TDigest:
+    """
+    Mergeable streaming quantile sketch (merging t-digest).
+
+    Values are buffered and periodically compressed into at most ~compression
+    weighted centroids, which are kept small near the tails so extreme quantiles
+    stay accurate. Two digests merge by pooling their centroids and compressing.
+    """
+
+    def __init__(self, compression=200, buffer_size=500):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self._buffer = []
+        self._buffer_weights = []
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def add(self, value, weight=1):
+        """Add one value, or weight (> 0) copies of it at once."""
+        self._buffer.append(float(value))
+        self._buffer_weights.append(weight)
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self.buffer_size:
+            self._compress()
+
+    def _compress(self, extra_means=None, extra_weights=None):
+        means = np.concatenate([self.means, self._buffer] + ([extra_means] if extra_means is not None else []))
+        weights = np.concatenate([self.weights, np.asarray(self._buffer_weights, dtype=float)]
+                                 + ([extra_weights] if extra_weights is not None else []))
+        self._buffer = []
+        self._buffer_weights = []
+        if len(means) == 0:
+            return
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+
+        # k1 scale function: a centroid may span at most one unit of k
+        total = weights.sum()
+        cumulative = np.cumsum(weights) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * np.clip(cumulative, 0, 1) - 1)
+        groups = np.floor(k - k[0]).astype(np.int64)
+        # Start a new centroid wherever the k bucket changes
+        starts = np.concatenate([[0], np.nonzero(np.diff(groups))[0] + 1])
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+
+    def merge(self, other):
+        """Fold another digest into this one."""
+        other._compress()
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(other.means, other.weights)
+
+    def quantile(self, q):
+        """Estimate the q-quantile (0 <= q <= 1)."""
+        self._compress()
+        if self.count == 0:
+            return np.nan
+        if len(self.means) == 1:
+            return self.means[0]
+        # Interpolate between centroid centres placed at their cumulative mid-weights
+        total = self.weights.sum()
+        centres = (np.cumsum(self.weights) - self.weights / 2) / total
+        positions = np.concatenate([[0.0], centres, [1.0]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q, positions, values))
+
+
+class Histogram:
+    """Fixed-bin histogram; values outside the edges go to under/overflow counts."""
+
+    def __init__(self, low, high, bins=50):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, value):
+        """Count one value."""
+        if value < self.edges[0]:
+            self.underflow += 1
+        elif value >= self.edges[-1]:
+            self.overflow += 1
+        else:
+            self.counts[np.searchsorted(self.edges, value, side="right") - 1] += 1
+
+    def merge(self, other):
+        """Add another histogram's counts to this one."""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Histograms with different bin edges cannot be merged.")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+
+class EnsembleReducer:
+    """
+    Constant-memory statistics over a stream of flight results.
+
+    Keeps the running mean and covariance of the landing point (Welford/Chan
+    updates), t-digests for apogee and max velocity, and histograms of both.
+    No trajectories are retained, and reducers filled by different workers can
+    be merged into one, so memory does not grow with the number of flights.
+    The flight model is planar, so the landing point is the downrange x alone
+    unless landing_dims=2 and summaries carry a cross-range "landing_y".
+    """
+
+    def __init__(self, landing_dims=1, apogee_range=(0, 50000), velocity_range=(0, 3000), bins=50,
+                 compression=200):
+        self.landing_dims = landing_dims
+        self.count = 0
+        self.landing_mean = np.zeros(landing_dims)
+        self._landing_m2 = np.zeros((landing_dims, landing_dims))  # Sum of outer products of deviations
+        self.apogee_digest = TDigest(compression)
+        self.velocity_digest = TDigest(compression)
+        self.apogee_histogram = Histogram(*apogee_range, bins=bins)
+        self.velocity_histogram = Histogram(*velocity_range, bins=bins)
+        self.failures = 0
+
+    def add(self, summary):
+        """
+        Consume one flight summary.
+
+        summary needs "apogee", "max_velocity" and "landing_x"; "landing_y" is
+        used as the second landing coordinate when landing_dims is 2.
+        """
+        values = [summary["apogee"], summary["max_velocity"], summary["landing_x"]]
+        if not np.all(np.isfinite(values)):
+            self.failures += 1
+            return
+        landing = np.array([summary["landing_x"], summary.get("landing_y", 0.0)][:self.landing_dims])
+
+        self.count += 1
+        delta = landing - self.landing_mean
+        self.landing_mean += delta / self.count
+        self._landing_m2 += np.outer(delta, landing - self.landing_mean)
+
+        self.apogee_digest.add(summary["apogee"])
+        self.velocity_digest.add(summary["max_velocity"])
+        self.apogee_histogram.add(summary["apogee"])
+        self.velocity_histogram.add(summary["max_velocity"])
+
+    def add_batch(self, summaries):
+        """Consume a dict of summary arrays, e.g. from simulate_summaries or a sweep."""
+        for i in range(len(summaries["apogee"])):
+            self.add({key: values[i] for key, values in summaries.items()})
+
+    def merge(self, other):
+        """Fold another reducer (e.g. from another worker) into this one."""
+        if other.count:
+            total = self.count + other.count
+            delta = other.landing_mean - self.landing_mean
+            self._landing_m2 += other._landing_m2 + np.outer(delta, delta) * self.count * other.count / total
+            self.landing_mean += delta * other.count / total
+            self.count = total
+        self.failures += other.failures
+        self.apogee_digest.merge(other.apogee_digest)
+        self.velocity_digest.merge(other.velocity_digest)
+        self.apogee_histogram.merge(other.apogee_histogram)
+        self.velocity_histogram.merge(other.velocity_histogram)
+
+    @property
+    def landing_covariance(self):
+        """Sample covariance of the landing point."""
+        if self.count < 2:
+            return np.full((self.landing_dims, self.landing_dims), np.nan)
+        return self._landing_m2 / (self.count - 1)
+
+    def dispersion_ellipse(self, confidence=0.95):
+        """
+        Landing dispersion ellipse as (centre, semi-axes, axis directions).
+
+        Semi-axes are scaled so the ellipse holds the given fraction of a normal
+        landing distribution; with one landing coordinate it is an interval.
+        """
+        eigenvalues, eigenvectors = np.linalg.eigh(self.landing_covariance)
+        scale = np.sqrt(chi2.ppf(confidence, self.landing_dims))
+        return self.landing_mean.copy(), scale * np.sqrt(np.maximum(eigenvalues, 0)), eigenvectors
+
+    def apogee_quantile(self, q):
+        """Estimated q-quantile of apogee (m)."""
+        return self.apogee_digest.quantile(q)
+
+    def velocity_quantile(self, q):
+        """Estimated q-quantile of max velocity (m/s)."""
+        return self.velocity_digest.quantile(q)
@@ -0,0 +1,114 @@
+import numpy as np
+from matplotlib.animation import FuncAnimation
+from matplotlib.transforms import Affine2D
+
+PLAYBACK_FPS = 60  # Frames per wall-clock second
+PLAYBACK_SPEED = 5.0  # Flight seconds per wall-clock second
+ROCKET_PIXELS = 60  # Drawn rocket length at 100 dpi
+
+
+class FlightPlayback:
+    """
+    Animated flight on a Matplotlib axes: the RocketDrawing outline moving
+    along the trajectory, nose along the velocity, with a trail and a live
+    altitude and velocity readout.
+
+    Everything a frame shows is computed up front: the trajectory is
+    interpolated once at every frame time, the readout strings are formatted
+    once, and the outline's polylines are merged into one line per color.
+    Each frame then only moves the trail end, sets one affine transform on
+    the outline and swaps a string, and FuncAnimation blits those animated
+    artists over the cached static background instead of redrawing the
+    figure. Text is by far the most expensive artist to blit, so a readout
+    callback (e.g. a Qt label's setText) can take the readout strings instead
+    of the in-axes text.
+    """
+
+    def __init__(self, ax, rocket_drawing, t, x, y, vx, vy, fps=PLAYBACK_FPS, speed=PLAYBACK_SPEED,
+                 readout=None):
+        self.ax = ax
+        self.fps = fps
+        self.readout_callback = readout
+
+        # Frame data
+        n_frames = max(int(np.ceil((t[-1] - t[0]) / speed * fps)) + 1, 2)
+        self.frame_t = np.linspace(t[0], t[-1], n_frames)
+        self.frame_x = np.interp(self.frame_t, t, x)
+        self.frame_y = np.interp(self.frame_t, t, y)
+        self.frame_vx = np.interp(self.frame_t, t, vx)
+        self.frame_vy = np.interp(self.frame_t, t, vy)
+        self.frame_end = np.searchsorted(t, self.frame_t, side="right")  # Trail length in trajectory samples
+        self.readouts = [f"t = {s:6.1f} s\nAltitude: {a:8.0f} m\nVelocity: {v:6.0f} m/s"
+                         for s, a, v in zip(self.frame_t, self.frame_y, np.hypot(self.frame_vx, self.frame_vy))]
+        self.x, self.y = x, y
+
+        # Static background: the whole path
+        ax.plot(x, y, color="lightgray", linewidth=1)
+        margin_x = max(np.ptp(x) * 0.05, 1.0)
+        margin_y = max(np.ptp(y) * 0.05, 1.0)
+        ax.set_xlim(x.min() - margin_x, x.max() + margin_x)
+        ax.set_ylim(y.min() - margin_y, y.max() + margin_y)
+        ax.set_xlabel("Downrange (m)")
+        ax.set_ylabel("Altitude (m)")
+        ax.set_title("Flight Playback")
+        ax.grid(True)
+
+        # Animated artists
+        (self.trail,) = ax.plot([], [], color="tab:blue", linewidth=2, animated=True)
+        self.readout = ax.text(0.02, 0.97, "", transform=ax.transAxes, va="top", family="monospace",
+                               fontsize=8, animated=True, visible=readout is None)
+        self.rocket_transform = Affine2D()
+        self.rocket_lines = []
+        polylines = rocket_drawing.outline()
+        length = max((line_x.max() for line_x, _, _ in polylines), default=1.0)
+        center = length / 2
+        self.inches_to_pixels = ROCKET_PIXELS * ax.figure.dpi / 100 / length
+        for color in dict.fromkeys(style["color"] for _, _, style in polylines):
+            parts = [(line_x - center, line_y) for line_x, line_y, style in polylines if style["color"] == color]
+            merged_x = np.concatenate([np.append(px, np.nan) for px, _ in parts])
+            merged_y = np.concatenate([np.append(py, np.nan) for _, py in parts])
+            (line,) = ax.plot(merged_x, merged_y, color=color, linewidth=1, animated=True,
+                              transform=self.rocket_transform)  # Inches to display pixels
+            self.rocket_lines.append(line)
+        self.artists = [self.trail, *self.rocket_lines] + ([self.readout] if readout is None else [])
+        self.animation = None
+
+    @property
+    def n_frames(self):
+        return len(self.frame_t)
+
+    def start(self):
+        """Start playing; keep a reference to the playback while it runs."""
+        self.animation = FuncAnimation(self.ax.figure, self.update, frames=self.n_frames, init_func=self.init,
+                                       interval=1000 / self.fps, blit=True, repeat=False)
+        return self.animation
+
+    def stop(self):
+        if self.animation is not None:
+            self.animation.pause()
+            self.animation = None
+
+    def init(self):
+        self.trail.set_data([], [])
+        self.readout.set_text("")
+        if self.readout_callback is not None:
+            self.readout_callback("")
+        return self.artists
+
+    def update(self, frame):
+        """Move the animated artists to a frame and return them for blitting."""
+        end = self.frame_end[frame]
+        self.trail.set_data(self.x[:end], self.y[:end])
+        if self.readout_callback is None:
+            self.readout.set_text(self.readouts[frame])
+        else:
+            self.readout_callback(self.readouts[frame])
+
+        # Place the outline in display space so it keeps its shape whatever the axes' aspect ratio
+        to_display = self.ax.transData
+        px, py = to_display.transform((self.frame_x[frame], self.frame_y[frame]))
+        dx, dy = to_display.transform((self.frame_x[frame] + self.frame_vx[frame],
+                                       self.frame_y[frame] + self.frame_vy[frame])) - (px, py)
+        heading = np.arctan2(dy, dx) if dx or dy else np.pi / 2
+        self.rocket_transform.clear().scale(self.inches_to_pixels).rotate(heading).translate(px, py)
+        return self.artists
@@ -0,0 +1,131 @@
+import json
+import math
+import os
+import time
+import numpy as np
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.specUtils import motor_class, with_field
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "golden")
+BASE_SPECS = os.path.join(os.path.dirname(__file__), "..", "config", "rocket_specs.json")
+SAMPLE_DT = 0.5  # s between stored trajectory samples
+SUMMARY_RTOL = 1e-6
+TRAJECTORY_RTOL = 1e-6  # Relative to the largest magnitude of each state component
+BUDGET_FACTOR = 4  # Time budget per case as a multiple of the reference wall time...
+MIN_BUDGET = 0.5  # ...but never below this many seconds
+TIME_SCALE_ENV = "GOLDEN_TIME_SCALE"  # Multiplies every budget, for slow machines
+
+# Reference rockets: name -> (overrides as (section, key, value) in rocket_specs.json units, PhysCalcs options).
+# Thrust and burn time are picked so the total impulse covers every motor class from G to O.
+CASES = {
+    "motor_G": ([("motor", "thrust", 40), ("motor", "burn_time", 3.0)], {}),
+    "motor_H": ([("motor", "thrust", 80), ("motor", "burn_time", 3.0)], {}),
+    "motor_I": ([("motor", "thrust", 200), ("motor", "burn_time", 3.0)], {}),
+    "motor_J": ([("motor", "thrust", 300), ("motor", "burn_time", 3.0)], {}),
+    "motor_K": ([("motor", "thrust", 600), ("motor", "burn_time", 3.0)], {}),
+    "motor_L": ([("motor", "thrust", 1000), ("motor", "burn_time", 3.0)], {}),
+    "motor_M": ([("motor", "thrust", 2000), ("motor", "burn_time", 3.0)], {}),
+    "motor_N": ([], {}),
+    "motor_O": ([("motor", "thrust", 8000)], {}),
+    "nose_elliptic": ([("nose_cone", "shape", "elliptic")], {}),
+    "nose_conic": ([("nose_cone", "shape", "conic"), ("nose_cone", "length", 8.0)], {}),
+    "nose_parabolic": ([("nose_cone", "shape", "parabolic"), ("nose_cone", "length", 12.0)], {}),
+    "parachute_small": ([("parachute", "area", 40)], {}),
+    "parachute_large": ([("parachute", "area", 400), ("parachute", "mass", 25)], {}),
+    "drag_table": ([], {"drag_table": True}),
+    "mass_table": ([("motor", "thrust", 300)], {"mass_table": True}),
+}
+
+
+def case_specs(name, base_specs):
+    """Specs dict of a corpus case."""
+    specs = base_specs
+    for section, key, value in CASES[name][0]:
+        specs = with_field(specs, section, key, value)
+    return specs
+
+
+def run_case(rocket_specs, options, repeats=1):
+    """
+    Simulate one case; returns the summary dict, the raw state sampled every
+    SAMPLE_DT seconds and the best wall time of the repeats.
+    """
+    seconds = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        phys_calcs = PhysCalcs(rocket_specs, **options)
+        t, x, y, vx, vy = phys_calcs.simulate()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    summary = {key: float(value[0]) for key, value in BatchPhysCalcs.summarize(t, y, vx, vy, x).items()}
+    # The dense raw state is smooth, unlike the post-processed velocities that jump at the sampled apogee
+    samples = np.arange(0, summary["flight_time"], SAMPLE_DT)
+    state = phys_calcs.solution(samples)
+    trajectory = {"t": samples.tolist(),
+                  **{name: state[i].tolist() for i, name in enumerate(("x", "y", "vx", "vy", "mass"))}}
+    return summary, trajectory, seconds
+
+
+def compare(reference, summary, trajectory):
+    """Differences beyond the tolerances, as a list of messages (empty when the case passes)."""
+    failures = []
+    for key, expected in reference["summary"].items():
+        if not math.isclose(summary[key], expected, rel_tol=SUMMARY_RTOL):
+            failures.append(f"{key}: {summary[key]!r} != {expected!r}")
+    if len(trajectory["t"]) != len(reference["trajectory"]["t"]):
+        failures.append(f"trajectory has {len(trajectory['t'])} samples, expected {len(reference['trajectory']['t'])}")
+        return failures
+    for name, expected in reference["trajectory"].items():
+        expected, actual = np.array(expected), np.array(trajectory[name])
+        error = np.abs(actual - expected).max(initial=0.0)
+        scale = np.abs(expected).max(initial=0.0)
+        if error > TRAJECTORY_RTOL * max(scale, 1.0):
+            failures.append(f"{name}: max deviation {error:.3g} at scale {scale:.3g}")
+    return failures
+
+
+def budget(reference):
+    """Wall-time budget in s of a case on this machine."""
+    return reference["budget_s"] * float(os.environ.get(TIME_SCALE_ENV, 1.0))
+
+
+def load_corpus(directory=GOLDEN_DIR):
+    """Every stored reference case, keyed by name."""
+    corpus = {}
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.endswith(".json"):
+            with open(os.path.join(directory, file_name), "r") as file:
+                corpus[file_name[:-5]] = json.load(file)
+    return corpus
+
+
+def write_corpus(directory=GOLDEN_DIR, base_specs_file=BASE_SPECS, repeats=3, names=None):
+    """
+    Simulate cases and store them as the new references; only after an intended
+    change of results, or for new cases. names picks the cases (default: all).
+    """
+    with open(base_specs_file, "r") as file:
+        base_specs = json.load(file)
+    os.makedirs(directory, exist_ok=True)
+    for name in names or CASES:
+        options = CASES[name][1]
+        specs = case_specs(name, base_specs)
+        summary, trajectory, seconds = run_case(specs, options, repeats)
+        reference = {
+            "rocket_specs": specs,
+            "options": options,
+            "motor_class": motor_class(specs["motor"]["thrust"] * specs["motor"]["burn_time"]),
+            "budget_s": round(max(BUDGET_FACTOR * seconds, MIN_BUDGET), 3),
+            "summary": summary,
+            "trajectory": trajectory,
+        }
+        with open(os.path.join(directory, f"{name}.json"), "w") as file:
+            json.dump(reference, file)
+        print(f"{name:<18}{reference['motor_class']}  apogee {summary['apogee']:10.2f} m  {seconds * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    import sys
+
+    write_corpus(names=sys.argv[1:])
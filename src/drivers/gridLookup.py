@@ -0,0 +1,34 @@
+import numpy as np
+
+
+def grid_cell(value, start, step, last):
+    """Cell index and fraction of a scalar on a uniform grid, clamped to the grid's edges."""
+    u = (value - start) / step
+    i = min(max(int(u), 0), last)
+    return i, min(max(u - i, 0.0), 1.0)
+
+
+def grid_cells(values, start, step, last):
+    """Cell indices and fractions of an array on a uniform grid; the array version of grid_cell."""
+    u = (np.asarray(values, dtype=float) - start) / step
+    i = np.clip(u.astype(np.int64), 0, last)
+    return i, np.clip(u - i, 0.0, 1.0)
+
+
+class ScalarRows(dict):
+    """
+    Nested-list rows of a per-design table, keyed by design and copied on its first scalar lookup.
+
+    Indexing nested lists is faster than indexing arrays for the one-value
+    lookups of the scalar PhysCalcs right-hand side. Only the designs looked up
+    this way are copied, so tables used through their array lookups alone
+    (BatchPhysCalcs) never hold a second copy.
+    """
+
+    def __init__(self, table):
+        super().__init__()
+        self.table = table  # (N, ...) array
+
+    def __missing__(self, design):
+        rows = self[design] = self.table[design].tolist()
+        return rows
@@ -0,0 +1,173 @@
+import collections
+import json
+import time
+import numpy as np
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtTest import QTest
+
+QUANTILES = (50, 90, 99)
+MAX_SAMPLES = 10000  # Latencies kept per action
+STEP_TIMEOUT = 60.0  # s a replayed step may take to reach the screen
+INPUT_EVENTS = (
+    QtCore.QEvent.MouseButtonPress,
+    QtCore.QEvent.MouseButtonRelease,
+    QtCore.QEvent.MouseButtonDblClick,
+    QtCore.QEvent.KeyPress,
+    QtCore.QEvent.KeyRelease,
+    QtCore.QEvent.Wheel,
+)
+
+
+class TracedMainWindow(QtWidgets.QMainWindow):
+    """QMainWindow that reports the end of every repaint to its latency tracer."""
+
+    latency_tracer = None
+
+    def event(self, event):
+        # Every visible widget of the window is painted inside its UpdateRequest
+        handled = super().event(event)
+        if event.type() == QtCore.QEvent.UpdateRequest and self.latency_tracer is not None:
+            self.latency_tracer.painted()
+        return handled
+
+
+class LatencyTracer(QtCore.QObject):
+    """
+    Input-to-paint latency of GUI interactions.
+
+    An interaction starts at the input event (mouse, key or wheel) whose
+    handling emits a tracked widget's signal, and ends when the window has
+    finished its next repaint, i.e. once the result is on screen. An
+    application event filter timestamps input events, and a TracedMainWindow
+    reports the end of each repaint. Widgets may repaint before emitting their
+    signal (a button shows its release first), so an input time is kept until
+    an interaction takes it; a signal with no input event since the last
+    interaction, e.g. emitted from code or a timer, starts at the signal.
+
+    Latencies are kept per action. Each interaction is also appended to
+    `steps`, a script that replay() can run again, e.g. offscreen; that
+    includes signals arriving before the pending repaint, which are recorded
+    but not timed.
+    """
+
+    def __init__(self, window, max_samples=MAX_SAMPLES):
+        super().__init__(window)
+        self.window = window
+        window.latency_tracer = self
+        QtWidgets.QApplication.instance().installEventFilter(self)
+        self.latencies = collections.defaultdict(lambda: collections.deque(maxlen=max_samples))  # action -> ms
+        self.steps = []
+        self.pending = None  # (action, start) of the interaction waiting for its repaint
+        self._input_time = None  # Time of the latest input event not yet taken by an interaction
+        self._last_step = None
+
+    def track(self, widget, action, name):
+        """Trace a widget's edits (spin boxes), item clicks (lists) or clicks (buttons); name is its ui attribute."""
+        if isinstance(widget, QtWidgets.QAbstractSpinBox):
+            widget.valueChanged.connect(lambda value: self.begin(action, name, value=value))
+        elif isinstance(widget, QtWidgets.QListWidget):
+            widget.itemClicked.connect(lambda item: self.begin(action, name, row=widget.row(item)))
+        elif isinstance(widget, QtWidgets.QAbstractButton):
+            widget.clicked.connect(lambda checked=False: self.begin(action, name))
+        else:
+            raise TypeError(f"Cannot trace {type(widget).__name__} widgets.")
+
+    def begin(self, action, name=None, **step):
+        """Record a step and time it, unless another interaction is already waiting for its repaint."""
+        now = time.perf_counter()
+        start = self._input_time if self._input_time is not None else now
+        self._input_time = None
+        delay = start - self._last_step if self._last_step is not None else 0.0
+        self._last_step = start
+        self.steps.append({"action": action, "widget": name, "delay": round(delay, 3), **step})
+        if self.pending is None:
+            self.pending = (action, start)
+
+    def eventFilter(self, obj, event):
+        if event.type() in INPUT_EVENTS:
+            self._input_time = time.perf_counter()
+        return False
+
+    def painted(self):
+        """Called by the window after each repaint; completes the pending interaction."""
+        if self.pending is not None:
+            action, start = self.pending
+            self.latencies[action].append((time.perf_counter() - start) * 1e3)
+            self.pending = None
+
+    def close(self):
+        """Stop tracing."""
+        QtWidgets.QApplication.instance().removeEventFilter(self)
+        self.window.latency_tracer = None
+
+    def summary(self):
+        """Latency statistics per action in ms: count, p50, p90, p99 and max."""
+        summary = {}
+        for action, latencies in self.latencies.items():
+            values = np.array(latencies)
+            stats = {"count": len(values)}
+            stats.update({f"p{q}": float(np.percentile(values, q)) for q in QUANTILES})
+            stats["max"] = float(values.max())
+            summary[action] = stats
+        return summary
+
+    def format_summary(self):
+        lines = [f"{'Action':<16}{'Count':>7}" + "".join(f"{f'p{q} (ms)':>11}" for q in QUANTILES) + f"{'max (ms)':>11}"]
+        for action, stats in self.summary().items():
+            lines.append(f"{action:<16}{stats['count']:>7}" + "".join(f"{stats[f'p{q}']:>11.1f}" for q in QUANTILES)
+                         + f"{stats['max']:>11.1f}")
+        return "\n".join(lines)
+
+    def save_script(self, path):
+        """Write the recorded steps as a replay script."""
+        with open(path, "w") as file:
+            json.dump({"version": 1, "steps": self.steps}, file, indent=4)
+
+
+def load_script(path):
+    with open(path, "r") as file:
+        return json.load(file)["steps"]
+
+
+def replay(tracer, ui, steps, delays=False, timeout=STEP_TIMEOUT):
+    """
+    Run script steps on ui's widgets through real input events and wait for each to reach the screen.
+
+    Spin box steps select the text, type the value and press Enter; list steps
+    click the item; button steps click the button. Steps whose value matches
+    the widget already change nothing and are not measured. With delays=True
+    the recorded pauses between steps are kept, so background work such as the
+    live preview overlaps the next step as it did when recorded. Returns the
+    tracer's summary.
+    """
+    app = QtWidgets.QApplication.instance()
+    for step in steps:
+        if delays and step.get("delay"):
+            QTest.qWait(int(step["delay"] * 1000))
+        app.processEvents()
+        widget = getattr(ui, step["widget"])
+        if isinstance(widget, QtWidgets.QAbstractSpinBox):
+            if widget.value() == step["value"]:
+                continue
+            # Without keyboard tracking the typed value is committed once, by Enter
+            tracking = widget.keyboardTracking()
+            widget.setKeyboardTracking(False)
+            widget.setFocus()
+            widget.lineEdit().selectAll()
+            QTest.keyClicks(widget, widget.textFromValue(step["value"]))
+            QTest.keyClick(widget, QtCore.Qt.Key_Return)
+            widget.setKeyboardTracking(tracking)
+        elif isinstance(widget, QtWidgets.QListWidget):
+            item = widget.item(step["row"])
+            widget.scrollToItem(item)
+            QTest.mouseClick(widget.viewport(), QtCore.Qt.LeftButton, QtCore.Qt.NoModifier,
+                             widget.visualItemRect(item).center())
+        else:
+            QTest.mouseClick(widget, QtCore.Qt.LeftButton)
+
+        deadline = time.perf_counter() + timeout
+        while tracer.pending is not None:
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"Step {step} did not repaint within {timeout} s.")
+            app.processEvents(QtCore.QEventLoop.AllEvents, 10)
+    return tracer.summary()
@@ -0,0 +1,124 @@
+import threading
+import numpy as np
+from PyQt5 import QtCore
+from src.drivers.aeroCalcs import AeroCalcs
+from src.drivers.closedForm import ClosedFormApogee
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.rocketSpec import RocketSpec
+
+FULL_MAX_STEP = 0.1  # Same step as the Plot button's simulation
+SETTLE_MS = 400  # Quiet time after the last input change before the full run starts
+
+
+class PreviewCancelled(Exception):
+    """Raised inside a background run once newer inputs have made it stale."""
+
+
+class _CancellablePhysCalcs(PhysCalcs):
+    """PhysCalcs whose integration stops as soon as its cancel event is set."""
+
+    def __init__(self, rocket_specs, cancel_event):
+        super().__init__(rocket_specs)
+        self.cancel_event = cancel_event
+
+    def dynamics(self, t, y, burn_time, thrust):
+        if self.cancel_event.is_set():
+            raise PreviewCancelled()
+        return super().dynamics(t, y, burn_time, thrust)
+
+
+def estimate_flight(rocket_specs, max_step=FULL_MAX_STEP, cancel_event=None):
+    """Estimate apogee (m) and burnout velocity (m/s) with the given solver step."""
+    phys_calcs = _CancellablePhysCalcs(rocket_specs, cancel_event or threading.Event())
+    time, x, y, vx, vy = phys_calcs.simulate(max_step=max_step)
+    velocity = np.sqrt(vx**2 + vy**2)
+    burn_time = phys_calcs.motor.burn_time
+    return {
+        "apogee": float(y.max()),
+        "burnout_velocity": float(np.interp(burn_time, time, velocity)),
+    }
+
+
+class _PreviewSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(int, dict)  # generation, estimate
+
+
+class _PreviewJob(QtCore.QRunnable):
+    """Background full-fidelity flight estimate for one generation of inputs."""
+
+    def __init__(self, rocket_specs, generation, cancel_event):
+        super().__init__()
+        self.rocket_specs = rocket_specs
+        self.generation = generation
+        self.cancel_event = cancel_event
+        self.signals = _PreviewSignals()
+
+    def run(self):
+        try:
+            estimate = estimate_flight(self.rocket_specs, FULL_MAX_STEP, self.cancel_event)
+        except PreviewCancelled:
+            return
+        except Exception as e:
+            print(f"Error in live preview: {e}")
+            return
+        self.signals.finished.emit(self.generation, estimate)
+
+
+class LivePreview(QtCore.QObject):
+    """
+    Progressive-refinement flight estimates for the design inputs.
+
+    Every request immediately reports the static margin and the closed-form
+    apogee estimate, both instant, and (re)starts a settle timer; once the
+    inputs have been quiet for SETTLE_MS the full-fidelity run is queued. A new
+    request cancels any job still working on older inputs, and late results
+    from them are dropped.
+    """
+
+    updated = QtCore.pyqtSignal(str, dict)  # fidelity ("margin", "closed_form" or "full"), estimate
+
+    def __init__(self, settle_ms=SETTLE_MS, parent=None):
+        super().__init__(parent)
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.generation = 0
+        self.rocket_specs = None
+        self.cancel_event = threading.Event()
+
+        self.settle_timer = QtCore.QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(settle_ms)
+        self.settle_timer.timeout.connect(self._start_job)
+
+    def request(self, rocket_specs):
+        """Start a new preview for the given specs, superseding older ones."""
+        self.generation += 1
+        self.cancel_event.set()
+        self.cancel_event = threading.Event()
+        # Compile once; the frozen spec is shared with the worker thread as is
+        self.rocket_specs = RocketSpec.from_dict(rocket_specs)
+
+        margin = AeroCalcs(self.rocket_specs).calculate_static_margin()
+        self.updated.emit("margin", {"static_margin": float(margin)})
+        estimate = ClosedFormApogee.from_specs([self.rocket_specs]).estimate()
+        self.updated.emit("closed_form", {"apogee": float(estimate["apogee"][0]),
+                                          "burnout_velocity": float(estimate["burnout_velocity"][0])})
+
+        self.pool.clear()  # Drop queued jobs that have not started yet
+        self.settle_timer.start()
+
+    def _start_job(self):
+        job = _PreviewJob(self.rocket_specs, self.generation, self.cancel_event)
+        job.signals.finished.connect(self._job_finished)
+        self.pool.start(job)
+
+    def _job_finished(self, generation, estimate):
+        if generation == self.generation:
+            self.updated.emit("full", estimate)
+
+    def shutdown(self):
+        """Cancel outstanding work and wait for the worker thread to finish."""
+        self.settle_timer.stop()
+        self.cancel_event.set()
+        self.pool.clear()
+        self.pool.waitForDone()
@@ -0,0 +1,98 @@
+import numpy as np
+from src.drivers.aeroArrays import AeroArrays
+from src.drivers.rocketSpec import RocketSpec
+
+MIN_MARGIN = 1.0  # calibers; below this a design is considered unstable
+MAX_MARGIN = None  # calibers; set to also reject over-stable designs
+
+
+class MarginFilter:
+    """
+    Static-margin prefilter run before any trajectory is integrated.
+
+    Every candidate's CG and CP are evaluated in one vectorized pass, and designs
+    whose margin falls outside [min_margin, max_margin] (or whose specs are
+    invalid) are dropped, or only flagged when drop=False. The counters record
+    how many integrations were skipped, and record_integration() lets the caller
+    report the time that would have cost.
+    """
+
+    def __init__(self, min_margin=MIN_MARGIN, max_margin=MAX_MARGIN, drop=True):
+        self.min_margin = min_margin
+        self.max_margin = max_margin
+        self.drop = drop
+        self.counters = {"evaluated": 0, "accepted": 0, "unstable": 0, "overstable": 0, "invalid": 0,
+                         "skipped_integrations": 0, "integrated": 0, "integration_seconds": 0.0}
+
+    def margins(self, rocket_specs_list):
+        """Static margin in calibers of every design; NaN for invalid specs."""
+        specs, valid = [], []
+        for i, rocket_specs in enumerate(rocket_specs_list):
+            try:
+                specs.append(rocket_specs if isinstance(rocket_specs, RocketSpec)
+                             else RocketSpec.from_dict(rocket_specs))
+                valid.append(i)
+            except ValueError:
+                pass
+        margins = np.full(len(rocket_specs_list), np.nan)
+        if specs:
+            margins[valid] = AeroArrays.from_specs(specs).calculate_static_margin()
+        return margins
+
+    def apply(self, rocket_specs_list):
+        """
+        Screen the designs and return (indices to integrate, margins, in-band mask).
+
+        With drop=False every index is returned and the mask only flags the
+        out-of-band designs.
+        """
+        margins = self.margins(rocket_specs_list)
+        invalid = np.isnan(margins)
+        unstable = ~invalid & (margins < self.min_margin if self.min_margin is not None else False)
+        overstable = ~invalid & (margins > self.max_margin if self.max_margin is not None else False)
+        in_band = ~(invalid | unstable | overstable)
+
+        # Invalid specs cannot be integrated either way
+        keep = in_band if self.drop else ~invalid
+        self.counters["evaluated"] += len(margins)
+        self.counters["accepted"] += int(in_band.sum())
+        self.counters["unstable"] += int(unstable.sum())
+        self.counters["overstable"] += int(overstable.sum())
+        self.counters["invalid"] += int(invalid.sum())
+        self.counters["skipped_integrations"] += int((~keep).sum())
+        return np.flatnonzero(keep), margins, in_band
+
+    def record_integration(self, runs, seconds):
+        """Record the cost of the integrations that did run."""
+        self.counters["integrated"] += runs
+        self.counters["integration_seconds"] += seconds
+
+    def saved_seconds(self):
+        """Estimated integration time saved, from the mean cost of the runs that were integrated."""
+        if self.counters["integrated"] == 0:
+            return 0.0
+        return self.counters["skipped_integrations"] * self.counters["integration_seconds"] / self.counters["integrated"]
+
+    def report(self):
+        """One-line summary of the counters."""
+        c = self.counters
+        return (f"{c['evaluated']} designs screened: {c['accepted']} in band, {c['unstable']} unstable, "
+                f"{c['overstable']} over-stable, {c['invalid']} invalid; "
+                f"{c['skipped_integrations']} integrations skipped (~{self.saved_seconds():.1f} s saved)")
+
+
+if __name__ == "__main__":
+    import json
+    from src.drivers.specUtils import with_field
+    from src.drivers.sweepRunner import SweepRunner
+
+    with open("../config/rocket_specs.json", "r") as file:
+        rocket_specs = json.load(file)
+
+    # Airframe length sweep; short airframes are unstable, long ones over-stable
+    designs = [with_field(rocket_specs, "air_frame", "length", length) for length in np.linspace(10, 100, 32)]
+    margin_filter = MarginFilter(min_margin=1.0, max_margin=6.0)
+    with SweepRunner(designs, margin_filter=margin_filter).run() as results:
+        for specs, margin, apogee in zip(designs, results.static_margin, results.summary("apogee")):
+            print(f"length {specs['air_frame']['length']:6.1f} in, margin {margin:5.2f} cal -> apogee {apogee:8.1f} m")
+    print(margin_filter.report())
@@ -0,0 +1,100 @@
+import numpy as np
+from src.drivers.aeroArrays import AeroArrays
+from src.drivers.gridLookup import ScalarRows, grid_cell, grid_cells
+from src.drivers.rocketSpec import RocketSpec
+
+PROPELLANT_FRACTION = 0.5  # Share of the motor mass that burns; typical of composite motors
+TABLE_POINTS = 65  # Samples over the burn
+
+
+class MassPropertiesTable:
+    """
+    Mass, CG and pitch moment of inertia against burn time, for one or more designs.
+
+    Built once per motor/airframe pairing from the component masses of
+    AeroArrays: the airframe, nose cone, fins and parachute are fixed, the motor
+    casing keeps (1 - propellant_fraction) of the motor mass, and the
+    propellant burns at a constant rate (the motors have constant thrust). The
+    CG is measured in m from the aft end, like AeroArrays, and moves forward as
+    the aft-mounted propellant burns. Samples are uniform in t / burn_time, so
+    a lookup is index arithmetic plus one linear interpolation; after burnout
+    the last sample applies.
+    """
+
+    def __init__(self, rocket_specs, propellant_fraction=PROPELLANT_FRACTION, points=TABLE_POINTS):
+        specs_list = rocket_specs if isinstance(rocket_specs, (list, tuple)) else [rocket_specs]
+        specs_list = [s if isinstance(s, RocketSpec) else RocketSpec.from_dict(s) for s in specs_list]
+        aero = AeroArrays.from_specs(specs_list)
+        self.n_designs = len(specs_list)
+        self.burn_time = np.array([spec.motor.burn_time for spec in specs_list])
+        self.burned = np.linspace(0.0, 1.0, points)  # Burned share of the propellant at each sample
+        self.propellant_mass = propellant_fraction * aero.motor_mass  # kg
+        self.mass_flow = self.propellant_mass / self.burn_time  # kg/s
+        self.mass, self.cg, self.inertia = self._build(aero)  # (N, points): kg, m, kg m²
+
+        self._last = points - 2
+        self._steps = (points - 1) / self.burn_time  # Samples per second of each design
+        self._mass_rows = ScalarRows(self.mass)
+
+    def _build(self, aero):
+        components = aero.component_masses()
+        radius = aero.airframe_diameter / 2
+        motor_radius = aero.motor_diameter / 2
+
+        # Pitch inertia of each component about its own center
+        own_inertia = {
+            # Thin-walled tube
+            "airframe": (radius ** 2 + (radius - aero.material_thickness) ** 2) / 4 + aero.airframe_length ** 2 / 12,
+            # Solid cone about its centroid
+            "nose_cone": 3 * radius ** 2 / 20 + 3 * aero.nose_cone_length ** 2 / 80,
+            # Plates along the body, spread around the roll axis
+            "fins": aero.fin_root_chord ** 2 / 12 + (radius + aero.fin_semi_span / 2) ** 2 / 2,
+            # Solid cylinder, for the casing and the propellant alike
+            "motor": motor_radius ** 2 / 4 + aero.motor_length ** 2 / 12,
+            "parachute": np.zeros(aero.n_designs),
+        }
+
+        # Everything but the burning propellant, then the propellant at each sample
+        fixed = [(mass[:, None], position[:, None], own_inertia[name][:, None])
+                 for name, (mass, position) in components.items() if name != "motor"]
+        motor_mass, motor_position = components["motor"]
+        fixed.append(((motor_mass - self.propellant_mass)[:, None], motor_position[:, None],
+                      own_inertia["motor"][:, None]))
+        propellant = (self.propellant_mass[:, None] * (1 - self.burned[None, :]), motor_position[:, None],
+                      own_inertia["motor"][:, None])
+        parts = fixed + [propellant]
+
+        mass = sum(m for m, _, _ in parts)
+        cg = sum(m * position for m, position, _ in parts) / mass
+        inertia = sum(m * (k + (position - cg) ** 2) for m, position, k in parts)
+        return mass, cg, inertia
+
+    def mass_at(self, t, design=0):
+        """Mass in kg of one design at a scalar time (s) after ignition."""
+        i, u = grid_cell(t * self._steps[design], 0.0, 1.0, self._last)
+        row = self._mass_rows[design]
+        return row[i] * (1 - u) + row[i + 1] * u
+
+    def mass_array(self, t):
+        """Mass in kg of every design at a scalar time (s)."""
+        return self._interpolate(self.mass, t, np.arange(self.n_designs))
+
+    def history(self, t):
+        """Mass in kg of every design at each of the times t (T,), as an (N, T) array."""
+        return np.array([np.interp(t, self.burned * burn_time, row) for burn_time, row in zip(self.burn_time, self.mass)])
+
+    def properties_at(self, t, design=0):
+        """Mass (kg), CG (m from the aft end) and pitch inertia (kg m²) of one design at time t."""
+        rows = np.array([design])
+        return tuple(float(self._interpolate(table, t, rows)[0]) for table in (self.mass, self.cg, self.inertia))
+
+    def _interpolate(self, table, t, rows):
+        i, u = grid_cells(t * self._steps[rows], 0.0, 1.0, self._last)
+        return table[rows, i] * (1 - u) + table[rows, i + 1] * u
+
+
+if __name__ == "__main__":
+    table = MassPropertiesTable(RocketSpec.load("../config/rocket_specs.json"))
+    for t in np.linspace(0, table.burn_time[0], 6):
+        mass, cg, inertia = table.properties_at(t)
+        print(f"t = {t:5.2f} s  mass = {mass:6.3f} kg  CG = {cg:6.3f} m  I = {inertia:6.3f} kg m²")
@@ -0,0 +1,153 @@
+import numpy as np
+
+
+def parabolic_peak(t0, t1, t2, y0, y1, y2):
+    """Maximum of the parabola through three samples around a peak (falls back to y1)."""
+    denom = (t0 - t1) * (t0 - t2) * (t1 - t2)
+    a = (t2 * (y1 - y0) + t1 * (y0 - y2) + t0 * (y2 - y1)) / denom
+    b = (t2**2 * (y0 - y1) + t1**2 * (y2 - y0) + t0**2 * (y1 - y2)) / denom
+    c = y0 - a * t0**2 - b * t0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_peak = np.where(a < 0, -b / (2 * a), t1)
+    t_peak = np.clip(t_peak, t0, t2)
+    return np.where(a < 0, a * t_peak**2 + b * t_peak + c, y1)
+
+
+def crossing_fraction(y_prev, y_first, level, crossed):
+    """Fraction of the way from the previous sample to the first one at or below level."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.where(y_prev != y_first, (y_prev - level) / (y_prev - y_first), 1.0)
+    return np.where(crossed, np.clip(frac, 0, 1), 1.0)
+
+
+class OutputPolicy:
+    """
+    What simulate() keeps from the solver.
+
+    full      every solver step plus the dense output (PhysCalcs.solution)
+    summary   no trajectory at all; apogee, flight time, max velocity and
+              landing x are reduced step by step in constant memory
+    fixed     samples every dt seconds, interpolated inside each step
+    adaptive  solver steps thinned to where the trajectory bends
+    """
+
+    def __init__(self, kind="full", dt=0.1, tolerance=0.02):
+        if kind not in ("full", "summary", "fixed", "adaptive"):
+            raise ValueError(f"Unknown output policy {kind!r}.")
+        self.kind = kind
+        self.dt = dt  # s, for "fixed"
+        self.tolerance = tolerance  # Normalized slope change per kept sample, for "adaptive"
+
+    @classmethod
+    def coerce(cls, output):
+        """Accept a policy or its name."""
+        return output if isinstance(output, cls) else cls(output)
+
+    @property
+    def dense_output(self):
+        return self.kind == "full"
+
+    def t_eval(self, t_span):
+        """Output times for solve_ivp, or None to keep every step."""
+        if self.kind != "fixed":
+            return None
+        return np.arange(t_span[0], t_span[1], self.dt)
+
+    def select(self, t, x, y):
+        """
+        Indices of the steps to keep; y and x are (T,) or (N, T).
+
+        For "adaptive", a step is kept each time the accumulated change of the
+        normalized slopes of x(t) and y(t) grows by tolerance, so straight
+        coasting stretches collapse to a few points while burnout, apogee and
+        landing keep their detail. The apogee step of every row is always kept.
+        """
+        if self.kind != "adaptive" or len(t) < 3:
+            return slice(None)
+        x, y = np.atleast_2d(x), np.atleast_2d(y)
+        duration = t[-1] - t[0]
+        turning = np.zeros(len(t) - 1)
+        for column in (x, y):
+            scale = np.ptp(column, axis=1, keepdims=True)
+            slope = np.gradient(column / np.where(scale > 0, scale, 1.0), t, axis=1) * duration
+            turning = np.maximum(turning, np.abs(np.diff(slope, axis=1)).max(axis=0))
+        buckets = np.floor(np.concatenate([[0.0], np.cumsum(turning)]) / self.tolerance)
+        keep = np.flatnonzero(np.diff(buckets, prepend=-1) > 0)
+        return np.unique(np.concatenate([keep, [len(t) - 1], np.argmax(y, axis=1)]))
+
+
+class StreamingSummary:
+    """
+    Step-by-step equivalent of BatchPhysCalcs.summarize over N designs.
+
+    Fed one solver step at a time, it keeps only the samples around the
+    current peak and the first ground crossing after it, so memory is O(N)
+    whatever the number of steps. Velocities are post-processed exactly like
+    simulate() (parachute descent rate after apogee, zero on the ground) before
+    the peak speed is taken, so the results equal summarize() on the stored
+    arrays. (summarize() also handles a peak on the first or last step by
+    shifting its three-point window; here the sampled peak is used as is.)
+    """
+
+    def __init__(self, n, chute_speed, ground_level):
+        self.chute_speed = chute_speed  # altitude (N,) -> descent rate (N,)
+        self.ground_level = ground_level
+        self.previous = None  # (t, x, y) of the last step
+        self.peak_y = np.full(n, -np.inf)
+        self.around_peak = [np.zeros(n) for _ in range(6)]  # t0, t1, t2, y0, y1, y2
+        self.has_next = np.zeros(n, dtype=bool)
+        self.landed = np.zeros(n, dtype=bool)
+        self.crossing = [np.zeros(n) for _ in range(6)]  # t_prev, t_first, x_prev, x_first, y_prev, y_first
+        self.speed_to_peak = np.full(n, -np.inf)  # Steps up to and including the peak
+        self.raw_since_peak = np.full(n, -np.inf)  # Steps after it, in case a higher peak follows
+        self.chute_since_peak = np.full(n, -np.inf)  # Steps after it, as post-processed if it is apogee
+
+    def update(self, t, x, y, vx, vy):
+        """Consume one step; x, y, vx, vy are (N,) arrays."""
+        on_ground = y <= self.ground_level
+        raw_speed = np.sqrt(vx**2 + np.where(on_ground, 0.0, vy)**2)
+        chute_speed = np.sqrt(vx**2 + np.where(on_ground, 0.0, self.chute_speed(y))**2)
+        new_peak = y > self.peak_y
+        t0, t1, t2, y0, y1, y2 = self.around_peak
+
+        if self.previous is not None:
+            t_prev, x_prev, y_prev = self.previous
+            # Sample after the current peak completes its three-point window
+            fill = ~new_peak & ~self.has_next
+            t2[fill], y2[fill] = t, y[fill]
+            self.has_next |= fill
+            # Sample before a new peak opens its window
+            t0[new_peak], y0[new_peak] = t_prev, y_prev[new_peak]
+
+            # First step at or below ground level after the peak
+            cross = on_ground & ~new_peak & ~self.landed
+            for target, value in zip(self.crossing, (t_prev, t, x_prev, x, y_prev, y)):
+                target[cross] = value[cross] if np.ndim(value) else value
+            self.landed |= cross
+
+        t1[new_peak], y1[new_peak] = t, y[new_peak]
+        self.peak_y = np.where(new_peak, y, self.peak_y)
+        self.has_next &= ~new_peak
+        self.landed &= ~new_peak
+
+        # Steps between an old and a new peak turn out to be ascent steps
+        self.speed_to_peak = np.where(new_peak, np.maximum.reduce([self.speed_to_peak, self.raw_since_peak,
+                                                                   raw_speed]), self.speed_to_peak)
+        self.raw_since_peak = np.where(new_peak, -np.inf, np.maximum(self.raw_since_peak, raw_speed))
+        self.chute_since_peak = np.where(new_peak, -np.inf, np.maximum(self.chute_since_peak, chute_speed))
+        self.previous = (t, x.copy(), y.copy())
+
+    def result(self):
+        """Summary dict with apogee, flight_time, max_velocity and landing_x arrays."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            apogee = np.where(self.has_next, parabolic_peak(*self.around_peak), self.peak_y)
+
+        t_prev, t_first, x_prev, x_first, y_prev, y_first = self.crossing
+        t_last, x_last, _ = self.previous
+        frac = crossing_fraction(y_prev, y_first, self.ground_level, self.landed)
+        return {
+            "apogee": apogee,
+            "flight_time": np.where(self.landed, t_prev + frac * (t_first - t_prev), t_last),
+            "max_velocity": np.maximum(self.speed_to_peak, self.chute_since_peak),
+            "landing_x": np.where(self.landed, x_prev + frac * (x_first - x_prev), x_last),
+        }
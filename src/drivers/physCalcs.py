@@ -1,20 +1,62 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 from matplotlib.collections import LineCollection
 import json
-from scipy.integrate import solve_ivp
+from scipy.integrate import RK45, solve_ivp
 from src.drivers.aeroCalcs import AeroCalcs
+from src.drivers.atmosphere import speed_of_sound
+from src.drivers.dragTable import DragTable
+from src.drivers.massProperties import MassPropertiesTable
+from src.drivers.outputPolicy import OutputPolicy, StreamingSummary
+from src.drivers.rocketSpec import RocketSpec
+from src.drivers.windBank import WindProfiles
+
+GRAVITY = 32  # Gravitational acceleration used by the flight model
+GROUND_LEVEL = 0.1  # Altitude (m) below which the rocket counts as landed
 
 
 class PhysCalcs:
-    def __init__(self, rocket_specs_file):
-        with open(rocket_specs_file, "r") as file:
-            self.rocket_specs = json.load(file)
+    def __init__(self, rocket_specs_file, drag_table=False, mass_table=False, wind_bank=None, wind_profile=0):
+        # Accept a path to a specs JSON file, an already loaded specs dict or a compiled RocketSpec
+        if isinstance(rocket_specs_file, RocketSpec):
+            self.rocket_specs = rocket_specs_file.to_dict()
+        elif isinstance(rocket_specs_file, dict):
+            self.rocket_specs = rocket_specs_file
+        else:
+            with open(rocket_specs_file, "r") as file:
+                self.rocket_specs = json.load(file)
 
-        self.aero_calcs = AeroCalcs(self.rocket_specs)
-        self.motor = self.rocket_specs["motor"]
-        self.parachute = self.rocket_specs["parachute"]
+        # Compile and validate the specs once, before any integration work
+        if isinstance(rocket_specs_file, RocketSpec):
+            self.spec = rocket_specs_file
+        else:
+            self.spec = RocketSpec.from_dict(self.rocket_specs)
+        self.aero_calcs = AeroCalcs(self.spec)
+        self.motor = self.spec.motor
+        self.parachute = self.spec.parachute
+
+        # Per-run constants of the right-hand side
+        self.drag_constant = 0.5 * self.aero_calcs.drag_coefficient * self.aero_calcs.frontal_area  # m²
+        self.mass_loss_rate = self.motor.mass / self.motor.burn_time  # kg/s
+
+        # Optional Cd(Mach, altitude) table in place of the constant drag coefficient
+        self.drag_table = DragTable(self.spec) if drag_table else None
+        self.half_frontal_area = 0.5 * self.aero_calcs.frontal_area  # m²
+
+        # Optional mass properties from the component masses, in place of the legacy initial mass
+        # (CG in inches plus motor mass) that loses the whole motor mass during the burn
+        self.mass_table = MassPropertiesTable(self.spec) if mass_table else None
+        if self.mass_table is not None:
+            self.mass_loss_rate = float(self.mass_table.mass_flow[0])
+
+        # Horizontal wind against altitude: a profile of a shared WindBank, or the shear profile of
+        # launch_conditions.wind; without either the flight is windless as before
+        if wind_bank is not None:
+            self.wind = wind_bank.select(wind_profile)
+        elif self.spec.launch_conditions.wind:
+            self.wind = WindProfiles.from_specs([self.spec])
+        else:
+            self.wind = None
 
     def dynamics(self, t, y, burn_time, thrust):
         """Compute the dynamics (velocity and acceleration) of the rocket."""
@@ -24,25 +66,33 @@ class PhysCalcs:
         if y_pos <= 0:
             return [0, 0, 0, 0, 0]
 
+        if self.mass_table is not None:
+            mass = self.mass_table.mass_at(t)
+
+        # Drag and thrust act along the velocity relative to the air
+        vx_air = vx - self.wind.lookup(y_pos) if self.wind is not None else vx
+
         # Calculate velocity magnitude
     
     
-        velocity = np.sqrt(vx**2 + vy**2)
+        velocity = np.sqrt(vx_air**2 + vy**2)
 
 
-        # Determine air density and drag coefficient
+        # Determine air density
         rho = self.aero_calcs.calculate_air_density(y_pos)
-        cd = self.aero_calcs.calculate_drag_coefficient(y_pos)
-        frontal_area = np.pi * (self.aero_calcs.airframe["diameter"] * 2.54 / 2) ** 2 / 10000  # cm² to m²
 
         # Calculate drag force components
-        drag = 0.5 * cd * rho * frontal_area * velocity**2
-        drag_x = -drag * (vx / velocity) if velocity > 0 else 0
-        drag_y = -drag * (vy / velocity) - mass * 32 if velocity > 0 else -mass * 32
+        if self.drag_table is not None:
+            cd = self.drag_table.lookup(velocity / speed_of_sound(y_pos), y_pos)
+            drag = self.half_frontal_area * cd * rho * velocity**2
+        else:
+            drag = self.drag_constant * rho * velocity**2
+        drag_x = -drag * (vx_air / velocity) if velocity > 0 else 0
+        drag_y = -drag * (vy / velocity) - mass * GRAVITY if velocity > 0 else -mass * GRAVITY
 
         # Thrust during burn
         current_thrust = thrust if t <= burn_time else 0
-        thrust_x = current_thrust * (vx / velocity) if velocity > 0 else 0
+        thrust_x = current_thrust * (vx_air / velocity) if velocity > 0 else 0
         thrust_y = current_thrust * (vy / velocity) if velocity > 0 else 0
 
         # Acceleration components
@@ -51,34 +101,53 @@ class PhysCalcs:
 
         # Mass loss during burn
         if t <= burn_time:
-            mass_loss_rate = self.motor["mass"] / 1000 / burn_time  # kg/s
-            dm_dt = -mass_loss_rate
+            dm_dt = -self.mass_loss_rate
         else:
             dm_dt = 0
 
         return [vx, vy, ax, ay, dm_dt]
 
-    def simulate(self):
-        """Simulate the trajectory using numerical integration."""
-        burn_time = self.motor["burn_time"]
-        thrust = self.motor["thrust"]
-        initial_mass = self.aero_calcs.calculate_center_of_gravity() + self.motor["mass"] / 1000  # Includes motor mass
+    def simulate(self, max_step=0.1, output="full"):
+        """
+        Simulate the trajectory using numerical integration.
+
+        output is an OutputPolicy or its name. "full" (the default) returns every
+        solver step and keeps the dense output in self.solution; "fixed" and
+        "adaptive" return resampled steps; "summary" returns only a dict with
+        apogee, flight_time, max_velocity and landing_x, reduced step by step
+        without storing the trajectory.
+        """
+        policy = OutputPolicy.coerce(output)
+        burn_time = self.motor.burn_time
+        thrust = self.motor.thrust
+        if self.mass_table is not None:
+            initial_mass = self.mass_table.mass_at(0)
+        else:
+            initial_mass = self.aero_calcs.calculate_center_of_gravity() + self.motor.mass  # Includes motor mass
         initial_state = [1, 1, 1, 100, initial_mass]  # Initial x, y, vx, vy, mass
 
+        if policy.kind == "summary":
+            return self._simulate_summary(initial_state, burn_time, thrust, max_step)
+
         # Ascent and coasting phase
         ascent_result = solve_ivp(
             self.dynamics,
             [0, 100],
             initial_state,
             args=(burn_time, thrust),
-            dense_output=True,
-            max_step=0.1
+            dense_output=policy.dense_output,
+            max_step=max_step,
+            t_eval=policy.t_eval((0, 100))
         )
         t = ascent_result.t
         y0 = ascent_result.y[0]
         y1 = ascent_result.y[1]  # y-position (assuming y1 is the y-position)
         y2 = ascent_result.y[2]
         y3 = ascent_result.y[3]  # y-velocity (assuming y3 is the y-velocity)
+        self.mass = ascent_result.y[4]  # Mass history, kept for callers that record it
+        if self.mass_table is not None:
+            self.mass = self.mass_table.history(t)[0]
+        self.solution = ascent_result.sol  # Dense output of the raw state (full output only)
 
         # Loop over the time steps and check if y1 == 0, if so set y3 to 0 at the corresponding time step
         for i in range(len(y1)):
@@ -86,14 +155,38 @@ class PhysCalcs:
             time_apogee = ascent_result.t[apogee_index]
             if t[i] > time_apogee:
                 y3[i] = self.aero_calcs.calculate_v_terminal_parachute(y1[i])
-            if y1[i] <= 0.1:  # When y-position is 0 (i.e., the rocket hits the ground)
+            if y1[i] <= GROUND_LEVEL:  # When y-position is 0 (i.e., the rocket hits the ground)
                  # Set y-velocity to 0 when the rocket reaches the ground
                 y3[i] = 0
-                
-        return t, y0, y1, y2, y3
 
-    def plot_position_with_gradient(self, x, y, vx, vy):
-        """Plot x, y positions with a color gradient based on velocity."""
+        keep = policy.select(t, y0, y1)
+        self.mass = self.mass[keep]
+        return t[keep], y0[keep], y1[keep], y2[keep], y3[keep]
+
+    def _simulate_summary(self, initial_state, burn_time, thrust, max_step):
+        """Step the same solver as solve_ivp, reducing each step into a StreamingSummary."""
+        chute_speed = lambda altitude: np.array([self.aero_calcs.calculate_v_terminal_parachute(altitude[0])])
+        summary = StreamingSummary(1, chute_speed, GROUND_LEVEL)
+        solver = RK45(lambda t, y: self.dynamics(t, y, burn_time, thrust), 0, initial_state, 100, max_step=max_step)
+        summary.update(solver.t, *solver.y[:4, None])
+        while solver.status == "running":
+            message = solver.step()
+            if solver.status == "failed":
+                raise RuntimeError(message)
+            summary.update(solver.t, *solver.y[:4, None])
+        self.solution = None
+        self.mass = None
+        return {key: float(values[0]) for key, values in summary.result().items()}
+
+    def plot_position_with_gradient(self, x, y, vx, vy, velocity=None, ax=None, cax=None):
+        """
+        Plot x, y positions with a color gradient based on velocity.
+
+        velocity is the speed at each point (e.g. TrajectoryAnalytics.speed);
+        it is computed from vx and vy when omitted. Without ax a new pyplot
+        figure is created and shown; with ax the plot is drawn there (and the
+        colorbar into cax, if given) without touching pyplot.
+        """
         # Ensure inputs are numpy arrays
         x = np.asarray(x)
         y = np.asarray(y)
@@ -108,20 +201,21 @@ class PhysCalcs:
         if len(x) != len(vx):
             raise ValueError("x, y, vx, and vy must all have the same length.")
 
-        # Calculate velocity magnitude
-        
-        velocity = np.sqrt(vx**2 + vy**2)
-        
-    
+        if velocity is None:
+            velocity = np.sqrt(vx**2 + vy**2)
+        velocity = np.asarray(velocity)
+
         # Normalize velocities for coloring
         norm = plt.Normalize(velocity.min(), velocity.max())
 
         # Prepare the figure and axis
-        fig, ax = plt.subplots(figsize=(8, 8))
+        interactive = ax is None
+        if interactive:
+            fig, ax = plt.subplots(figsize=(8, 8))
         ax.set_title("Rocket Trajectory with Velocity Gradient")
         ax.set_xlabel("X Position (m)")
         ax.set_ylabel("Y Position (m)")
-        ax.grid()
+        ax.grid(True)
 
         # Create a LineCollection for the gradient
         points = np.array([x, y]).T.reshape(-1, 1, 2)
@@ -136,13 +230,15 @@ class PhysCalcs:
         ax.set_ylim(y.min() - 10, y.max() + 10)
 
         # Add a colorbar
-        cbar = plt.colorbar(lc, ax=ax)
+        cbar = ax.figure.colorbar(lc, ax=ax, cax=cax)
         cbar.set_label("Velocity (m/s)")
 
-        plt.show()
+        if interactive:
+            plt.show()
+        return lc
 
-    def plot_y_position_with_gradient(self, time, y, velocity):
-        """Plot y position over time with a color gradient based on velocity."""
+    def plot_y_position_with_gradient(self, time, y, velocity, ax=None, cax=None):
+        """Plot y position over time with a color gradient based on velocity; ax and cax as above."""
         # Ensure inputs are numpy arrays
         time = np.asarray(time)
         y = np.asarray(y)
@@ -158,11 +254,13 @@ class PhysCalcs:
         norm = plt.Normalize(velocity.min(), velocity.max())
 
         # Prepare the figure and axis
-        fig, ax = plt.subplots(figsize=(8, 6))
+        interactive = ax is None
+        if interactive:
+            fig, ax = plt.subplots(figsize=(8, 6))
         ax.set_title("Rocket Y-Position Over Time with Velocity Gradient")
         ax.set_xlabel("Time (s)")
         ax.set_ylabel("Y Position (m)")
-        ax.grid()
+        ax.grid(True)
 
         # Create a LineCollection for the gradient
         points = np.array([time, y]).T.reshape(-1, 1, 2)
@@ -177,10 +275,12 @@ class PhysCalcs:
         ax.set_ylim(y.min() - 10, y.max() + 10)
 
         # Add a colorbar
-        cbar = plt.colorbar(lc, ax=ax)
+        cbar = ax.figure.colorbar(lc, ax=ax, cax=cax)
         cbar.set_label("Velocity (m/s)")
 
-        plt.show()
+        if interactive:
+            plt.show()
+        return lc
 
 
 
@@ -189,19 +289,16 @@ if __name__ == "__main__":
     material = "blue_tube"
     phys_calcs = PhysCalcs("../config/rocket_specs.json")
 
-    # Simulate the trajectory
-    time, x, y, vx, vy = phys_calcs.simulate()
-
-    # Calculate velocity magnitude
-   
-    velocity = np.sqrt(vx**2 + vy**2)
-    
+    # Simulate the trajectory and derive speed and flight events once
+    from src.drivers.trajectoryAnalytics import TrajectoryAnalytics
+    analytics = TrajectoryAnalytics.run(phys_calcs)
+    print(analytics.events())
 
     # Plot y-position over time with velocity gradient
-    phys_calcs.plot_y_position_with_gradient(time, y, velocity)
+    phys_calcs.plot_y_position_with_gradient(analytics.t, analytics.y, analytics.speed)
 
     # Plot position with gradient
-    # phys_calcs.plot_position_with_gradient(x, y, vx, vy)
+    # phys_calcs.plot_position_with_gradient(analytics.x, analytics.y, analytics.vx, analytics.vy, analytics.speed)
     def calculate_air_density(self, altitude):
         """Calculate air density at a given altitude in g/cm³."""
         if altitude <= 11000:  # Troposphere
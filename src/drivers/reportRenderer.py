@@ -0,0 +1,160 @@
+import multiprocessing as mp
+import os
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from src.drivers.aeroCalcs import AeroCalcs
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.rocketDrawing import RocketDrawing
+from src.drivers.specUtils import spec_hash
+
+FORMATS = ("png",)  # Any format Agg's savefig writes, e.g. "png", "pdf", "svg"
+DPI = 100
+PAGE_SIZE = (11, 8.5)  # inches, landscape letter
+
+# Set in each worker process by _init_worker
+_worker_page = None
+
+
+class ReportPage:
+    """
+    One reusable report figure: rocket outline, summary, trajectory and altitude plots.
+
+    The figure, its Agg canvas and all axes (including the colorbar axes) are
+    created once. Each render replaces the previous design's artists in place, so a worker
+    renders any number of designs without building a new figure or leaking
+    axes, and never touches pyplot.
+    """
+
+    def __init__(self, output_dir, formats=FORMATS, dpi=DPI):
+        self.output_dir = output_dir
+        self.formats = formats
+        self.figure = Figure(figsize=PAGE_SIZE, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        grid = self.figure.add_gridspec(2, 4, width_ratios=[1, 0.04, 1, 0.04], height_ratios=[1, 1.4],
+                                        wspace=0.35, hspace=0.3)
+        self.rocket_ax = self.figure.add_subplot(grid[0, :2])
+        self.summary_ax = self.figure.add_subplot(grid[0, 2:])
+        self.path_ax = self.figure.add_subplot(grid[1, 0])
+        self.path_cax = self.figure.add_subplot(grid[1, 1])
+        self.altitude_ax = self.figure.add_subplot(grid[1, 2])
+        self.altitude_cax = self.figure.add_subplot(grid[1, 3])
+
+    def render(self, name, spec, t, x, y, vx, vy, summary):
+        """Draw one design and save it in every format; returns the written paths."""
+        # Drop the previous design's artists but keep each axes' ticks, which cla() would rebuild at a
+        # large share of the render time; colorbar axes are cleared fully since colorbars restyle them
+        for ax in (self.path_ax, self.altitude_ax, self.summary_ax):
+            for artist in [*ax.lines, *ax.collections, *ax.texts]:
+                artist.remove()
+        self.path_cax.cla()
+        self.altitude_cax.cla()
+        aero_calcs = AeroCalcs(spec)
+        cg = aero_calcs.calculate_center_of_gravity()
+        cp = aero_calcs.calculate_center_of_pressure()
+        RocketDrawing(spec, cg, cp).plot_rocket(self.rocket_ax)
+
+        # PhysCalcs' plot methods draw into the given axes; no simulation is run here
+        plotter = PhysCalcs(spec)
+        speed = np.sqrt(vx**2 + vy**2)
+        plotter.plot_position_with_gradient(x, y, vx, vy, speed, ax=self.path_ax, cax=self.path_cax)
+        plotter.plot_y_position_with_gradient(t, y, speed, ax=self.altitude_ax, cax=self.altitude_cax)
+
+        self.summary_ax.axis("off")
+        lines = [
+            f"Apogee          {summary['apogee']:10.1f} m",
+            f"Flight time     {summary['flight_time']:10.1f} s",
+            f"Max velocity    {summary['max_velocity']:10.1f} m/s",
+            f"Landing x       {summary['landing_x']:10.1f} m",
+            f"Static margin   {aero_calcs.calculate_static_margin():10.2f} cal",
+            f"Motor           {spec.motor.thrust:.0f} N for {spec.motor.burn_time:g} s",
+        ]
+        self.summary_ax.text(0.0, 1.0, "\n".join(lines), va="top", family="monospace", fontsize=10,
+                             transform=self.summary_ax.transAxes)
+        self.figure.suptitle(name)
+
+        paths = []
+        for file_format in self.formats:
+            path = os.path.join(self.output_dir, f"{name}.{file_format}")
+            self.figure.savefig(path, format=file_format)
+            paths.append(path)
+        return paths
+
+
+def _init_worker(output_dir, formats, dpi):
+    global _worker_page
+    _worker_page = ReportPage(output_dir, formats, dpi)
+
+
+def _render_batch(task):
+    """Simulate one batch of (index, specs) pairs together and render each design's report."""
+    indices, specs_list = zip(*task)
+    batch = BatchPhysCalcs(specs_list)
+    t, x, y, vx, vy = batch.simulate()
+    summaries = batch.summarize(t, y, vx, vy, x)
+    written = []
+    for j, (index, specs) in enumerate(task):
+        name = f"design_{index:05d}_{spec_hash(specs)}"
+        summary = {key: values[j] for key, values in summaries.items()}
+        paths = _worker_page.render(name, batch.specs[j], t, x[j], y[j], vx[j], vy[j], summary)
+        written.append((index, paths))
+    return written
+
+
+class ReportRenderer:
+    """
+    Headless per-design reports for a sweep, rendered with Agg across a process pool.
+
+    Designs are simulated in batches with BatchPhysCalcs, and each worker
+    renders its batches on its own reused ReportPage.
+    """
+
+    def __init__(self, output_dir, formats=FORMATS, dpi=DPI, workers=None, batch_size=8):
+        self.output_dir = output_dir
+        self.formats = tuple(formats)
+        self.dpi = dpi
+        self.workers = workers if workers is not None else mp.cpu_count()
+        self.batch_size = batch_size
+
+    def run(self, rocket_specs_list):
+        """Render every design; returns the written paths per design, in input order."""
+        rocket_specs_list = list(rocket_specs_list)
+        os.makedirs(self.output_dir, exist_ok=True)
+        indexed = list(enumerate(rocket_specs_list))
+        tasks = [indexed[i:i + self.batch_size] for i in range(0, len(indexed), self.batch_size)]
+        initargs = (self.output_dir, self.formats, self.dpi)
+
+        global _worker_page
+        if self.workers <= 1:
+            _init_worker(*initargs)
+            done = [_render_batch(task) for task in tasks]
+            _worker_page = None
+        else:
+            with mp.Pool(self.workers, initializer=_init_worker, initargs=initargs) as pool:
+                done = list(pool.imap_unordered(_render_batch, tasks))
+
+        paths = [None] * len(rocket_specs_list)
+        for written in done:
+            for index, design_paths in written:
+                paths[index] = design_paths
+        return paths
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Render headless design reports for a sweep.")
+    parser.add_argument("specs", help="JSON file with a list of rocket specs dicts")
+    parser.add_argument("output_dir")
+    parser.add_argument("--formats", default="png", help="Comma-separated, e.g. png,pdf")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with open(args.specs, "r") as file:
+        designs = json.load(file)
+    start = time.perf_counter()
+    ReportRenderer(args.output_dir, args.formats.split(","), workers=args.workers).run(designs)
+    print(f"Rendered {len(designs)} reports in {time.perf_counter() - start:.1f} s")
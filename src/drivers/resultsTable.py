@@ -0,0 +1,182 @@
+import json
+import os
+import numpy as np
+from PyQt5 import QtCore
+from src.drivers.shardedSweep import STUDY, load_columns
+from src.drivers.specUtils import motor_class
+
+# Columns shown when present in a results file: name -> (header, format)
+COLUMNS = {
+    "run": ("Run", "{:.0f}"),
+    "apogee": ("Apogee (m)", "{:.1f}"),
+    "flight_time": ("Flight Time (s)", "{:.1f}"),
+    "max_velocity": ("Max Velocity (m/s)", "{:.1f}"),
+    "landing_x": ("Landing X (m)", "{:.1f}"),
+    "static_margin": ("Margin (cal)", "{:.2f}"),
+    "total_impulse": ("Motor (N s)", None),  # Class letter and impulse
+    "thrust": ("Thrust (N)", "{:.0f}"),
+    "burn_time": ("Burn Time (s)", "{:.2f}"),
+    "airframe_length": ("Airframe Length (in)", "{:.1f}"),
+    "airframe_diameter": ("Airframe Diameter (in)", "{:.1f}"),
+    "nose_cone_length": ("Nose Cone Length (in)", "{:.1f}"),
+    "fin_semi_span": ("Fin Semi-Span (in)", "{:.1f}"),
+    "fin_root_chord": ("Fin Root Chord (in)", "{:.1f}"),
+    "fin_tip_chord": ("Fin Tip Chord (in)", "{:.1f}"),
+}
+
+
+class ResultsTable:
+    """
+    Sweep results as NumPy columns behind a sortable, filterable row view.
+
+    Columns are memory-mapped from a save_columns directory (e.g. a sharded
+    sweep's merged/ results), so opening a file reads no data until a column
+    is sorted, filtered or shown. The visible rows are one index array into
+    the columns: filters are boolean masks over whole columns and sorting is
+    one argsort of a gathered column, so neither ever loops over rows in
+    Python. Missing values (NaN) never pass a filter and always sort last.
+    """
+
+    def __init__(self, columns, study_dir=None):
+        self.columns = columns
+        self.names = [name for name in COLUMNS if name in columns]
+        self.n_rows = len(next(iter(columns.values()))) if columns else 0
+        self.study_dir = study_dir
+        self.shard_size = None
+        if study_dir is not None:
+            with open(os.path.join(study_dir, STUDY), "r") as file:
+                self.shard_size = json.load(file)["shard_size"]
+        self.filters = {}  # column -> (low, high), either bound may be None
+        self.valid_only = False
+        self.sort_key = None  # (column, descending)
+        self.view = np.arange(self.n_rows)
+        self._shard = (None, None)  # Last loaded manifest: (index, {run: specs})
+
+    @classmethod
+    def open(cls, path):
+        """Open a results directory, or a sharded sweep directory's merged results."""
+        if os.path.exists(os.path.join(path, STUDY)):
+            study_dir, path = path, os.path.join(path, "merged")
+        else:
+            parent = os.path.dirname(os.path.abspath(path))
+            study_dir = parent if os.path.exists(os.path.join(parent, STUDY)) else None
+        if not os.path.isdir(path):
+            raise FileNotFoundError(f"No results directory at {path}.")
+        return cls(load_columns(path, mmap_mode="r"), study_dir)
+
+    def __len__(self):
+        return len(self.view)
+
+    def value(self, row, name):
+        """Value of a column at a visible row."""
+        return self.columns[name][self.view[row]]
+
+    def set_filter(self, name, low=None, high=None):
+        """Keep rows with low <= value <= high; pass no bounds to remove the column's filter."""
+        if low is None and high is None:
+            self.filters.pop(name, None)
+        else:
+            self.filters[name] = (low, high)
+        self._update_view()
+
+    def set_valid_only(self, valid_only):
+        self.valid_only = valid_only
+        self._update_view()
+
+    def sort(self, name, descending=False):
+        self.sort_key = (name, descending)
+        self._sort()
+
+    def _update_view(self):
+        mask = np.ones(self.n_rows, dtype=bool)
+        if self.valid_only and "valid" in self.columns:
+            mask &= self.columns["valid"]
+        for name, (low, high) in self.filters.items():
+            values = self.columns[name]
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        self.view = np.flatnonzero(mask)
+        self._sort()
+
+    def _sort(self):
+        if self.sort_key is None:
+            return
+        name, descending = self.sort_key
+        values = np.asarray(self.columns[name][self.view], dtype=float)
+        # Negating rather than reversing keeps ties in run order and NaN last
+        order = np.argsort(-values if descending else values, kind="stable")
+        self.view = self.view[order]
+
+    def design(self, row):
+        """Specs dict of the design at a visible row, read from its sweep's shard manifest."""
+        if self.study_dir is None:
+            raise LookupError("These results have no sweep manifests to load designs from.")
+        run = int(self.columns["run"][self.view[row]]) if "run" in self.columns else int(self.view[row])
+        shard = run // self.shard_size
+        if self._shard[0] != shard:
+            with open(os.path.join(self.study_dir, "shards", f"shard_{shard:05d}.json"), "r") as file:
+                self._shard = (shard, {r: specs for r, specs in json.load(file)["runs"]})
+        return self._shard[1][run]
+
+
+class ResultsTableModel(QtCore.QAbstractTableModel):
+    """
+    Qt model over a ResultsTable for a QTableView.
+
+    The view asks only for the cells on screen, so a million rows cost no more
+    to show than a hundred; cells are formatted on request and never stored.
+    """
+
+    def __init__(self, table=None, parent=None):
+        super().__init__(parent)
+        self.table = table if table is not None else ResultsTable({})
+
+    def set_table(self, table):
+        self.beginResetModel()
+        self.table = table
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.table)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.table.names)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.TextAlignmentRole:
+            return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        name = self.table.names[index.column()]
+        value = float(self.table.value(index.row(), name))
+        if np.isnan(value):
+            return "-"
+        if name == "total_impulse":
+            return f"{motor_class(value)} {value:.0f}" if value > 0 else f"{value:.0f}"
+        return COLUMNS[name][1].format(value)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return COLUMNS[self.table.names[section]][0]
+        return None
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        if not 0 <= column < len(self.table.names):  # e.g. the view's initial sort of an empty table
+            return
+        self.beginResetModel()  # Every row moves, so selections are dropped rather than remapped
+        self.table.sort(self.table.names[column], descending=order == QtCore.Qt.DescendingOrder)
+        self.endResetModel()
+
+    def set_filter(self, name, low=None, high=None):
+        self.beginResetModel()
+        self.table.set_filter(name, low, high)
+        self.endResetModel()
+
+    def set_valid_only(self, valid_only):
+        self.beginResetModel()
+        self.table.set_valid_only(valid_only)
+        self.endResetModel()
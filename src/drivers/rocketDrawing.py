@@ -1,73 +1,85 @@
-import matplotlib.pyplot as plt
 import numpy as np
+from src.drivers.rocketSpec import INCH, RocketSpec
 
 class RocketDrawing:
     def __init__(self, rocket_specs, cg, cp):
-        self.rocket_specs = rocket_specs
+        # Accept a compiled RocketSpec or a raw specs dict
+        self.spec = rocket_specs if isinstance(rocket_specs, RocketSpec) else RocketSpec.from_dict(rocket_specs)
         self.cg = cg  # Center of Gravity
         self.cp = cp  # Center of Pressure
-        self.motor = self.rocket_specs["motor"]
         # Extract rocket components
-        self.airframe = self.rocket_specs["air_frame"]
-        self.nose_cone = self.rocket_specs["nose_cone"]
-        self.fins = self.rocket_specs["fins"]
+        self.motor = self.spec.motor
+        self.airframe = self.spec.air_frame
+        self.nose_cone = self.spec.nose_cone
+        self.fins = self.spec.fins
 
-        # Create a plot
-        self.fig, self.ax = plt.subplots()
+    @staticmethod
+    def _plot_lines(ax, lines):
+        for line_x, line_y, style in lines:
+            ax.plot(line_x, line_y, **style)
 
-    def draw_airframe(self,ax):
-        diameter = self.airframe["diameter"]
-        length = self.airframe["length"]
+    def airframe_lines(self):
+        """Airframe outline as (x, y, style) polylines in inches."""
+        diameter = self.airframe.diameter / INCH  # Drawing units are inches
+        length = self.airframe.length / INCH
 
         if diameter > 0 and length > 0:
             airframe_x = np.array([0, 0, length, length, 0])
             airframe_y = np.array([-diameter / 2, diameter / 2, diameter / 2, -diameter / 2, -diameter / 2])
-            ax.plot(airframe_x, airframe_y, color='blue')
-        else:
-            print("Airframe dimensions are invalid (zero or negative).")
+            return [(airframe_x, airframe_y, {"color": 'blue'})]
+        print("Airframe dimensions are invalid (zero or negative).")
+        return []
 
-    def draw_nose_cone(self,ax):
-        diameter = self.airframe["diameter"]
-        length = self.nose_cone["length"]
-        shape = self.nose_cone["shape"]
-        airframe_length = self.airframe["length"]
+    def draw_airframe(self,ax):
+        self._plot_lines(ax, self.airframe_lines())
+
+    def nose_cone_lines(self):
+        """Nose cone outline as (x, y, style) polylines in inches."""
+        diameter = self.airframe.diameter / INCH
+        length = self.nose_cone.length / INCH
+        shape = self.nose_cone.shape
+        airframe_length = self.airframe.length / INCH
 
         if length > 0:
             if shape == "conic":
                 nose_x = np.array([airframe_length, airframe_length + length, airframe_length])
                 nose_y = np.array([-diameter / 2, 0, diameter / 2])
-                ax.plot(nose_x, nose_y, color='green')
+                return [(nose_x, nose_y, {"color": 'green'})]
             elif shape == "elliptic":
                 theta = np.linspace(-np.pi / 2, np.pi / 2, 100)
                 nose_x = airframe_length + length * np.cos(theta)
                 nose_y = (diameter / 2) * np.sin(theta)
-                ax.plot(nose_x, nose_y, color='purple')
+                return [(nose_x, nose_y, {"color": 'purple'})]
             elif shape == "tangent_ogive":
                 # Parabolic nose cone
                 a = (diameter / 2) / (length**2)  # Corrected coefficient
                 nose_x = np.linspace(airframe_length, airframe_length + length, 100)
                 nose_y = a * (nose_x - airframe_length)**2 - (diameter / 2)
-                ax.plot(nose_x, nose_y, color='red')  # Top curve
-                ax.plot(nose_x, -nose_y, color='red')  # Bottom curve
+                return [(nose_x, nose_y, {"color": 'red'}),  # Top curve
+                        (nose_x, -nose_y, {"color": 'red'})]  # Bottom curve
             elif shape == "parabolic":
                 # Parabolic nose cone
                 a = (diameter / 2) / (length**2)  # Corrected coefficient
                 nose_x = np.linspace(airframe_length, airframe_length + length, 100)
                 nose_y = a * (nose_x - airframe_length)**2 - (diameter / 2)
-                ax.plot(nose_x, nose_y, color='red')  # Top curve
-                ax.plot(nose_x, -nose_y, color='red')  # Bottom curve
+                return [(nose_x, nose_y, {"color": 'red'}),  # Top curve
+                        (nose_x, -nose_y, {"color": 'red'})]  # Bottom curve
             else:
                 print(f"Unknown nose cone shape: {shape}. Skipping nose cone.")
         else:
             print("Nose cone length is invalid (zero or negative).")
+        return []
 
-    def draw_fins(self,ax):
-        """Plot the fins symmetrically on both sides of the rocket."""
-        root_chord = self.fins["root_chord"]  # Root chord length in inches
-        tip_chord = self.fins["tip_chord"]  # Tip chord length in inches
-        semi_span = self.fins["semi_span"]  # Semi-span in inches
-        sweep_angle_deg = self.fins["sweep_angle"]  # Sweep angle in degrees
-        diameter = self.airframe["diameter"]  # Airframe diameter in inches
+    def draw_nose_cone(self,ax):
+        self._plot_lines(ax, self.nose_cone_lines())
+
+    def fin_lines(self):
+        """Fin outlines, symmetric on both sides of the rocket, as (x, y, style) polylines in inches."""
+        root_chord = self.fins.root_chord / INCH  # Root chord length in inches
+        tip_chord = self.fins.tip_chord / INCH  # Tip chord length in inches
+        semi_span = self.fins.semi_span / INCH  # Semi-span in inches
+        sweep_angle_deg = self.fins.sweep_angle  # Sweep angle in degrees
+        diameter = self.airframe.diameter / INCH  # Airframe diameter in inches
 
         if root_chord > 0 and semi_span > 0:
             # Convert sweep angle to radians
@@ -77,6 +89,7 @@ class RocketDrawing:
             #fin_tip_x = root_chord - (semi_span * np.tan(sweep_angle_rad)) + tip_chord
             fin_tip_x = root_chord * np.cos(sweep_angle_rad) + (semi_span * np.sin(sweep_angle_rad))
 
+            lines = []
             for sign in [-1, 1]:  # Top (+1) and bottom (-1) fins
                 # Define the fin polygon points
                 fin_base_x = np.array([0, 0, tip_chord, root_chord])
@@ -87,16 +100,19 @@ class RocketDrawing:
                     sign * (diameter / 2) # Return to airframe edge
                 ])
 
-                # Plot the fin
-                ax.plot(fin_base_x, fin_base_y, color='red')
-        else:
-            print("Fin dimensions are invalid (zero or negative).")
+                lines.append((fin_base_x, fin_base_y, {"color": 'red'}))
+            return lines
+        print("Fin dimensions are invalid (zero or negative).")
+        return []
 
-    def draw_motor(self, ax):
-        """Plot the motor at the aft end of the rocket."""
-        motor_diameter = self.motor["diameter"] / 25.4  # Convert mm to inches
-        motor_length = self.motor["length"] / 25.4  # Convert mm to inches
-        airframe_diameter = self.airframe["diameter"]
+    def draw_fins(self,ax):
+        """Plot the fins symmetrically on both sides of the rocket."""
+        self._plot_lines(ax, self.fin_lines())
+
+    def motor_lines(self):
+        """Motor outline at the aft end of the rocket as (x, y, style) polylines in inches."""
+        motor_diameter = self.motor.diameter / INCH  # Inches
+        motor_length = self.motor.length / INCH  # Inches
 
         motor_x = np.array([0, motor_length, motor_length, 0, 0])
         motor_y = np.array([-motor_diameter / 2, -motor_diameter / 2, motor_diameter / 2, motor_diameter / 2, -motor_diameter / 2])
@@ -105,11 +121,19 @@ class RocketDrawing:
         motor_x = np.array([0, motor_length, motor_length, 0, 0])
         motor_y = np.array([-motor_diameter / 2, -motor_diameter / 2, motor_diameter / 2, motor_diameter / 2, -motor_diameter / 2])
 
-        ax.plot(motor_x, motor_y, color='orange', label='Motor')
+        return [(motor_x, motor_y, {"color": 'orange', "label": 'Motor'})]
+
+    def draw_motor(self, ax):
+        """Plot the motor at the aft end of the rocket."""
+        self._plot_lines(ax, self.motor_lines())
+
+    def outline(self):
+        """Every outline polyline of the rocket, nose along +x, as (x, y, style) tuples in inches."""
+        return self.airframe_lines() + self.nose_cone_lines() + self.fin_lines() + self.motor_lines()
 
     def draw_cg_cp(self, ax):
         """Plot CG and CP as points on the rocket."""
-        diameter = self.airframe["diameter"]
+        diameter = self.airframe.diameter / INCH
 
         # Plot CG as a red dot
         ax.scatter([self.cg], [0], color='red', s=50, label='CG')
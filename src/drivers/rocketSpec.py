@@ -0,0 +1,189 @@
+import json
+import math
+from dataclasses import dataclass
+import numpy as np
+
+# SI value of one unit of each unit used in rocket_specs.json
+INCH = 0.0254  # m
+MILLIMETER = 0.001  # m
+GRAM = 0.001  # kg
+SQUARE_INCH = INCH**2  # m²
+GRAM_PER_CM3 = 1000.0  # kg/m³
+
+NOSE_CONE_SHAPES = ("tangent_ogive", "elliptic", "conic", "parabolic")
+
+
+@dataclass(frozen=True, slots=True)
+class MotorSpec:
+    thrust: float  # N
+    burn_time: float  # s
+    mass: float  # kg
+    length: float  # m
+    diameter: float  # m
+
+
+@dataclass(frozen=True, slots=True)
+class FinSpec:
+    form: int  # Number of fins
+    sweep_angle: float  # deg
+    tip_chord: float  # m
+    semi_span: float  # m
+    root_chord: float  # m
+
+
+@dataclass(frozen=True, slots=True)
+class AirFrameSpec:
+    diameter: float  # m
+    length: float  # m
+
+
+@dataclass(frozen=True, slots=True)
+class NoseConeSpec:
+    shape: str
+    length: float  # m
+
+
+@dataclass(frozen=True, slots=True)
+class LaunchConditionsSpec:
+    wind: float  # m/s
+    altitude: float  # m
+
+
+@dataclass(frozen=True, slots=True)
+class ParachuteSpec:
+    cd: float
+    mass: float  # kg
+    area: float  # m²
+
+
+@dataclass(frozen=True, slots=True)
+class MaterialSpec:
+    density: float  # kg/m³
+    thickness: float  # m
+
+
+# JSON unit of every numeric field: (section, key) -> SI value of one JSON unit
+JSON_UNITS = {
+    ("motor", "thrust"): 1.0,
+    ("motor", "burn_time"): 1.0,
+    ("motor", "mass"): GRAM,
+    ("motor", "length"): MILLIMETER,
+    ("motor", "diameter"): MILLIMETER,
+    ("fins", "sweep_angle"): 1.0,
+    ("fins", "tip_chord"): INCH,
+    ("fins", "semi_span"): INCH,
+    ("fins", "root_chord"): INCH,
+    ("air_frame", "diameter"): INCH,
+    ("air_frame", "length"): INCH,
+    ("nose_cone", "length"): INCH,
+    ("launch_conditions", "wind"): 1.0,
+    ("launch_conditions", "altitude"): 1.0,
+    ("parachute", "cd"): 1.0,
+    ("parachute", "mass"): GRAM,
+    ("parachute", "area"): SQUARE_INCH,
+    ("material", "density"): GRAM_PER_CM3,
+    ("material", "thickness"): MILLIMETER,
+}
+
+# Fields that may be zero; every other numeric field must be strictly positive
+_NON_NEGATIVE = {("fins", "sweep_angle"), ("fins", "tip_chord"), ("launch_conditions", "altitude")}
+_SIGNED = {("launch_conditions", "wind")}
+
+
+def _field(rocket_specs, section, key):
+    """Read one numeric field, check it and convert it to SI."""
+    try:
+        value = rocket_specs[section][key]
+    except (KeyError, TypeError):
+        raise ValueError(f"Rocket specs are missing {section}.{key}.")
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"{section}.{key} must be a finite number, got {value!r}.")
+    if (section, key) in _NON_NEGATIVE and value < 0:
+        raise ValueError(f"{section}.{key} must not be negative, got {value}.")
+    if (section, key) not in _NON_NEGATIVE | _SIGNED and value <= 0:
+        raise ValueError(f"{section}.{key} must be positive, got {value}.")
+    return float(value) * JSON_UNITS[(section, key)]
+
+
+def field_column(section, key, values):
+    """Check a column of one numeric field over many designs by the rules of _field and convert it to SI."""
+    values = np.asarray(values, dtype=float)
+    if (section, key) in _SIGNED:
+        bad, rule = ~np.isfinite(values), "a finite number"
+    elif (section, key) in _NON_NEGATIVE:
+        bad, rule = ~np.isfinite(values) | (values < 0), "finite and not negative"
+    else:
+        bad, rule = ~np.isfinite(values) | (values <= 0), "finite and positive"
+    if bad.any():
+        design = int(np.argmax(bad))
+        raise ValueError(f"{section}.{key} must be {rule}; design {design} has {values[design]}.")
+    return values * JSON_UNITS[(section, key)]
+
+
+@dataclass(frozen=True, slots=True)
+class RocketSpec:
+    """
+    Validated rocket specs in SI units.
+
+    rocket_specs.json stays the editable format (inches for the airframe, nose
+    cone and fins, mm and g for the motor, g/cm³ and mm for the material); it is
+    parsed once into this frozen object so the calculation modules read plain
+    attributes in consistent units instead of re-indexing and converting the
+    dict on every call. Invalid specs raise ValueError here, before any run.
+    """
+
+    motor: MotorSpec
+    fins: FinSpec
+    air_frame: AirFrameSpec
+    nose_cone: NoseConeSpec
+    launch_conditions: LaunchConditionsSpec
+    parachute: ParachuteSpec
+    material: MaterialSpec
+
+    @classmethod
+    def from_dict(cls, rocket_specs):
+        """Compile a rocket specs dict (JSON units) into a RocketSpec."""
+        def section(name, spec_class, keys):
+            return spec_class(**{key: _field(rocket_specs, name, key) for key in keys})
+
+        try:
+            form = rocket_specs["fins"]["form"]
+            shape = rocket_specs["nose_cone"]["shape"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Rocket specs are missing {e}.")
+        if isinstance(form, bool) or not isinstance(form, (int, float)) or form < 1 or int(form) != form:
+            raise ValueError(f"fins.form must be a positive whole number of fins, got {form!r}.")
+        if shape not in NOSE_CONE_SHAPES:
+            raise ValueError(f"Unknown nose cone shape {shape!r}; expected one of {', '.join(NOSE_CONE_SHAPES)}.")
+
+        fin_fields = {key: _field(rocket_specs, "fins", key)
+                      for key in ("sweep_angle", "tip_chord", "semi_span", "root_chord")}
+        spec = cls(
+            motor=section("motor", MotorSpec, ("thrust", "burn_time", "mass", "length", "diameter")),
+            fins=FinSpec(form=int(form), **fin_fields),
+            air_frame=section("air_frame", AirFrameSpec, ("diameter", "length")),
+            nose_cone=NoseConeSpec(shape=shape, length=_field(rocket_specs, "nose_cone", "length")),
+            launch_conditions=section("launch_conditions", LaunchConditionsSpec, ("wind", "altitude")),
+            parachute=section("parachute", ParachuteSpec, ("cd", "mass", "area")),
+            material=section("material", MaterialSpec, ("density", "thickness")),
+        )
+        if spec.material.thickness >= spec.air_frame.diameter / 2:
+            raise ValueError("material.thickness must be smaller than the airframe radius.")
+        return spec
+
+    @classmethod
+    def load(cls, path):
+        """Read and compile a rocket specs JSON file."""
+        with open(path, "r") as file:
+            return cls.from_dict(json.load(file))
+
+    def to_dict(self):
+        """Convert back to a rocket specs dict in JSON units."""
+        rocket_specs = {
+            "motor": {}, "fins": {"form": self.fins.form}, "air_frame": {},
+            "nose_cone": {"shape": self.nose_cone.shape}, "launch_conditions": {},
+            "parachute": {}, "material": {},
+        }
+        for (section, key), unit in JSON_UNITS.items():
+            rocket_specs[section][key] = getattr(getattr(self, section), key) / unit
+        return rocket_specs
@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+import numpy as np
+from matplotlib import colormaps
+from src.drivers.specUtils import spec_hash
+
+HISTORY_SIZE = 8  # Runs kept
+HISTORY_POINTS = 256  # Samples per stored trajectory
+
+
+@dataclass(frozen=True, slots=True)
+class RunRecord:
+    """One stored run: downsampled trajectory (views into the history's slots) and its summary."""
+
+    run: int  # Sequence number within the session
+    spec_hash: str
+    summary: dict
+    t: np.ndarray
+    y: np.ndarray
+    speed: np.ndarray
+
+    @property
+    def label(self):
+        return f"Run {self.run}"
+
+
+class RunHistory:
+    """
+    Ring buffer of the last capacity simulation runs.
+
+    Trajectories are resampled onto `points` uniform time steps and stored as
+    float32 in slots allocated once, so memory is fixed however many runs are
+    added. Re-running a design already in the history (same spec hash)
+    overwrites its slot and makes it the newest run instead of adding a copy.
+    """
+
+    def __init__(self, capacity=HISTORY_SIZE, points=HISTORY_POINTS):
+        self.capacity = capacity
+        self.points = points
+        self.t = np.zeros((capacity, points), dtype=np.float32)
+        self.y = np.zeros((capacity, points), dtype=np.float32)
+        self.speed = np.zeros((capacity, points), dtype=np.float32)
+        self.meta = [None] * capacity  # (run, spec_hash, summary) per slot
+        self.order = []  # Occupied slots, oldest first
+        self.n_runs = 0
+
+    def __len__(self):
+        return len(self.order)
+
+    @property
+    def nbytes(self):
+        return self.t.nbytes + self.y.nbytes + self.speed.nbytes
+
+    def add(self, rocket_specs, t, y, speed, summary):
+        """Store a run and return its RunRecord."""
+        key = spec_hash(rocket_specs)
+        slot = next((s for s in self.order if self.meta[s][1] == key), None)
+        if slot is not None:
+            self.order.remove(slot)
+        elif len(self.order) < self.capacity:
+            slot = len(self.order)
+        else:
+            slot = self.order.pop(0)
+
+        samples = np.linspace(t[0], t[-1], self.points)
+        self.t[slot] = samples
+        self.y[slot] = np.interp(samples, t, y)
+        self.speed[slot] = np.interp(samples, t, speed)
+        self.n_runs += 1
+        self.meta[slot] = (self.n_runs, key, dict(summary))
+        self.order.append(slot)
+        return self._record(slot)
+
+    def runs(self):
+        """Stored runs, oldest first."""
+        return [self._record(slot) for slot in self.order]
+
+    def clear(self):
+        self.order = []
+        self.meta = [None] * self.capacity
+
+    def _record(self, slot):
+        run, key, summary = self.meta[slot]
+        return RunRecord(run, key, summary, self.t[slot], self.y[slot], self.speed[slot])
+
+
+class RunOverlay:
+    """
+    Earlier runs drawn on a flight plot's axes.
+
+    One Line2D per history slot is created up front and reused: update() only
+    swaps the data, colors and visibility, so redrawing an overlay never adds
+    artists to the axes.
+    """
+
+    def __init__(self, ax, capacity=HISTORY_SIZE):
+        self.ax = ax
+        self.colors = colormaps["tab10"]
+        self.lines = [ax.plot([], [], linewidth=1.2, visible=False)[0] for _ in range(capacity)]
+
+    def update(self, records):
+        """Show the given runs (oldest first), hiding unused lines; returns the visible lines."""
+        records = records[-len(self.lines):]
+        visible = []
+        for i, line in enumerate(self.lines):
+            if i < len(records):
+                record = records[i]
+                line.set_data(record.t, record.y)
+                line.set_color(self.colors(record.run % 10))  # A run keeps its color as older ones drop out
+                line.set_alpha(0.35 + 0.5 * (i + 1) / len(records))
+                line.set_label(f"{record.label}: {record.summary['apogee']:.0f}")
+                line.set_visible(True)
+                visible.append(line)
+            else:
+                line.set_visible(False)
+                line.set_label("_hidden")
+        return visible
+
+    def hide(self):
+        for line in self.lines:
+            line.set_visible(False)
@@ -0,0 +1,182 @@
+import json
+import os
+import threading
+import time
+from src.drivers.ensembleStats import TDigest
+
+EXPORT_INTERVAL = 10.0  # s between metric exports
+PREFIX = "rocket"  # Prometheus metric name prefix
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class RunMetrics:
+    """
+    Operational metrics of a long batch, sweep or service run.
+
+    Producers report finished tasks with record() (a task is one batch of runs
+    integrated together, so each of its runs took the task's wall time), cache
+    lookups with record_cache() and pending work with set_queue_depth(). All of
+    it is plain counters and one TDigest behind a lock, so recording costs
+    microseconds next to an integration.
+
+    start() exports a snapshot every interval seconds from a background
+    thread (and stop() once more at the end): the Prometheus text file is
+    rewritten atomically, ready for a node_exporter textfile collector, and one
+    JSON line is appended to the time series. Rates and utilizations cover the
+    last interval, so a stalled or slow worker shows up in the next export;
+    per-worker seconds since the last finished task point at stragglers.
+    """
+
+    def __init__(self, prometheus_path=None, jsonl_path=None, interval=EXPORT_INTERVAL, prefix=PREFIX,
+                 clock=time.monotonic):
+        self.prometheus_path = prometheus_path
+        self.jsonl_path = jsonl_path
+        self.interval = interval
+        self.prefix = prefix
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.counters = {"runs": 0, "tasks": 0, "failures": 0, "cache_hits": 0, "cache_misses": 0}
+        self.latency = TDigest()  # s per run
+        self.latency_sum = 0.0
+        self.queue_depth = 0
+        self.workers = {}  # worker -> {"runs", "busy_seconds", "window_busy", "first_start", "last_done"}
+        self.started = self.clock()
+        self._window = (self.started, 0)  # Start time and run count at the last export
+        self._stop = threading.Event()
+        self._thread = None
+
+    def record(self, runs, seconds, worker=None, failures=0):
+        """One finished task: its run count, wall time (s), the worker that ran it and its failed runs."""
+        worker = str(worker if worker is not None else os.getpid())
+        with self.lock:
+            self.counters["runs"] += runs
+            self.counters["tasks"] += 1
+            self.counters["failures"] += failures
+            if runs:
+                self.latency.add(seconds, runs)
+            self.latency_sum += seconds * runs
+            now = self.clock()
+            stats = self.workers.setdefault(worker, {"runs": 0, "busy_seconds": 0.0, "window_busy": 0.0,
+                                                     "first_start": now - seconds, "last_done": None})
+            stats["runs"] += runs
+            stats["busy_seconds"] += seconds
+            # Only the part of the task inside the current window counts towards its utilization
+            stats["window_busy"] += min(seconds, now - self._window[0])
+            stats["last_done"] = now
+
+    def record_failures(self, count=1):
+        """Failures outside a finished task, e.g. designs rejected before integration."""
+        with self.lock:
+            self.counters["failures"] += count
+
+    def record_cache(self, hit):
+        with self.lock:
+            self.counters["cache_hits" if hit else "cache_misses"] += 1
+
+    def set_queue_depth(self, depth):
+        with self.lock:
+            self.queue_depth = depth
+
+    def snapshot(self, advance=False):
+        """Current metrics as a dict; advance=True starts a new rate window (used by export)."""
+        with self.lock:
+            now = self.clock()
+            window_start, window_runs = self._window
+            window = max(now - window_start, 1e-9)
+            elapsed = max(now - self.started, 1e-9)
+            lookups = self.counters["cache_hits"] + self.counters["cache_misses"]
+            snapshot = {
+                **self.counters,
+                "elapsed_seconds": elapsed,
+                "runs_per_second": (self.counters["runs"] - window_runs) / window,
+                "mean_runs_per_second": self.counters["runs"] / elapsed,
+                "queue_depth": self.queue_depth,
+                "cache_hit_rate": self.counters["cache_hits"] / lookups if lookups else None,
+                "latency_seconds": {f"p{round(q * 100)}": self.latency.quantile(q) if self.latency.count else None
+                                    for q in QUANTILES},
+                "workers": {
+                    worker: {
+                        "runs": stats["runs"],
+                        "utilization": stats["window_busy"] / window,
+                        "mean_utilization": stats["busy_seconds"] / max(now - stats["first_start"], 1e-9),
+                        "seconds_since_done": now - stats["last_done"],
+                    }
+                    for worker, stats in self.workers.items()
+                },
+            }
+            if advance:
+                self._window = (now, self.counters["runs"])
+                for stats in self.workers.values():
+                    stats["window_busy"] = 0.0
+            return snapshot
+
+    def prometheus_text(self, snapshot):
+        """Prometheus text exposition of a snapshot."""
+        p = self.prefix
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+            for labels, value in samples:
+                if value is not None:
+                    lines.append(f"{p}_{name}{labels} {value:.6g}")
+
+        metric("runs_total", "counter", "Simulation runs finished.", [("", snapshot["runs"])])
+        metric("failures_total", "counter", "Runs that failed or gave no result.", [("", snapshot["failures"])])
+        metric("runs_per_second", "gauge", "Runs finished per second over the last interval.",
+               [("", snapshot["runs_per_second"])])
+        metric("queue_depth", "gauge", "Tasks waiting or running.", [("", snapshot["queue_depth"])])
+        metric("cache_hits_total", "counter", "Cache lookups that found a result.", [("", snapshot["cache_hits"])])
+        metric("cache_misses_total", "counter", "Cache lookups that missed.", [("", snapshot["cache_misses"])])
+        metric("cache_hit_ratio", "gauge", "Share of cache lookups that hit.", [("", snapshot["cache_hit_rate"])])
+        quantiles = [(f'{{quantile="{q}"}}', snapshot["latency_seconds"][f"p{round(q * 100)}"]) for q in QUANTILES]
+        metric("run_latency_seconds", "summary", "Wall time from task start to a run's result.",
+               quantiles + [("_sum", self.latency_sum), ("_count", snapshot["runs"])])  # Name suffixes
+        workers = snapshot["workers"].items()
+        metric("worker_utilization", "gauge", "Share of the last interval each worker spent on tasks.",
+               [(f'{{worker="{w}"}}', stats["utilization"]) for w, stats in workers])
+        metric("worker_mean_utilization", "gauge", "Share of the time since each worker's first task spent on tasks.",
+               [(f'{{worker="{w}"}}', stats["mean_utilization"]) for w, stats in workers])
+        metric("worker_seconds_since_done", "gauge", "Seconds since each worker last finished a task.",
+               [(f'{{worker="{w}"}}', stats["seconds_since_done"]) for w, stats in workers])
+        return "\n".join(lines) + "\n"
+
+    def export(self):
+        """Write one snapshot to the configured files and return it."""
+        snapshot = self.snapshot(advance=True)
+        if self.prometheus_path:
+            temp_path = f"{self.prometheus_path}.tmp-{os.getpid()}"
+            with open(temp_path, "w") as file:
+                file.write(self.prometheus_text(snapshot))
+            os.replace(temp_path, self.prometheus_path)
+        if self.jsonl_path:
+            with open(self.jsonl_path, "a") as file:
+                file.write(json.dumps({"time": time.time(), **snapshot}) + "\n")
+        return snapshot
+
+    def start(self):
+        """Export every interval from a daemon thread until stop()."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="run-metrics", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the exporter thread and write a final export."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        return self.export()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.export()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,98 @@
+import json
+import numpy as np
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.rocketSpec import RocketSpec
+from src.drivers.specUtils import numeric_fields, with_field
+
+
+class SensitivityAnalysis:
+    """
+    Central-difference sensitivities of apogee and flight time to every spec field.
+
+    Where the lower perturbation would be an invalid spec (e.g. a zero launch
+    altitude stepped below zero), a forward difference is used instead.
+
+    The baseline and all 2*P perturbed designs are integrated together through
+    BatchPhysCalcs, so the cost is one batched simulation instead of 2*P + 1
+    sequential PhysCalcs.simulate() calls.
+    """
+
+    def __init__(self, rocket_specs, rel_step=1e-2, abs_step=1e-3, fields=None):
+        self.rocket_specs = rocket_specs
+        self.rel_step = rel_step  # Step as a fraction of the field value
+        self.abs_step = abs_step  # Step used for fields whose value is zero
+        self.fields = list(fields) if fields is not None else numeric_fields(rocket_specs)
+
+    def step_size(self, value):
+        """Perturbation step for a field with the given nominal value."""
+        return self.rel_step * abs(value) if value != 0 else self.abs_step
+
+    def run(self, max_step=0.1):
+        """Compute the sensitivities and return rows ranked by apogee influence."""
+        designs = [self.rocket_specs]
+        steps, spans = [], []
+        for section, key in self.fields:
+            value = self.rocket_specs[section][key]
+            h = self.step_size(value)
+            steps.append(h)
+            lower = with_field(self.rocket_specs, section, key, value - h)
+            try:
+                RocketSpec.from_dict(lower)
+            except ValueError:
+                lower = self.rocket_specs  # Fall back to a forward difference
+            spans.append(h if lower is self.rocket_specs else 2 * h)
+            designs.append(with_field(self.rocket_specs, section, key, value + h))
+            designs.append(lower)
+
+        batch = BatchPhysCalcs(designs)
+        summary = batch.simulate(max_step=max_step, output="summary")
+        apogee, flight_time = summary["apogee"], summary["flight_time"]
+        steps, spans = np.array(steps), np.array(spans)
+
+        # Designs are laid out as [baseline, +h_0, -h_0, +h_1, -h_1, ...]
+        d_apogee = (apogee[1::2] - apogee[2::2]) / spans
+        d_flight_time = (flight_time[1::2] - flight_time[2::2]) / spans
+
+        rows = []
+        for i, (section, key) in enumerate(self.fields):
+            value = self.rocket_specs[section][key]
+            rows.append({
+                "section": section,
+                "key": key,
+                "value": value,
+                "step": steps[i],
+                "d_apogee": d_apogee[i],
+                "d_flight_time": d_flight_time[i],
+                # Normalized (elasticity) sensitivities: % change per % change of the field
+                "rel_apogee": d_apogee[i] * value / apogee[0],
+                "rel_flight_time": d_flight_time[i] * value / flight_time[0],
+            })
+
+        rows.sort(key=lambda row: abs(row["rel_apogee"]), reverse=True)
+        self.baseline = {"apogee": apogee[0], "flight_time": flight_time[0]}
+        self.rows = rows
+        return rows
+
+    def format_table(self, rows=None):
+        """Format the ranked sensitivities as a plain-text table."""
+        rows = self.rows if rows is None else rows
+        header = f"{'field':<28}{'value':>10}{'dApogee/dp':>14}{'dTime/dp':>12}{'rel apogee':>12}{'rel time':>10}"
+        lines = [header, "-" * len(header)]
+        for row in rows:
+            lines.append(
+                f"{row['section'] + '.' + row['key']:<28}{row['value']:>10.4g}"
+                f"{row['d_apogee']:>14.4g}{row['d_flight_time']:>12.4g}"
+                f"{row['rel_apogee']:>12.4f}{row['rel_flight_time']:>10.4f}"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    with open("../config/rocket_specs.json", "r") as file:
+        rocket_specs = json.load(file)
+
+    analysis = SensitivityAnalysis(rocket_specs)
+    analysis.run()
+    print(f"Baseline apogee: {analysis.baseline['apogee']:.1f} m, "
+          f"flight time: {analysis.baseline['flight_time']:.2f} s")
+    print(analysis.format_table())
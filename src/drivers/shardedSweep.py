@@ -0,0 +1,278 @@
+import json
+import os
+import shutil
+import socket
+import time
+import numpy as np
+from src.drivers.aeroArrays import AeroArrays
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.rocketSpec import RocketSpec
+from src.drivers.specUtils import spec_hash
+from src.drivers.sweepRunner import SUMMARY_FIELDS
+
+STUDY = "study.json"
+LEASE_SECONDS = 600  # A lock not refreshed for this long belongs to a crashed worker
+
+# Design inputs saved next to the results, in rocket_specs.json units: column -> (section, key)
+DESIGN_FIELDS = {
+    "thrust": ("motor", "thrust"),
+    "burn_time": ("motor", "burn_time"),
+    "airframe_length": ("air_frame", "length"),
+    "airframe_diameter": ("air_frame", "diameter"),
+    "nose_cone_length": ("nose_cone", "length"),
+    "fin_semi_span": ("fins", "semi_span"),
+    "fin_root_chord": ("fins", "root_chord"),
+    "fin_tip_chord": ("fins", "tip_chord"),
+}
+
+
+def save_columns(path, columns):
+    """Save a result set as one .npy file per column in a directory, atomically."""
+    temp_dir = f"{path}.tmp-{socket.gethostname()}-{os.getpid()}"
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    os.makedirs(temp_dir)
+    for name, values in columns.items():
+        np.save(os.path.join(temp_dir, f"{name}.npy"), np.asarray(values))
+    try:
+        os.rename(temp_dir, path)
+    except OSError:
+        # Another worker already wrote the same result
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        if not os.path.isdir(path):
+            raise
+
+
+def load_columns(path, mmap_mode=None):
+    """Load a directory written by save_columns as a dict of arrays."""
+    return {name[:-4]: np.load(os.path.join(path, name), mmap_mode=mmap_mode)
+            for name in sorted(os.listdir(path)) if name.endswith(".npy")}
+
+
+class ShardedSweep:
+    """
+    A sweep split into deterministic shards in a shared directory.
+
+    Layout:
+        study.json               run count, shard size, solver step and a hash of every design
+        shards/shard_00000.json  the (run index, specs) pairs of one shard
+        locks/shard_00000.lock   held by the worker computing the shard
+        results/shard_00000/     one .npy per summary and design column once the shard is done
+        merged/                  the combined result set written by merge()
+
+    Shard i always holds runs [i * shard_size, (i + 1) * shard_size), so creating
+    the same study twice gives identical manifests. Workers on any machine that
+    sees the directory claim shards with exclusive lock files; a result
+    directory is renamed into place only when complete, so a shard counts as
+    done exactly when its results exist. Locks of workers that stopped
+    refreshing them are reclaimed after LEASE_SECONDS.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, STUDY), "r") as file:
+            self.study = json.load(file)
+        self.n_shards = self.study["n_shards"]
+
+    @classmethod
+    def create(cls, directory, rocket_specs_list, shard_size=64, max_step=0.1):
+        """Write the study and shard manifests; reopening an identical study is a no-op."""
+        rocket_specs_list = list(rocket_specs_list)
+        study = {
+            "version": 1,
+            "n_runs": len(rocket_specs_list),
+            "shard_size": shard_size,
+            "n_shards": -(-len(rocket_specs_list) // shard_size),
+            "max_step": max_step,
+            "spec_hashes": [spec_hash(specs) for specs in rocket_specs_list],
+        }
+        study_path = os.path.join(directory, STUDY)
+        if os.path.exists(study_path):
+            with open(study_path, "r") as file:
+                if json.load(file) != study:
+                    raise ValueError(f"{directory} already holds a different study.")
+            return cls(directory)
+
+        for sub in ("shards", "locks", "results"):
+            os.makedirs(os.path.join(directory, sub), exist_ok=True)
+        for shard in range(study["n_shards"]):
+            runs = range(shard * shard_size, min((shard + 1) * shard_size, len(rocket_specs_list)))
+            _write_json(os.path.join(directory, "shards", f"shard_{shard:05d}.json"),
+                        {"shard": shard, "runs": [[run, rocket_specs_list[run]] for run in runs]})
+        # The study file is written last, so its presence means the manifests are complete
+        _write_json(study_path, study)
+        return cls(directory)
+
+    def _path(self, kind, shard):
+        suffix = {"shards": ".json", "locks": ".lock", "results": ""}[kind]
+        return os.path.join(self.directory, kind, f"shard_{shard:05d}{suffix}")
+
+    def is_done(self, shard):
+        return os.path.isdir(self._path("results", shard))
+
+    def pending(self):
+        """Shards without results."""
+        return [shard for shard in range(self.n_shards) if not self.is_done(shard)]
+
+    def claim(self, worker_id, lease_seconds=LEASE_SECONDS):
+        """Lock the first unfinished, unclaimed shard and return its index, or None."""
+        for shard in self.pending():
+            lock = self._path("locks", shard)
+            try:
+                age = time.time() - os.path.getmtime(lock)
+            except FileNotFoundError:
+                age = None
+            if age is not None:
+                if age < lease_seconds:
+                    continue
+                # Stale lock: only the worker whose rename succeeds takes it over
+                taken = f"{lock}.stale-{worker_id}"
+                try:
+                    os.rename(lock, taken)
+                except FileNotFoundError:
+                    continue
+                if time.time() - os.path.getmtime(taken) < lease_seconds:
+                    # Someone else reclaimed it after our check; hand their fresh lock back
+                    try:
+                        os.link(taken, lock)
+                    except FileExistsError:
+                        pass
+                    os.remove(taken)
+                    continue
+                os.remove(taken)
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                continue
+            with os.fdopen(fd, "w") as file:
+                json.dump({"worker": worker_id, "claimed": time.time()}, file)
+            if self.is_done(shard):  # Finished by someone else since pending() was read
+                self.release(shard)
+                continue
+            return shard
+        return None
+
+    def heartbeat(self, shard):
+        """Refresh a held lock so it is not reclaimed."""
+        try:
+            os.utime(self._path("locks", shard))
+        except FileNotFoundError:
+            pass  # Not locked (run directly) or reclaimed; results are idempotent either way
+
+    def release(self, shard):
+        try:
+            os.remove(self._path("locks", shard))
+        except FileNotFoundError:
+            pass
+
+    def run_shard(self, shard, batch_size=16, metrics=None):
+        """Simulate one shard and write its result directory; batches are reported to metrics if given."""
+        with open(self._path("shards", shard), "r") as file:
+            pairs = json.load(file)["runs"]
+        runs = np.array([run for run, _ in pairs], dtype=np.int64)
+        columns = {field: np.full(len(pairs), np.nan)
+                   for field in (*SUMMARY_FIELDS, "static_margin", "total_impulse", *DESIGN_FIELDS)}
+        columns["valid"] = np.zeros(len(pairs), dtype=bool)
+
+        # Invalid designs keep NaN results instead of failing the whole shard
+        valid = []
+        for i, (_, specs) in enumerate(pairs):
+            try:
+                valid.append((i, RocketSpec.from_dict(specs)))
+            except ValueError:
+                pass
+        if metrics is not None and len(valid) < len(pairs):
+            metrics.record_failures(len(pairs) - len(valid))
+        if valid:
+            rows = [i for i, _ in valid]
+            specs = [spec for _, spec in valid]
+            columns["static_margin"][rows] = AeroArrays.from_specs(specs).calculate_static_margin()
+            columns["total_impulse"][rows] = [spec.motor.thrust * spec.motor.burn_time for spec in specs]  # N s
+            for name, (section, key) in DESIGN_FIELDS.items():
+                columns[name][rows] = [pairs[i][1][section][key] for i in rows]
+        for start in range(0, len(valid), batch_size):
+            chunk = valid[start:start + batch_size]
+            rows = [i for i, _ in chunk]
+            start_time = time.perf_counter()
+            batch = BatchPhysCalcs([spec for _, spec in chunk])
+            summary = batch.simulate(max_step=self.study["max_step"], output="summary")
+            for field in SUMMARY_FIELDS:
+                columns[field][rows] = summary[field]
+            columns["valid"][rows] = True
+            self.heartbeat(shard)
+            if metrics is not None:
+                metrics.record(len(rows), time.perf_counter() - start_time,
+                               failures=int(np.count_nonzero(~np.isfinite(summary["apogee"]))))
+
+        save_columns(self._path("results", shard), {"run": runs, **columns})
+
+    def work(self, worker_id=None, batch_size=16, lease_seconds=LEASE_SECONDS, metrics=None):
+        """
+        Claim and run shards until none are left; returns the shards this worker finished.
+
+        With a RunMetrics, batches are reported as they finish and the queue
+        depth is the number of shards without results.
+        """
+        worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        finished = []
+        while True:
+            shard = self.claim(worker_id, lease_seconds)
+            if metrics is not None:
+                metrics.set_queue_depth(len(self.pending()))
+            if shard is None:
+                return finished
+            try:
+                self.run_shard(shard, batch_size, metrics)
+                finished.append(shard)
+            finally:
+                self.release(shard)
+
+    def merge(self, output=None):
+        """Combine every shard's results in run order; also saved to merged/ unless output is False."""
+        missing = self.pending()
+        if missing:
+            raise RuntimeError(f"{len(missing)} shard(s) have no results yet, e.g. shard {missing[0]}.")
+        parts = [load_columns(self._path("results", shard)) for shard in range(self.n_shards)]
+        merged = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+        if not np.array_equal(merged["run"], np.arange(self.study["n_runs"])):
+            raise RuntimeError("Shard results do not cover every run exactly once.")
+        if output is not False:
+            path = output or os.path.join(self.directory, "merged")
+            shutil.rmtree(path, ignore_errors=True)
+            save_columns(path, merged)
+        return merged
+
+
+def _write_json(path, data):
+    """Write JSON through a temporary file and an atomic rename."""
+    temp_path = f"{path}.tmp-{os.getpid()}"
+    with open(temp_path, "w") as file:
+        json.dump(data, file)
+    os.replace(temp_path, path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sharded sweeps over a shared directory.")
+    parser.add_argument("command", choices=("create", "work", "merge"))
+    parser.add_argument("directory")
+    parser.add_argument("--specs", help="JSON file with a list of rocket specs dicts (create)")
+    parser.add_argument("--shard-size", type=int, default=64)
+    parser.add_argument("--metrics", help="Path prefix for .prom and .jsonl throughput metrics (work)")
+    args = parser.parse_args()
+
+    if args.command == "create":
+        with open(args.specs, "r") as file:
+            sweep = ShardedSweep.create(args.directory, json.load(file), shard_size=args.shard_size)
+        print(f"{sweep.n_shards} shards written to {args.directory}")
+    elif args.command == "work":
+        from src.drivers.runMetrics import RunMetrics
+
+        if args.metrics:
+            with RunMetrics(f"{args.metrics}.prom", f"{args.metrics}.jsonl") as metrics:
+                print(f"Finished shards: {ShardedSweep(args.directory).work(metrics=metrics)}")
+        else:
+            print(f"Finished shards: {ShardedSweep(args.directory).work()}")
+    else:
+        merged = ShardedSweep(args.directory).merge()
+        print(f"Merged {len(merged['run'])} runs into {os.path.join(args.directory, 'merged')}")
@@ -0,0 +1,224 @@
+import asyncio
+import http.client
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from src.drivers.ensembleStats import TDigest
+from src.drivers.rocketSpec import RocketSpec
+from src.drivers.specUtils import spec_hash
+
+HOST = "127.0.0.1"
+PORT = 8765
+CACHE_SIZE = 1024  # Results kept for repeated designs
+MAX_BODY = 1 << 20  # bytes
+SUMMARY_FIELDS = ("apogee", "flight_time", "max_velocity", "landing_x")
+
+
+def _warm_worker():
+    """Import the physics stack once per worker so jobs never pay for it."""
+    import src.drivers.batchSim
+    import src.drivers.physCalcs
+
+
+def _simulate_job(rocket_specs, max_step, trajectory):
+    """Run one simulation in a worker process and return a JSON-ready result."""
+    from src.drivers.batchSim import BatchPhysCalcs
+    from src.drivers.physCalcs import PhysCalcs
+
+    phys_calcs = PhysCalcs(rocket_specs)
+    if not trajectory:
+        summary = phys_calcs.simulate(max_step=max_step, output="summary")
+        return {field: summary[field] for field in SUMMARY_FIELDS}
+    t, x, y, vx, vy = phys_calcs.simulate(max_step=max_step)
+    summary = BatchPhysCalcs.summarize(t, y, vx, vy, x)
+    result = {field: float(summary[field][0]) for field in SUMMARY_FIELDS}
+    result["trajectory"] = {name: values.tolist() for name, values in
+                            (("t", t), ("x", x), ("y", y), ("vx", vx), ("vy", vy))}
+    return result
+
+
+class SimulationService:
+    """
+    Long-lived local simulation server (HTTP/1.1 on localhost, stdlib asyncio only).
+
+    Workers in a process pool import SciPy and the physics once and then serve
+    every job, so a request costs one integration rather than an interpreter
+    start. Requests for a design that is already running wait on the same job
+    (keyed by spec_hash, max_step and whether the trajectory is wanted), and
+    finished results are kept in an LRU cache.
+
+    Endpoints:
+        POST /simulate  {"rocket_specs": {...}, "max_step": 0.1, "trajectory": false}
+        GET  /metrics   queue depth, cache and coalescing counters, latency quantiles
+        GET  /health
+    """
+
+    def __init__(self, host=HOST, port=PORT, workers=None, cache_size=CACHE_SIZE, run_metrics=None):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.in_flight = {}
+        self.counters = {"requests": 0, "cache_hits": 0, "coalesced": 0, "jobs": 0, "errors": 0}
+        self.latency = TDigest()  # ms, per /simulate request
+        self.run_metrics = run_metrics  # Optional RunMetrics exported alongside the /metrics endpoint
+        self.executor = None
+        self.server = None
+
+    async def start(self):
+        """Start and warm the worker pool, then begin listening; port 0 picks a free port."""
+        self.executor = ProcessPoolExecutor(self.workers, initializer=_warm_worker)
+        # Workers are spawned on demand; start them all now so no request waits for imports
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self.executor, _warm_worker)
+                               for _ in range(self.workers or os.cpu_count() or 1)])
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        if self.run_metrics is not None:
+            self.run_metrics.start()
+
+    async def serve_forever(self):
+        """Run until cancelled."""
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        """Stop listening and shut the worker pool down."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+        if self.run_metrics is not None:
+            self.run_metrics.stop()
+
+    async def simulate(self, rocket_specs, max_step=0.1, trajectory=False):
+        """Result for one design, from the cache, a matching in-flight job or a new job."""
+        RocketSpec.from_dict(rocket_specs)  # Reject invalid specs before they reach a worker
+        key = (spec_hash(rocket_specs), float(max_step), bool(trajectory))
+        if self.run_metrics is not None:
+            self.run_metrics.record_cache(key in self.cache)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.counters["cache_hits"] += 1
+            return self.cache[key]
+        if key in self.in_flight:
+            self.counters["coalesced"] += 1
+            return await asyncio.shield(self.in_flight[key])
+
+        loop = asyncio.get_running_loop()
+        job = loop.run_in_executor(self.executor, _simulate_job, rocket_specs, max_step, trajectory)
+        self.in_flight[key] = job
+        self.counters["jobs"] += 1
+        start = time.perf_counter()
+        try:
+            if self.run_metrics is not None:
+                self.run_metrics.set_queue_depth(len(self.in_flight))
+            result = await asyncio.shield(job)
+        except Exception:
+            if self.run_metrics is not None:
+                self.run_metrics.record_failures()
+            raise
+        finally:
+            del self.in_flight[key]
+        if self.run_metrics is not None:
+            self.run_metrics.record(1, time.perf_counter() - start, worker="pool")
+            self.run_metrics.set_queue_depth(len(self.in_flight))
+        self.cache[key] = result
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return result
+
+    def metrics(self):
+        """Counters, queue depth and latency quantiles (ms)."""
+        return {
+            **self.counters,
+            "queue_depth": len(self.in_flight),
+            "cache_size": len(self.cache),
+            "latency_ms": {f"p{int(q * 100)}": self.latency.quantile(q) if self.latency.count else None
+                           for q in (0.5, 0.95, 0.99)},
+        }
+
+    async def _handle(self, reader, writer):
+        try:
+            status, body = await self._respond(reader)
+        except Exception as e:
+            self.counters["errors"] += 1
+            status, body = 500, {"error": str(e)}
+        payload = json.dumps(body).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {http.client.responses.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _respond(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) != 3:
+            return 400, {"error": "Malformed request line."}
+        method, path, _ = request_line
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        if method == "GET" and path == "/metrics":
+            return 200, self.metrics()
+        if path != "/simulate":
+            return 404, {"error": f"Unknown path {path}."}
+        if method != "POST":
+            return 405, {"error": "Use POST for /simulate."}
+
+        length = int(headers.get("content-length", 0))
+        if length > MAX_BODY:
+            return 413, {"error": "Request body too large."}
+        start = time.perf_counter()
+        self.counters["requests"] += 1
+        try:
+            body = json.loads(await reader.readexactly(length))
+            result = await self.simulate(body["rocket_specs"], body.get("max_step", 0.1),
+                                         body.get("trajectory", False))
+        except (ValueError, KeyError, TypeError) as e:
+            self.counters["errors"] += 1
+            return 400, {"error": str(e)}
+        self.latency.add((time.perf_counter() - start) * 1000)
+        return 200, result
+
+
+def request(path, payload=None, host=HOST, port=PORT, timeout=60):
+    """Small blocking client: GET path, or POST the payload as JSON; returns (status, body)."""
+    connection = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        if payload is None:
+            connection.request("GET", path)
+        else:
+            connection.request("POST", path, body=json.dumps(payload),
+                               headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    service = SimulationService()
+    print(f"Simulation service listening on http://{service.host}:{service.port}")
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,39 @@
+import copy
+import hashlib
+import json
+import math
+
+# Numeric fields that only take whole values and cannot be perturbed continuously
+DISCRETE_FIELDS = {("fins", "form")}
+
+
+def numeric_fields(rocket_specs):
+    """List every continuous numeric (section, key) pair in a rocket specs dict."""
+    fields = []
+    for section, values in rocket_specs.items():
+        if not isinstance(values, dict):
+            continue
+        for key, value in values.items():
+            # bool is a subclass of int, but it is never a physical quantity
+            if isinstance(value, (int, float)) and not isinstance(value, bool) \
+                    and (section, key) not in DISCRETE_FIELDS:
+                fields.append((section, key))
+    return fields
+
+
+def with_field(rocket_specs, section, key, value):
+    """Return a copy of the specs dict with a single field replaced."""
+    new_specs = copy.deepcopy(rocket_specs)
+    new_specs[section][key] = value
+    return new_specs
+
+
+def spec_hash(rocket_specs):
+    """Stable short hash of a specs dict, independent of key order."""
+    canonical = json.dumps(rocket_specs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def motor_class(impulse):
+    """Letter class of a motor's total impulse in N s (A: up to 2.5 N s, each letter doubles)."""
+    return chr(ord("A") + max(math.ceil(math.log2(impulse / 2.5)), 0))
@@ -0,0 +1,183 @@
+import itertools
+import json
+import numpy as np
+from src.drivers.batchSim import simulate_summaries
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.specUtils import with_field
+
+MAGIC = b"RSURR001"
+ALIGNMENT = 64  # Byte alignment of the data blocks inside the file
+OUTPUTS = ("apogee", "max_velocity", "flight_time")
+
+# (section, key, low, high) of the design parameters spanned by default
+DEFAULT_PARAMETERS = [
+    ("motor", "thrust", 100.0, 4000.0),
+    ("motor", "burn_time", 2.5, 3.75),
+    ("air_frame", "diameter", 2.0, 8.0),
+    ("air_frame", "length", 20.0, 100.0),
+]
+
+
+def _design(rocket_specs, parameters, values):
+    """Apply one set of parameter values to a copy of the base specs."""
+    specs = rocket_specs
+    for (section, key, _, _), value in zip(parameters, values):
+        specs = with_field(specs, section, key, float(value))
+    return specs
+
+
+class Surrogate:
+    """
+    Tabulated response surface for apogee, max velocity and flight time.
+
+    The table is built offline from batched simulations on a regular grid and stored
+    in a single binary file: an 8-byte magic, a JSON header and two float32 blocks
+    (values at the grid nodes, and the estimated error of every grid cell). Loading
+    memory-maps the blocks, and queries are multilinear interpolations.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a surrogate file.")
+            header_length = int(np.frombuffer(file.read(8), dtype="<u8")[0])
+            self.header = json.loads(file.read(header_length).decode("utf-8"))
+
+        self.path = path
+        self.rocket_specs = self.header["rocket_specs"]
+        self.parameters = [tuple(p) for p in self.header["parameters"]]
+        self.outputs = tuple(self.header["outputs"])
+        self.axes = [np.array(axis) for axis in self.header["axes"]]
+
+        grid_shape = tuple(len(axis) for axis in self.axes)
+        cell_shape = tuple(n - 1 for n in grid_shape)
+        self.values = np.memmap(path, dtype="<f4", mode="r", offset=self.header["values_offset"],
+                                shape=grid_shape + (len(self.outputs),))
+        self.errors = np.memmap(path, dtype="<f4", mode="r", offset=self.header["errors_offset"],
+                                shape=cell_shape + (len(self.outputs),))
+
+        # Offsets of the 2^d corners of a grid cell
+        self._corners = np.array(list(itertools.product((0, 1), repeat=len(self.axes))))
+
+    @classmethod
+    def build(cls, rocket_specs, path, parameters=DEFAULT_PARAMETERS, points=5, chunk_size=256):
+        """
+        Simulate the parameter grid and the centre of every grid cell, then write the table.
+
+        The error of each cell is the difference between the interpolated and the
+        simulated outputs at its centre, where multilinear interpolation is least accurate.
+        """
+        parameters = [tuple(p) for p in parameters]
+        axes = [np.linspace(low, high, points) for _, _, low, high in parameters]
+        midpoints = [(axis[:-1] + axis[1:]) / 2 for axis in axes]
+
+        nodes = list(itertools.product(*axes))
+        centres = list(itertools.product(*midpoints))
+        summaries = simulate_summaries(
+            [_design(rocket_specs, parameters, v) for v in nodes + centres], chunk_size=chunk_size
+        )
+        results = np.stack([summaries[name] for name in OUTPUTS], axis=-1)
+
+        grid_shape = tuple(len(axis) for axis in axes)
+        cell_shape = tuple(n - 1 for n in grid_shape)
+        values = results[:len(nodes)].reshape(grid_shape + (len(OUTPUTS),))
+        simulated_centres = results[len(nodes):].reshape(cell_shape + (len(OUTPUTS),))
+
+        # The centre of a cell interpolates to the mean of its corners
+        corner_mean = np.zeros(cell_shape + (len(OUTPUTS),))
+        for corner in itertools.product((0, 1), repeat=len(axes)):
+            index = tuple(slice(c, c + n) for c, n in zip(corner, cell_shape))
+            corner_mean += values[index]
+        corner_mean /= 2 ** len(axes)
+        errors = np.abs(corner_mean - simulated_centres)
+
+        cls._write(path, rocket_specs, parameters, axes, values, errors)
+        return cls(path)
+
+    @staticmethod
+    def _write(path, rocket_specs, parameters, axes, values, errors):
+        """Write the header and the float32 blocks to a surrogate file."""
+        values = np.ascontiguousarray(values, dtype="<f4")
+        errors = np.ascontiguousarray(errors, dtype="<f4")
+        header = {
+            "rocket_specs": rocket_specs,
+            "parameters": [list(p) for p in parameters],
+            "outputs": list(OUTPUTS),
+            "axes": [axis.tolist() for axis in axes],
+        }
+
+        # The offsets depend on the header length, so settle them before writing
+        def align(n):
+            return -(-n // ALIGNMENT) * ALIGNMENT
+
+        header["values_offset"] = header["errors_offset"] = 0
+        for _ in range(3):
+            encoded = json.dumps(header).encode("utf-8")
+            values_offset = align(len(MAGIC) + 8 + len(encoded))
+            errors_offset = align(values_offset + values.nbytes)
+            header["values_offset"], header["errors_offset"] = values_offset, errors_offset
+        encoded = json.dumps(header).encode("utf-8")
+
+        with open(path, "wb") as file:
+            file.write(MAGIC)
+            file.write(np.array([len(encoded)], dtype="<u8").tobytes())
+            file.write(encoded)
+            file.write(b"\0" * (values_offset - file.tell()))
+            file.write(values.tobytes())
+            file.write(b"\0" * (errors_offset - file.tell()))
+            file.write(errors.tobytes())
+
+    def query(self, values):
+        """
+        Estimate the outputs for one point (d,) or many points (M, d).
+
+        Returns a dict with every output, its estimated error ("<output>_error") and
+        "in_range", which is False where a point had to be clamped to the grid.
+        """
+        points = np.atleast_2d(np.asarray(values, dtype=float))
+        single = np.ndim(values) == 1
+
+        cells = np.empty(points.shape, dtype=int)
+        fractions = np.empty(points.shape)
+        in_range = np.ones(len(points), dtype=bool)
+        for k, axis in enumerate(self.axes):
+            column = points[:, k]
+            in_range &= (column >= axis[0]) & (column <= axis[-1])
+            column = np.clip(column, axis[0], axis[-1])
+            cells[:, k] = np.clip(np.searchsorted(axis, column, side="right") - 1, 0, len(axis) - 2)
+            fractions[:, k] = (column - axis[cells[:, k]]) / (axis[cells[:, k] + 1] - axis[cells[:, k]])
+
+        # Weighted sum over the 2^d corners of each point's cell, gathered in one go
+        corner_index = cells[:, None, :] + self._corners[None, :, :]  # (M, 2^d, d)
+        weights = np.prod(np.where(self._corners[None], fractions[:, None], 1 - fractions[:, None]), axis=2)
+        corner_values = self.values[tuple(np.moveaxis(corner_index, 2, 0))]  # (M, 2^d, outputs)
+        estimate = np.einsum("mc,mco->mo", weights, corner_values)
+        error = np.asarray(self.errors[tuple(cells.T)], dtype=float)
+
+        if single:
+            result = {"in_range": bool(in_range[0])}
+            for j, name in enumerate(self.outputs):
+                result[name] = float(estimate[0, j])
+                result[name + "_error"] = float(error[0, j])
+            return result
+        result = {"in_range": in_range}
+        for j, name in enumerate(self.outputs):
+            result[name] = estimate[:, j]
+            result[name + "_error"] = error[:, j]
+        return result
+
+    def exact(self, values):
+        """Run the full simulation for one point, for when the final answer is needed."""
+        specs = _design(self.rocket_specs, self.parameters, values)
+        summary = PhysCalcs(specs).simulate(output="summary")
+        return {name: summary[name] for name in self.outputs}
+
+
+if __name__ == "__main__":
+    with open("../config/rocket_specs.json", "r") as file:
+        rocket_specs = json.load(file)
+
+    surrogate = Surrogate.build(rocket_specs, "surrogate.bin")
+    point = [rocket_specs[section][key] for section, key, _, _ in surrogate.parameters]
+    print("Surrogate:", surrogate.query(point))
+    print("Simulation:", surrogate.exact(point))
@@ -0,0 +1,241 @@
+import json
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from src.drivers.batchSim import BatchPhysCalcs
+
+SUMMARY_FIELDS = ("apogee", "flight_time", "max_velocity", "landing_x")
+TRAJECTORY_COLUMNS = ("t", "x", "y", "vx", "vy")
+POINTS_PER_RUN = 1200  # Trajectory rows reserved per run; a 100 s run at max_step=0.1 needs ~1000
+
+
+def _attach(name):
+    """Attach to an existing shared memory block without letting this process own it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        block = shared_memory.SharedMemory(name=name)
+        # Older Pythons register every attachment with the resource tracker,
+        # which would unlink the block when a worker exits
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+class SharedResults:
+    """
+    Sweep results laid out in shared memory so workers can write them in place.
+
+    summaries    (n_runs, len(SUMMARY_FIELDS)) float64, one fixed-stride row per run
+    index        (n_runs, 2) int64, (offset, length) of each run's trajectory rows
+    trajectories (capacity, len(TRAJECTORY_COLUMNS)) float64, ragged rows of all runs
+
+    Trajectory rows are claimed from a shared counter, so runs of any length pack
+    back to back. Runs that do not fit keep their summary and get offset -1. The
+    arrays exposed here are views on the shared buffers; nothing is copied.
+    """
+
+    def __init__(self, n_runs, capacity, names=None, counter=None):
+        self.n_runs = n_runs
+        self.capacity = capacity
+        self.owner = names is None
+        shapes = {
+            "summaries": ((n_runs, len(SUMMARY_FIELDS)), np.float64),
+            "index": ((n_runs, 2), np.int64),
+            "trajectories": ((max(capacity, 1), len(TRAJECTORY_COLUMNS)), np.float64),
+        }
+
+        self._blocks = {}
+        for key, (shape, dtype) in shapes.items():
+            if self.owner:
+                size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+                self._blocks[key] = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                self._blocks[key] = _attach(names[key])
+            setattr(self, key, np.ndarray(shape, dtype=dtype, buffer=self._blocks[key].buf))
+
+        if self.owner:
+            self.summaries[:] = np.nan
+            self.index[:] = (-1, 0)
+        # Next free trajectory row, shared by every writer
+        self.counter = counter if counter is not None else mp.Value("q", 0)
+
+    @property
+    def names(self):
+        return {key: block.name for key, block in self._blocks.items()}
+
+    def write(self, run, summary, trajectory=None):
+        """Store one run's summary row and, if it fits, its trajectory rows."""
+        self.summaries[run] = [summary[field] for field in SUMMARY_FIELDS]
+        if trajectory is None:
+            return
+        length = len(trajectory)
+        with self.counter.get_lock():
+            offset = self.counter.value
+            if offset + length > self.capacity:
+                return
+            self.counter.value = offset + length
+        self.trajectories[offset:offset + length] = trajectory
+        self.index[run] = (offset, length)
+
+    def summary(self, field):
+        """Column view of one summary field over all runs."""
+        return self.summaries[:, SUMMARY_FIELDS.index(field)]
+
+    def trajectory(self, run):
+        """(length, 5) view of one run's t, x, y, vx, vy rows, or None if not stored."""
+        offset, length = self.index[run]
+        if offset < 0:
+            return None
+        return self.trajectories[offset:offset + length]
+
+    def close(self):
+        """Release the views and the shared memory; the owner also unlinks it."""
+        for key in ("summaries", "index", "trajectories"):
+            setattr(self, key, None)
+        for block in self._blocks.values():
+            block.close()
+            if self.owner:
+                block.unlink()
+        self._blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Set in each worker process by _init_worker
+_worker_results = None
+_worker_settings = None
+
+
+def _init_worker(n_runs, capacity, names, counter, settings):
+    global _worker_results, _worker_settings
+    _worker_results = SharedResults(n_runs, capacity, names=names, counter=counter)
+    _worker_settings = settings  # A wind bank arrives as its path and is mapped once per worker
+
+
+def _run_batch(task):
+    """
+    Simulate one batch of (run index, specs) pairs and write it to shared memory.
+
+    Returns (runs, seconds, worker pid, failed runs), where a failed run is one without a finite apogee.
+    """
+    start = time.perf_counter()
+    runs, specs_list = zip(*task)
+    wind_bank = _worker_settings["wind_bank"]
+    wind_profiles = None if wind_bank is None else _worker_settings["wind_profiles"][list(runs)]
+    batch = BatchPhysCalcs(specs_list, wind_bank=wind_bank, wind_profiles=wind_profiles)
+    if _worker_settings["store_trajectories"]:
+        t, x, y, vx, vy = batch.simulate(max_step=_worker_settings["max_step"])
+        summary = batch.summarize(t, y, vx, vy, x)
+    else:
+        summary = batch.simulate(max_step=_worker_settings["max_step"], output="summary")
+    for j, run in enumerate(runs):
+        trajectory = None
+        if _worker_settings["store_trajectories"]:
+            trajectory = np.column_stack([t, x[j], y[j], vx[j], vy[j]])
+        _worker_results.write(run, {field: summary[field][j] for field in SUMMARY_FIELDS}, trajectory)
+    failures = int(np.count_nonzero(~np.isfinite(summary["apogee"])))
+    return len(runs), time.perf_counter() - start, os.getpid(), failures
+
+
+class SweepRunner:
+    """
+    Run many designs across a process pool, aggregating results in shared memory.
+
+    Workers return only a run count; summaries and trajectories go straight into
+    the preallocated SharedResults buffers, so no trajectory is ever pickled back.
+    With a MarginFilter, designs outside its static-margin band are screened out
+    before integration; their summary rows stay NaN. With a WindBank, run i
+    flies wind profile wind_profiles[i]; workers map the bank's file rather
+    than receiving any wind data. With a RunMetrics, every finished batch and
+    the number of batches still queued are reported as they happen.
+    """
+
+    def __init__(self, rocket_specs_list, workers=None, batch_size=8, store_trajectories=True,
+                 points_per_run=POINTS_PER_RUN, max_step=0.1, margin_filter=None, wind_bank=None,
+                 wind_profiles=None, metrics=None):
+        self.rocket_specs_list = list(rocket_specs_list)
+        self.workers = workers if workers is not None else mp.cpu_count()
+        self.batch_size = batch_size
+        self.store_trajectories = store_trajectories
+        self.points_per_run = points_per_run
+        self.max_step = max_step
+        self.margin_filter = margin_filter
+        self.metrics = metrics
+        self.wind_bank = wind_bank
+        self.wind_profiles = None if wind_profiles is None else np.asarray(wind_profiles, dtype=np.int64)
+        if wind_bank is not None and (self.wind_profiles is None
+                                      or len(self.wind_profiles) != len(self.rocket_specs_list)):
+            raise ValueError("wind_profiles must give one wind bank index per design.")
+
+    def tasks(self, runs=None):
+        """Split the designs (or only the given run indices) into batches of (run index, specs) pairs."""
+        runs = range(len(self.rocket_specs_list)) if runs is None else runs
+        indexed = [(int(run), self.rocket_specs_list[run]) for run in runs]
+        return [indexed[i:i + self.batch_size] for i in range(0, len(indexed), self.batch_size)]
+
+    def run(self):
+        """Simulate every design and return the SharedResults; close() it when done."""
+        n_runs = len(self.rocket_specs_list)
+        runs = None
+        if self.margin_filter is not None:
+            runs, margins, in_band = self.margin_filter.apply(self.rocket_specs_list)
+        # Only the runs that will be integrated need trajectory space
+        n_integrated = n_runs if runs is None else len(runs)
+        capacity = n_integrated * self.points_per_run if self.store_trajectories else 0
+        results = SharedResults(n_runs, capacity)
+        if runs is not None:
+            results.static_margin, results.in_band = margins, in_band
+        settings = {"max_step": self.max_step, "store_trajectories": self.store_trajectories,
+                    "wind_bank": self.wind_bank, "wind_profiles": self.wind_profiles}
+        initargs = (n_runs, capacity, results.names, results.counter, settings)
+
+        global _worker_results, _worker_settings
+        tasks = self.tasks(runs)
+        try:
+            if self.workers <= 1:
+                # Serial runs write through the owner's views directly
+                _worker_results, _worker_settings = results, settings
+                done = self._collect(map(_run_batch, tasks), len(tasks))
+                _worker_results = _worker_settings = None
+            else:
+                with mp.Pool(self.workers, initializer=_init_worker, initargs=initargs) as pool:
+                    done = self._collect(pool.imap_unordered(_run_batch, tasks), len(tasks))
+        except BaseException:
+            results.close()
+            raise
+        if self.margin_filter is not None:
+            for count, seconds, _, _ in done:
+                self.margin_filter.record_integration(count, seconds)
+        return results
+
+    def _collect(self, finished, n_tasks):
+        """Gather the batch reports as they arrive, feeding the metrics if any."""
+        done = []
+        if self.metrics is not None:
+            self.metrics.set_queue_depth(n_tasks)
+        for report in finished:
+            done.append(report)
+            if self.metrics is not None:
+                self.metrics.record(*report)
+                self.metrics.set_queue_depth(n_tasks - len(done))
+        return done
+
+
+if __name__ == "__main__":
+    from src.drivers.specUtils import with_field
+
+    with open("../config/rocket_specs.json", "r") as file:
+        rocket_specs = json.load(file)
+
+    # Thrust sweep over the motor range in the GUI
+    designs = [with_field(rocket_specs, "motor", "thrust", thrust) for thrust in np.linspace(100, 4000, 64)]
+    with SweepRunner(designs).run() as results:
+        for thrust, apogee in zip(np.linspace(100, 4000, 64), results.summary("apogee")):
+            print(f"thrust {thrust:7.1f} N -> apogee {apogee:8.1f} m")
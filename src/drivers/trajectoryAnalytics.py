@@ -0,0 +1,158 @@
+from dataclasses import asdict, dataclass
+import numpy as np
+from scipy.optimize import brentq, minimize_scalar
+from src.drivers.atmosphere import atmosphere, speed_of_sound_array
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.physCalcs import GROUND_LEVEL
+
+
+@dataclass(frozen=True, slots=True)
+class FlightEvents:
+    """Key events of one flight; times in s, lengths in m, speeds in m/s."""
+
+    burnout_time: float
+    burnout_altitude: float
+    burnout_velocity: float
+    apogee_time: float
+    apogee: float
+    max_q_time: float
+    max_q: float  # Pa
+    max_acceleration_time: float
+    max_acceleration: float  # m/s²
+    max_mach_time: float
+    max_mach: float
+    deployment_time: float
+    deployment_altitude: float
+    deployment_velocity: float  # Descent rate under the parachute
+    landing_time: float
+    landing_x: float
+
+    def as_dict(self):
+        return asdict(self)
+
+
+class TrajectoryAnalytics:
+    """
+    Derived quantities and flight events of one PhysCalcs run.
+
+    Speed, Mach number, dynamic pressure and acceleration are computed once, as
+    arrays over the solver steps, for every consumer to share; the acceleration
+    comes from one call of the batch right-hand side over all the steps, and the
+    steps bracketing apogee and landing are those BatchPhysCalcs.summarize
+    interpolates between. events() then
+    refines each event on the solver's dense output: apogee and landing are
+    roots found with brentq, and the maxima are refined with a bounded scalar
+    search between the neighbouring steps, so event times do not depend on
+    where the solver happened to step. Maxima are taken over the ascent; after
+    apogee the model prescribes the parachute descent rate instead.
+    """
+
+    def __init__(self, phys_calcs, t, x, y, vx, vy):
+        self.phys_calcs = phys_calcs
+        self.solution = phys_calcs.solution
+        self.burn_time = phys_calcs.motor.burn_time
+        self.batch = BatchPhysCalcs.from_phys_calcs(phys_calcs)
+        self.t, self.x, self.y, self.vx, self.vy = t, x, y, vx, vy
+
+        # Speed of the returned (post-processed) velocities, as plotted
+        self.speed = np.sqrt(vx**2 + vy**2)
+
+        # Physical series from the raw solver state
+        self.state = self.solution(t)
+        self.mach, self.dynamic_pressure, self.acceleration = self._series(t, self.state)
+
+    @classmethod
+    def run(cls, phys_calcs, max_step=0.1):
+        """Simulate and analyze in one call."""
+        return cls(phys_calcs, *phys_calcs.simulate(max_step=max_step))
+
+    def _series(self, t, state):
+        """Mach number, dynamic pressure (Pa) and acceleration magnitude at the given times."""
+        _, altitude, vx, vy, _ = state
+        raw_speed = np.sqrt(vx**2 + vy**2)
+        mach = raw_speed / speed_of_sound_array(altitude)
+        dynamic_pressure = 0.5 * atmosphere(altitude)[1] * raw_speed**2
+
+        # Acceleration straight from the model's right-hand side; differencing the dense output
+        # would smear the thrust cut-off across the solver step that contains it
+        derivatives = self.batch.dynamics(np.atleast_1d(t), np.asarray(state, dtype=float).ravel()).reshape(5, -1)
+        acceleration = np.hypot(derivatives[2], derivatives[3])
+        return mach, dynamic_pressure, acceleration
+
+    def _refine_max(self, series, values, end_time):
+        """Time and value of a series' maximum up to end_time, refined around the sampled peak."""
+        n = max(int(np.searchsorted(self.t, end_time, side="right")), 1)
+        k = int(np.argmax(values[:n]))
+        low, high = self.t[max(k - 1, 0)], min(self.t[min(k + 1, len(self.t) - 1)], end_time)
+        candidates = [self.t[k]]
+        if high > low:
+            result = minimize_scalar(lambda s: -series(np.array([s]))[0], bounds=(low, high), method="bounded",
+                                     options={"xatol": 1e-6})
+            candidates += [float(result.x), high]
+            # The thrust cut-off is a kink the bounded search cannot resolve; check it directly
+            if low <= self.burn_time <= high:
+                candidates.append(self.burn_time)
+        candidate_values = series(np.array(candidates))
+        best = int(np.argmax(candidate_values))
+        return float(candidates[best]), float(candidate_values[best])
+
+    def _root(self, component, offset, low, high):
+        """Time in [low, high] where a raw state component crosses offset."""
+        f = lambda s: self.solution(s)[component] - offset
+        if f(low) * f(high) > 0:
+            return low if abs(f(low)) < abs(f(high)) else high
+        return brentq(f, low, high, xtol=1e-9)
+
+    def events(self):
+        """Burnout, apogee, max-Q, max acceleration, max Mach, deployment and landing."""
+        t, solution = self.t, self.solution
+        altitude = self.state[1]
+
+        burnout = solution(min(self.burn_time, t[-1]))
+
+        # Apogee: raw vertical velocity crosses zero next to the highest step
+        peak, first, landed = BatchPhysCalcs.flight_steps(altitude)
+        k = int(peak[0])
+        apogee_time = self._root(3, 0.0, t[k - 1], t[k + 1])
+        apogee = float(solution(apogee_time)[1])
+
+        series = lambda s: self._series(s, solution(s))
+        max_q_time, max_q = self._refine_max(lambda s: series(s)[1], self.dynamic_pressure, apogee_time)
+        max_acceleration_time, max_acceleration = self._refine_max(lambda s: series(s)[2], self.acceleration,
+                                                                   apogee_time)
+        max_mach_time, max_mach = self._refine_max(lambda s: series(s)[0], self.mach, apogee_time)
+
+        # Landing: first step at or below GROUND_LEVEL after apogee, refined on the dense output
+        if landed[0]:
+            i = int(first[0])
+            landing_time = self._root(1, GROUND_LEVEL, t[max(i - 1, 0)], t[i])
+        else:
+            landing_time = t[-1]  # Still airborne at the end of the integration
+
+        return FlightEvents(
+            burnout_time=float(min(self.burn_time, t[-1])),
+            burnout_altitude=float(burnout[1]),
+            burnout_velocity=float(np.hypot(burnout[2], burnout[3])),
+            apogee_time=float(apogee_time),
+            apogee=apogee,
+            max_q_time=max_q_time,
+            max_q=max_q,
+            max_acceleration_time=max_acceleration_time,
+            max_acceleration=max_acceleration,
+            max_mach_time=max_mach_time,
+            max_mach=max_mach,
+            # The parachute opens at apogee and descends at its terminal velocity
+            deployment_time=float(apogee_time),
+            deployment_altitude=apogee,
+            deployment_velocity=float(self.phys_calcs.aero_calcs.calculate_v_terminal_parachute(apogee)),
+            landing_time=float(landing_time),
+            landing_x=float(solution(landing_time)[0]),
+        )
+
+
+if __name__ == "__main__":
+    from src.drivers.physCalcs import PhysCalcs
+
+    analytics = TrajectoryAnalytics.run(PhysCalcs("../config/rocket_specs.json"))
+    for name, value in analytics.events().as_dict().items():
+        print(f"{name:<24}{value:12.3f}")
@@ -0,0 +1,194 @@
+import json
+import os
+import shutil
+import numpy as np
+from src.drivers.specUtils import spec_hash
+
+COLUMNS = ("t", "x", "y", "vx", "vy", "mass")
+MANIFEST = "archive.json"
+
+
+class TrajectoryArchiveWriter:
+    """
+    Append trajectories to a chunked, columnar archive directory.
+
+    Layout:
+        archive.json            manifest: columns, dtype and the list of chunks
+        chunk_00000/t.npy ...   one .npy per column, all runs of the chunk back to back
+        chunk_00000/offsets.npy run i of the chunk owns rows offsets[i]:offsets[i + 1]
+        chunk_00000/meta.jsonl  one JSON line of metadata per run
+
+    Runs are buffered in memory until chunk_runs of them are collected, then the
+    chunk is written to a temporary directory and renamed into place, and the
+    manifest is rewritten. A crash therefore never leaves a half-written chunk,
+    and a chunk renamed but not yet in the manifest is overwritten by the next
+    flush. Opening an existing archive appends to it.
+    """
+
+    def __init__(self, path, chunk_runs=1024, dtype="float32", columns=COLUMNS):
+        self.path = path
+        self.chunk_runs = chunk_runs
+        os.makedirs(path, exist_ok=True)
+
+        manifest_path = os.path.join(path, MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r") as file:
+                self.manifest = json.load(file)
+        else:
+            self.manifest = {"version": 1, "columns": list(columns),
+                             "dtype": np.dtype(dtype).name, "chunks": []}
+        self.columns = self.manifest["columns"]
+        self.dtype = np.dtype(self.manifest["dtype"])
+        self._buffer = []
+
+    def add_run(self, columns, metadata=None, rocket_specs=None):
+        """
+        Buffer one run.
+
+        columns maps every archive column name to a 1-D array of equal length.
+        When rocket_specs is given, its spec_hash is added to the metadata.
+        """
+        arrays = {name: np.asarray(columns[name], dtype=self.dtype) for name in self.columns}
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError("All trajectory columns must have the same length.")
+
+        metadata = dict(metadata or {})
+        if rocket_specs is not None:
+            metadata["spec_hash"] = spec_hash(rocket_specs)
+        self._buffer.append((arrays, metadata))
+        if len(self._buffer) >= self.chunk_runs:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered runs as a new chunk."""
+        if not self._buffer:
+            return
+        name = f"chunk_{len(self.manifest['chunks']):05d}"
+        final_dir = os.path.join(self.path, name)
+        temp_dir = final_dir + ".tmp"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+
+        lengths = [len(arrays[self.columns[0]]) for arrays, _ in self._buffer]
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        np.save(os.path.join(temp_dir, "offsets.npy"), offsets)
+        for column in self.columns:
+            np.save(os.path.join(temp_dir, f"{column}.npy"),
+                    np.concatenate([arrays[column] for arrays, _ in self._buffer]))
+        with open(os.path.join(temp_dir, "meta.jsonl"), "w") as file:
+            for _, metadata in self._buffer:
+                file.write(json.dumps(metadata) + "\n")
+
+        # A chunk directory the manifest does not list is left over from a crash between the rename and
+        # the manifest update; it was never part of the archive, so it is replaced
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.replace(temp_dir, final_dir)
+        self.manifest["chunks"].append({"name": name, "runs": len(lengths), "rows": int(offsets[-1])})
+        self._write_manifest()
+        self._buffer = []
+
+    def _write_manifest(self):
+        temp_path = os.path.join(self.path, MANIFEST + ".tmp")
+        with open(temp_path, "w") as file:
+            json.dump(self.manifest, file, indent=4)
+        os.replace(temp_path, os.path.join(self.path, MANIFEST))
+
+    def close(self):
+        """Flush the last partial chunk."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TrajectoryArchive:
+    """
+    Read-only random access to a trajectory archive through memory maps.
+
+    Chunks are opened on first use with np.load(mmap_mode="r"), so reading run i
+    only touches the pages that hold it, and scanning the archive chunk by chunk
+    never loads more than the chunk being looked at.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, MANIFEST), "r") as file:
+            self.manifest = json.load(file)
+        self.columns = self.manifest["columns"]
+        self.chunks = self.manifest["chunks"]
+        # First global run index of every chunk
+        self.chunk_starts = np.concatenate([[0], np.cumsum([c["runs"] for c in self.chunks])]).astype(np.int64)
+        self._open_chunks = {}
+        self._metadata = (None, [])  # Metadata of the most recently used chunk
+
+    def __len__(self):
+        return int(self.chunk_starts[-1])
+
+    def _locate(self, run):
+        if not 0 <= run < len(self):
+            raise IndexError(f"Run {run} is out of range for an archive of {len(self)} runs.")
+        chunk = int(np.searchsorted(self.chunk_starts, run, side="right") - 1)
+        return chunk, run - int(self.chunk_starts[chunk])
+
+    def chunk(self, chunk):
+        """Memory-mapped offsets and columns of one chunk."""
+        if chunk not in self._open_chunks:
+            directory = os.path.join(self.path, self.chunks[chunk]["name"])
+            arrays = {"offsets": np.load(os.path.join(directory, "offsets.npy"))}
+            for column in self.columns:
+                arrays[column] = np.load(os.path.join(directory, f"{column}.npy"), mmap_mode="r")
+            self._open_chunks[chunk] = arrays
+        return self._open_chunks[chunk]
+
+    def run(self, run):
+        """Dict of column name -> memory-mapped view for one run."""
+        chunk, local = self._locate(run)
+        arrays = self.chunk(chunk)
+        start, stop = arrays["offsets"][local], arrays["offsets"][local + 1]
+        return {column: arrays[column][start:stop] for column in self.columns}
+
+    def metadata(self, run):
+        """Metadata dict stored with one run."""
+        chunk, local = self._locate(run)
+        if self._metadata[0] != chunk:
+            with open(os.path.join(self.path, self.chunks[chunk]["name"], "meta.jsonl"), "r") as file:
+                self._metadata = (chunk, [json.loads(line) for line in file])
+        return self._metadata[1][local]
+
+    def iter_chunks(self):
+        """
+        Yield (first run index, offsets, columns) for every chunk in order.
+
+        Per-run reductions can use np.maximum.reduceat(column, offsets[:-1]) and
+        friends, which process a whole chunk at once. Opened chunks are released
+        after each step so a full scan keeps memory flat.
+        """
+        for chunk in range(len(self.chunks)):
+            arrays = self.chunk(chunk)
+            yield int(self.chunk_starts[chunk]), arrays["offsets"], arrays
+            self._open_chunks.pop(chunk, None)
+
+
+if __name__ == "__main__":
+    from src.drivers.batchSim import BatchPhysCalcs
+    from src.drivers.specUtils import with_field
+
+    with open("../config/rocket_specs.json", "r") as file:
+        rocket_specs = json.load(file)
+
+    designs = [with_field(rocket_specs, "motor", "thrust", thrust) for thrust in np.linspace(1000, 4000, 16)]
+    batch = BatchPhysCalcs(designs)
+    t, x, y, vx, vy = batch.simulate()
+    with TrajectoryArchiveWriter("trajectories", chunk_runs=8) as writer:
+        for i, specs in enumerate(designs):
+            writer.add_run({"t": t, "x": x[i], "y": y[i], "vx": vx[i], "vy": vy[i], "mass": batch.mass[i]},
+                           metadata={"max_step": 0.1}, rocket_specs=specs)
+
+    archive = TrajectoryArchive("trajectories")
+    for start, offsets, columns in archive.iter_chunks():
+        apogees = np.maximum.reduceat(columns["y"], offsets[:-1])
+        print(start, apogees)
@@ -0,0 +1,191 @@
+import json
+import os
+import shutil
+import socket
+import numpy as np
+from src.drivers.gridLookup import ScalarRows, grid_cell, grid_cells
+from src.drivers.rocketSpec import RocketSpec
+
+ALTITUDE_RANGE = (0.0, 20000.0, 401)  # start, stop, points (m); wind above the top is held constant
+REFERENCE_HEIGHT = 10.0  # m, where launch_conditions.wind is measured
+SHEAR_EXPONENT = 1 / 7  # Power-law exponent, neutral atmosphere over open ground
+ROUGHNESS_LENGTH = 0.03  # m, log-law roughness of open grassland
+GUST_INTENSITY = 0.15  # Gust standard deviation as a share of the mean wind
+GUST_LENGTH = 300.0  # m, altitude over which gusts decorrelate
+CHUNK_PROFILES = 4096  # Profiles generated and written per step when building a bank
+
+BANK_HEADER = "bank.json"
+BANK_PROFILES = "profiles.npy"
+BANK_SPEEDS = "reference_speed.npy"
+
+
+def shear_profile(altitude, reference_speed, law="power", exponent=SHEAR_EXPONENT, roughness=ROUGHNESS_LENGTH,
+                  reference_height=REFERENCE_HEIGHT):
+    """
+    Mean wind (m/s) at each altitude for each reference speed, shape (len(speeds), len(altitude)).
+
+    law is "power" (u = u_ref (z / z_ref)^exponent) or "log"
+    (u = u_ref ln(z / z0) / ln(z_ref / z0), zero below the roughness length).
+    """
+    altitude = np.maximum(np.asarray(altitude, dtype=float), 0.0)[None, :]
+    reference_speed = np.atleast_1d(np.asarray(reference_speed, dtype=float))[:, None]
+    if law == "power":
+        shape = (altitude / reference_height) ** exponent
+    elif law == "log":
+        shape = np.log(np.maximum(altitude, roughness) / roughness) / np.log(reference_height / roughness)
+    else:
+        raise ValueError(f"Unknown shear law {law!r}; use 'power' or 'log'.")
+    return reference_speed * shape
+
+
+def gust_profiles(rng, n, altitude, length=GUST_LENGTH):
+    """
+    n unit-variance gust profiles over a uniform altitude grid, shape (n, len(altitude)).
+
+    Each profile is a first-order autoregressive process in altitude, so gusts
+    at two heights correlate as exp(-distance / length).
+    """
+    step = altitude[1] - altitude[0]
+    phi = np.exp(-step / length)
+    noise = rng.standard_normal((n, len(altitude)))
+    gusts = np.empty_like(noise)
+    gusts[:, 0] = noise[:, 0]
+    scale = np.sqrt(1 - phi ** 2)
+    for k in range(1, len(altitude)):
+        gusts[:, k] = phi * gusts[:, k - 1] + scale * noise[:, k]
+    return gusts
+
+
+class WindBank:
+    """
+    Precomputed horizontal wind profiles against altitude, memory-mapped from disk.
+
+    Layout of a bank directory:
+        bank.json           altitude grid and the generation settings
+        profiles.npy        (n_profiles, n_altitude) float64 wind in m/s, positive downrange (+x)
+        reference_speed.npy (n_profiles,) mean wind at REFERENCE_HEIGHT of each profile
+
+    A bank is generated once with create() and opened read-only, so every
+    process of a Monte Carlo run maps the same pages instead of regenerating
+    the profiles; pickling a bank sends only its path. Runs reference a
+    profile by index and copy out just the rows they fly with select().
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, BANK_HEADER), "r") as file:
+            self.header = json.load(file)
+        self.altitude = np.linspace(*self.header["altitude_range"])
+        self.profiles = np.load(os.path.join(directory, BANK_PROFILES), mmap_mode="r")
+        self.reference_speed = np.load(os.path.join(directory, BANK_SPEEDS), mmap_mode="r")
+
+    @classmethod
+    def create(cls, directory, reference_speeds, ensemble=1, law="power", gust_intensity=GUST_INTENSITY,
+               gust_length=GUST_LENGTH, altitude_range=ALTITUDE_RANGE, seed=0):
+        """
+        Generate a bank of len(reference_speeds) * ensemble profiles and open it.
+
+        Each reference speed gets `ensemble` consecutive profiles: its mean
+        shear profile plus independent gusts scaled by gust_intensity times the
+        mean wind (gust_intensity=0 gives the mean profile only). The profiles
+        are written in chunks straight to the memory map, so banks larger than
+        memory can be built, and the directory is renamed into place only once
+        complete.
+        """
+        reference_speeds = np.asarray(reference_speeds, dtype=float)
+        altitude = np.linspace(*altitude_range)
+        n_profiles = len(reference_speeds) * ensemble
+        temp_dir = f"{directory}.tmp-{socket.gethostname()}-{os.getpid()}"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+
+        speeds = np.repeat(reference_speeds, ensemble)
+        np.save(os.path.join(temp_dir, BANK_SPEEDS), speeds)
+        profiles = np.lib.format.open_memmap(os.path.join(temp_dir, BANK_PROFILES), mode="w+",
+                                             dtype=np.float64, shape=(n_profiles, len(altitude)))
+        rng = np.random.default_rng(seed)
+        for start in range(0, n_profiles, CHUNK_PROFILES):
+            chunk = speeds[start:start + CHUNK_PROFILES]
+            mean = shear_profile(altitude, chunk, law)
+            gusts = gust_profiles(rng, len(chunk), altitude, gust_length) if gust_intensity else 0.0
+            profiles[start:start + len(chunk)] = mean * (1 + gust_intensity * gusts)
+        profiles.flush()
+        del profiles
+
+        header = {"version": 1, "altitude_range": list(altitude_range), "n_profiles": n_profiles,
+                  "ensemble": ensemble, "law": law, "gust_intensity": gust_intensity,
+                  "gust_length": gust_length, "seed": seed}
+        with open(os.path.join(temp_dir, BANK_HEADER), "w") as file:
+            json.dump(header, file)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.rename(temp_dir, directory)
+        return cls(directory)
+
+    def __len__(self):
+        return len(self.profiles)
+
+    def __getstate__(self):
+        return {"directory": self.directory}
+
+    def __setstate__(self, state):
+        self.__init__(state["directory"])
+
+    def select(self, profiles):
+        """WindProfiles holding the given profile indices (one per design)."""
+        profiles = np.atleast_1d(np.asarray(profiles, dtype=np.int64))
+        if profiles.min() < 0 or profiles.max() >= len(self):
+            raise IndexError(f"Wind profile indices must be in [0, {len(self)}).")
+        return WindProfiles(self.altitude, np.asarray(self.profiles[profiles]))
+
+
+class WindProfiles:
+    """
+    Wind profiles of the designs of one run, copied out of a WindBank or built from specs.
+
+    The altitude grid is uniform, so a lookup is index arithmetic plus one
+    linear interpolation whatever the grid size; altitudes outside the grid
+    take its edge values. lookup() serves one design from nested lists (the
+    scalar right-hand side of PhysCalcs) and lookup_array() every design at
+    once (BatchPhysCalcs).
+    """
+
+    def __init__(self, altitude, wind):
+        self.altitude = altitude
+        self.wind = np.atleast_2d(wind)  # (N, n_altitude) m/s
+        self.n_designs = len(self.wind)
+        self._start = float(altitude[0])
+        self._step = float(altitude[1] - altitude[0])
+        self._last = len(altitude) - 2
+        self._rows = ScalarRows(self.wind)
+
+    @classmethod
+    def from_specs(cls, rocket_specs_list, law="power", altitude_range=ALTITUDE_RANGE):
+        """Mean shear profiles from each design's launch_conditions.wind, without gusts."""
+        specs = [s if isinstance(s, RocketSpec) else RocketSpec.from_dict(s) for s in rocket_specs_list]
+        altitude = np.linspace(*altitude_range)
+        return cls(altitude, shear_profile(altitude, [spec.launch_conditions.wind for spec in specs], law))
+
+    def lookup(self, altitude, design=0):
+        """Wind of one design at a scalar altitude (m)."""
+        i, u = grid_cell(altitude, self._start, self._step, self._last)
+        row = self._rows[design]
+        return row[i] * (1 - u) + row[i + 1] * u
+
+    def lookup_array(self, altitude):
+        """Wind of every design at once; altitude is an (N,) array."""
+        i, u = grid_cells(altitude, self._start, self._step, self._last)
+        n = np.arange(self.n_designs)
+        return self.wind[n, i] * (1 - u) + self.wind[n, i + 1] * u
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    bank = WindBank.create("wind_bank", [2.0, 5.0, 10.0], ensemble=4)
+    for i in range(len(bank)):
+        plt.plot(bank.profiles[i], bank.altitude, color=f"C{i // 4}", alpha=0.6)
+    plt.xlabel("Wind (m/s)")
+    plt.ylabel("Altitude (m)")
+    plt.title("Wind bank profiles")
+    plt.grid()
+    plt.show()
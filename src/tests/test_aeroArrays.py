@@ -0,0 +1,75 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.aeroArrays import FIELDS, AeroArrays
+from src.drivers.aeroCalcs import AeroCalcs
+from src.drivers.specUtils import with_field
+
+
+class TestAeroArrays(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a set of varied designs around the default rocket specs."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        rng = np.random.default_rng(1)
+        cls.designs = []
+        for _ in range(20):
+            specs = cls.rocket_specs
+            for section, key in (("air_frame", "length"), ("nose_cone", "length"), ("fins", "root_chord"),
+                                 ("fins", "semi_span"), ("motor", "diameter"), ("parachute", "area")):
+                specs = with_field(specs, section, key, specs[section][key] * rng.uniform(0.5, 1.5))
+            cls.designs.append(specs)
+        cls.arrays = AeroArrays.from_specs(cls.designs)
+        cls.scalars = [AeroCalcs(specs) for specs in cls.designs]
+
+    def test_matches_scalar_methods_exactly(self):
+        """AeroCalcs should return the one-design AeroArrays results bit for bit."""
+        checks = {
+            "calculate_center_of_gravity": lambda a: a.calculate_center_of_gravity(),
+            "calculate_center_of_pressure": lambda a: a.calculate_center_of_pressure(),
+            "calculate_static_margin": lambda a: a.calculate_static_margin(),
+            "calculate_drag_coefficient": lambda a: a.drag_coefficient,
+            "frontal_area": lambda a: a.frontal_area,
+            "chute_coefficient": lambda a: a.chute_coefficient,
+        }
+        for method, scalar in checks.items():
+            with self.subTest(method=method):
+                expected = np.array([scalar(a) for a in self.scalars])
+                np.testing.assert_array_equal(getattr(self.arrays, method)(), expected)
+
+    def test_json_columns(self):
+        """Columns in JSON units should give the same results as compiled specs."""
+        columns = {name: [specs[section][key] for specs in self.designs] for name, (section, key) in FIELDS.items()}
+        arrays = AeroArrays.from_json_columns(columns)
+        np.testing.assert_allclose(arrays.calculate_static_margin(), self.arrays.calculate_static_margin(),
+                                   rtol=1e-12)
+
+    def test_rejects_bad_columns(self):
+        """Missing or ragged columns should raise ValueError."""
+        columns = {name: np.ones(3) for name in FIELDS}
+        del columns["motor_mass"]
+        with self.assertRaises(ValueError):
+            AeroArrays(columns)
+        columns["motor_mass"] = np.ones(4)
+        with self.assertRaises(ValueError):
+            AeroArrays(columns)
+
+    def test_json_columns_are_checked(self):
+        """Zero, negative or non-finite JSON columns should raise ValueError naming the field and design."""
+        base = {name: np.array([specs[section][key] for specs in self.designs[:3]], dtype=float)
+                for name, (section, key) in FIELDS.items()}
+        for name, value in (("nose_cone_length", 0.0), ("fin_semi_span", -1.0), ("motor_mass", np.nan),
+                            ("parachute_area", np.inf), ("fin_tip_chord", -0.5), ("material_thickness", 1e3)):
+            with self.subTest(name=name):
+                columns = dict(base, **{name: base[name].copy()})
+                columns[name][2] = value
+                with self.assertRaisesRegex(ValueError, "design 2"):
+                    AeroArrays.from_json_columns(columns)
+        columns = dict(base, fin_tip_chord=np.zeros(3))  # Tip chords may be zero
+        AeroArrays.from_json_columns(columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
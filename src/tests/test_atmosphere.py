@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+from src.drivers.atmosphere import (
+    TROPOPAUSE, air_density, air_density_array, atmosphere, speed_of_sound, speed_of_sound_array
+)
+
+
+class TestAtmosphere(unittest.TestCase):
+
+    def setUp(self):
+        self.altitudes = np.array([0.0, 1234.5, TROPOPAUSE, TROPOPAUSE + 1e-6, 15000.0, 40000.0])
+
+    def test_sea_level(self):
+        """Sea level should have the standard 288.15 K, 1.225 kg/m³ and 340.3 m/s."""
+        temp, density = atmosphere(0.0)
+        self.assertAlmostEqual(float(temp), 288.15)
+        self.assertAlmostEqual(float(density), 1.225, places=3)
+        self.assertAlmostEqual(speed_of_sound(0.0), 340.3, places=1)
+
+    def test_scalar_matches_array(self):
+        """The scalar fast path should give the array results on both layers and at the boundary."""
+        np.testing.assert_allclose([air_density(a) for a in self.altitudes], air_density_array(self.altitudes),
+                                   rtol=1e-14)
+        np.testing.assert_allclose([speed_of_sound(a) for a in self.altitudes],
+                                   speed_of_sound_array(self.altitudes), rtol=1e-14)
+
+    def test_continuous_at_tropopause(self):
+        """The two layers should meet at the tropopause, up to the rounding of its 22632 Pa."""
+        below, above = air_density(TROPOPAUSE), air_density(TROPOPAUSE + 1e-6)
+        self.assertAlmostEqual(above / below, 1.0, delta=1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
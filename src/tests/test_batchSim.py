@@ -0,0 +1,53 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.specUtils import with_field
+
+
+class TestBatchPhysCalcs(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Load the default rocket specs and build a small batch of designs."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.designs = [
+            cls.rocket_specs,
+            with_field(cls.rocket_specs, "motor", "thrust", 2000),
+            with_field(cls.rocket_specs, "air_frame", "length", 40.0),
+        ]
+
+    def test_matches_sequential_simulate(self):
+        """Each batched design should reproduce its own PhysCalcs.simulate run."""
+        batch = BatchPhysCalcs(self.designs)
+        t, x, y, vx, vy = batch.simulate()
+        summary = batch.summarize(t, y)
+        for i, specs in enumerate(self.designs):
+            t_seq, _, y_seq, _, _ = PhysCalcs(specs).simulate()
+            expected = BatchPhysCalcs.summarize(t_seq, y_seq)
+            self.assertAlmostEqual(summary["apogee"][i], expected["apogee"][0], delta=1.0)
+            self.assertAlmostEqual(summary["flight_time"][i], expected["flight_time"][0], delta=0.1)
+
+    def test_output_shapes(self):
+        """Trajectories should be (N, T) arrays on a shared time vector."""
+        t, x, y, vx, vy = BatchPhysCalcs(self.designs).simulate()
+        for array in (x, y, vx, vy):
+            self.assertEqual(array.shape, (len(self.designs), len(t)))
+
+    def test_air_density_matches_scalar(self):
+        """The vectorized air density should agree with AeroCalcs on both layers."""
+        aero = PhysCalcs(self.rocket_specs).aero_calcs
+        altitudes = np.array([0.0, 5000.0, 11000.0, 12000.0])
+        expected = [aero.calculate_air_density(a) for a in altitudes]
+        np.testing.assert_allclose(BatchPhysCalcs.calculate_air_density(altitudes), expected)
+
+    def test_empty_batch(self):
+        """An empty batch is an error."""
+        with self.assertRaises(ValueError):
+            BatchPhysCalcs([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.aeroArrays import FIELDS
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.closedForm import APOGEE_ERROR, SCREENING_RANGE, TIME_ERROR, ClosedFormApogee, estimate_apogee
+from src.drivers.specUtils import with_field
+
+
+class TestClosedForm(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Integrate random designs over the screening range once, with the default rocket last."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        rng = np.random.default_rng(3)
+        cls.designs = []
+        for _ in range(120):
+            specs = cls.rocket_specs
+            for section, key, low, high in SCREENING_RANGE:
+                specs = with_field(specs, section, key, float(rng.uniform(low, high)))
+            cls.designs.append(specs)
+        cls.designs.append(cls.rocket_specs)
+
+        t, x, y, vx, vy = BatchPhysCalcs(cls.designs).simulate()
+        cls.apogee = y.max(axis=1)
+        cls.time_to_apogee = t[np.argmax(y, axis=1)]
+        cls.estimate = estimate_apogee(cls.designs)
+
+    def test_apogee_error(self):
+        """Apogees should be within the reported error of the integrator, without a systematic bias."""
+        error = np.abs(self.estimate["apogee"] - self.apogee)
+        self.assertTrue(np.all(error <= self.estimate["apogee_error"]), error / self.apogee)
+        self.assertLess(abs(np.mean((self.estimate["apogee"] - self.apogee) / self.apogee)), 0.005)
+        self.assertLess(error[-1] / self.apogee[-1], 0.015)
+
+    def test_time_error(self):
+        """Times to apogee should be within the reported error of the integrator (plus one solver step)."""
+        error = np.abs(self.estimate["time_to_apogee"] - self.time_to_apogee)
+        self.assertTrue(np.all(error <= self.estimate["time_error"] + 0.1))
+        np.testing.assert_allclose(self.estimate["time_error"], TIME_ERROR * self.estimate["time_to_apogee"])
+        np.testing.assert_allclose(self.estimate["apogee_error"], APOGEE_ERROR * self.estimate["apogee"])
+
+    def test_phases(self):
+        """Burnout plus coast should make up the apogee, and underpowered designs stop during the burn."""
+        estimate = self.estimate
+        np.testing.assert_allclose(estimate["burnout_altitude"] + estimate["coast_height"], estimate["apogee"])
+        self.assertTrue(np.all(estimate["coast_height"] >= 0))
+        heavy_specs = with_field(self.rocket_specs, "motor", "thrust", 10.0)
+        heavy = estimate_apogee([heavy_specs])
+        self.assertAlmostEqual(heavy["coast_height"][0], 0.0)
+        self.assertAlmostEqual(heavy["burnout_velocity"][0], 0.0, places=6)
+        self.assertLess(heavy["time_to_apogee"][0], self.rocket_specs["motor"]["burn_time"])
+        y = BatchPhysCalcs([heavy_specs]).simulate()[2]
+        self.assertLess(abs(heavy["apogee"][0] - y.max()), heavy["apogee_error"][0])
+
+    def test_json_columns(self):
+        """Columns in JSON units should give the same estimates as the spec dicts."""
+        columns = {name: [specs[section][key] for specs in self.designs] for name, (section, key) in FIELDS.items()}
+        columns["thrust"] = [specs["motor"]["thrust"] for specs in self.designs]
+        columns["burn_time"] = [specs["motor"]["burn_time"] for specs in self.designs]
+        estimate = ClosedFormApogee.from_json_columns(columns).estimate()
+        np.testing.assert_allclose(estimate["apogee"], self.estimate["apogee"])
+
+
+if __name__ == '__main__':
+    unittest.main()
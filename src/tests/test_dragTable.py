@@ -0,0 +1,63 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.aeroCalcs import AeroCalcs
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.dragTable import DragTable, compressibility_factor
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.specUtils import with_field
+
+
+class TestDragTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build tables for the default design and a longer variant."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.designs = [cls.rocket_specs, with_field(cls.rocket_specs, "air_frame", "length", 80)]
+        cls.table = DragTable(cls.designs)
+
+    def test_exact_at_grid_nodes(self):
+        """Lookups on grid nodes should return the stored values."""
+        for i, j in ((0, 0), (40, 10), (250, 80)):
+            self.assertEqual(self.table.lookup(self.table.mach[i], self.table.altitude[j], design=1),
+                             self.table.cd[1, i, j])
+
+    def test_scalar_matches_vectorized(self):
+        """lookup and lookup_array should agree for every design."""
+        mach, altitude = np.array([0.35, 1.07]), np.array([1234.0, 25600.0])
+        expected = [self.table.lookup(m, a, design=n) for n, (m, a) in enumerate(zip(mach, altitude))]
+        np.testing.assert_allclose(self.table.lookup_array(mach, altitude), expected, rtol=1e-12)
+
+    def test_scalar_rows_built_on_demand(self):
+        """Only designs looked up one value at a time should get a nested-list copy."""
+        table = DragTable(self.designs)
+        table.lookup_array(np.array([0.5, 0.5]), np.array([100.0, 100.0]))
+        self.assertEqual(len(table._rows), 0)
+        table.lookup(0.5, 100.0, design=1)
+        self.assertEqual(len(table._rows), 1)
+
+    def test_mach_dependence(self):
+        """Cd should rise through the transonic region and fall off supersonically."""
+        cd = [self.table.lookup(m, 0.0) for m in (0.3, 0.9, 3.0)]
+        self.assertGreater(cd[1], cd[0])
+        self.assertLess(cd[2], cd[1])
+        self.assertAlmostEqual(float(compressibility_factor(0.0)), 1.0)
+
+    def test_aero_calcs_default_unchanged(self):
+        """Without a Mach number AeroCalcs should keep its constant Cd."""
+        aero = AeroCalcs(self.rocket_specs)
+        self.assertEqual(aero.calculate_drag_coefficient(5000), aero.drag_coefficient)
+        self.assertAlmostEqual(aero.calculate_drag_coefficient(5000, mach=0.9), self.table.lookup(0.9, 5000))
+
+    def test_batch_matches_scalar(self):
+        """BatchPhysCalcs and PhysCalcs should use the table the same way."""
+        t, _, y, _, _ = PhysCalcs(self.rocket_specs, drag_table=True).simulate()
+        batch = BatchPhysCalcs([self.rocket_specs], drag_table=True)
+        bt, _, by, _, _ = batch.simulate()
+        np.testing.assert_allclose(by[0], y, rtol=1e-9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import numpy as np
+from src.drivers.ensembleStats import EnsembleReducer, Histogram, TDigest
+
+
+def make_summaries(n, seed):
+    """Synthetic flight summaries with a known distribution."""
+    rng = np.random.default_rng(seed)
+    return {
+        "apogee": rng.normal(9000, 300, n),
+        "max_velocity": rng.normal(700, 20, n),
+        "landing_x": rng.normal(500, 80, n),
+        "landing_y": rng.normal(0, 40, n),
+    }
+
+
+class TestEnsembleStats(unittest.TestCase):
+
+    def test_landing_mean_and_covariance(self):
+        """Streaming landing statistics should match NumPy on the full sample."""
+        summaries = make_summaries(2000, 0)
+        reducer = EnsembleReducer(landing_dims=2)
+        reducer.add_batch(summaries)
+        landing = np.column_stack([summaries["landing_x"], summaries["landing_y"]])
+        np.testing.assert_allclose(reducer.landing_mean, landing.mean(axis=0))
+        np.testing.assert_allclose(reducer.landing_covariance, np.cov(landing.T))
+
+    def test_merge_matches_single_reducer(self):
+        """Merging per-worker reducers should equal one reducer over all runs."""
+        summaries = make_summaries(3000, 1)
+        single = EnsembleReducer(landing_dims=2)
+        single.add_batch(summaries)
+        parts = [EnsembleReducer(landing_dims=2) for _ in range(3)]
+        for i, part in enumerate(parts):
+            part.add_batch({key: values[i::3] for key, values in summaries.items()})
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+
+        self.assertEqual(merged.count, single.count)
+        np.testing.assert_allclose(merged.landing_mean, single.landing_mean)
+        np.testing.assert_allclose(merged.landing_covariance, single.landing_covariance)
+        np.testing.assert_array_equal(merged.apogee_histogram.counts, single.apogee_histogram.counts)
+        self.assertAlmostEqual(merged.apogee_quantile(0.5), single.apogee_quantile(0.5), delta=10)
+
+    def test_quantiles(self):
+        """Digest quantiles should be close to the exact ones, including the tails."""
+        values = np.random.default_rng(2).normal(1000, 50, 50000)
+        digest = TDigest()
+        for value in values:
+            digest.add(value)
+        for q in (0.01, 0.5, 0.99):
+            self.assertAlmostEqual(digest.quantile(q), np.quantile(values, q), delta=5)
+        self.assertLess(len(digest.means), 200)
+
+    def test_weighted_add(self):
+        """Adding a value with a weight should count like adding it that many times."""
+        rng = np.random.default_rng(3)
+        values, weights = rng.normal(1000, 50, 2000), rng.integers(1, 300, 2000)
+        digest = TDigest()
+        for value, weight in zip(values, weights):
+            digest.add(value, weight)
+        expanded = np.repeat(values, weights)
+        self.assertEqual(digest.count, len(expanded))
+        for q in (0.01, 0.5, 0.99):
+            self.assertAlmostEqual(digest.quantile(q), np.quantile(expanded, q), delta=5)
+
+    def test_failures_are_counted(self):
+        """Runs with non-finite results are counted but not included."""
+        reducer = EnsembleReducer()
+        reducer.add({"apogee": np.nan, "max_velocity": 1.0, "landing_x": 0.0})
+        reducer.add({"apogee": 100.0, "max_velocity": 1.0, "landing_x": 0.0})
+        self.assertEqual(reducer.failures, 1)
+        self.assertEqual(reducer.count, 1)
+
+    def test_dispersion_ellipse(self):
+        """The 1-D dispersion interval is the normal half-width around the mean."""
+        reducer = EnsembleReducer()
+        reducer.add_batch(make_summaries(5000, 3))
+        centre, semi_axes, _ = reducer.dispersion_ellipse(0.95)
+        self.assertAlmostEqual(centre[0], 500, delta=5)
+        self.assertAlmostEqual(semi_axes[0], 1.96 * 80, delta=8)
+
+    def test_histogram_merge_requires_same_edges(self):
+        """Histograms with different edges cannot be merged."""
+        with self.assertRaises(ValueError):
+            Histogram(0, 1).merge(Histogram(0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import json
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from src.drivers.aeroCalcs import AeroCalcs
+from src.drivers.flightPlayback import FlightPlayback
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.rocketDrawing import RocketDrawing
+
+
+class TestFlightPlayback(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Simulate the default rocket once and prepare its drawing."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            rocket_specs = json.load(file)
+        cls.trajectory = PhysCalcs(rocket_specs).simulate()
+        aero_calcs = AeroCalcs(rocket_specs)
+        cls.drawing = RocketDrawing(rocket_specs, aero_calcs.calculate_center_of_gravity(),
+                                    aero_calcs.calculate_center_of_pressure())
+
+    def make_playback(self, **kwargs):
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        return FlightPlayback(figure.add_subplot(111), self.drawing, *self.trajectory, **kwargs)
+
+    def test_outline_matches_drawing(self):
+        """The outline should hold exactly the polylines plot_rocket draws."""
+        ax = Figure().add_subplot(111)
+        self.drawing.plot_rocket(ax)
+        outline = self.drawing.outline()
+        self.assertEqual(len(ax.lines), len(outline))
+        for line, (x, y, _) in zip(ax.lines, outline):
+            np.testing.assert_array_equal(line.get_xdata(), x)
+            np.testing.assert_array_equal(line.get_ydata(), y)
+
+    def test_frame_data(self):
+        """Frames should be precomputed at the playback rate and span the flight."""
+        t, x, y, vx, vy = self.trajectory
+        playback = self.make_playback(fps=30, speed=10.0)
+        self.assertEqual(playback.n_frames, int(np.ceil((t[-1] - t[0]) / 10.0 * 30)) + 1)
+        self.assertEqual(len(playback.readouts), playback.n_frames)
+        self.assertEqual(playback.frame_y[-1], y[-1])
+        self.assertEqual(playback.frame_end[-1], len(t))
+        # One line per outline color
+        colors = {style["color"] for _, _, style in self.drawing.outline()}
+        self.assertEqual(len(playback.rocket_lines), len(colors))
+
+    def test_update_moves_animated_artists(self):
+        """A frame should place the rocket at its position and only touch animated artists."""
+        playback = self.make_playback()
+        playback.ax.figure.canvas.draw()
+        frame = playback.n_frames // 3
+        artists = playback.update(frame)
+        self.assertTrue(all(artist.get_animated() for artist in artists))
+        center = playback.rocket_transform.transform((0.0, 0.0))
+        expected = playback.ax.transData.transform((playback.frame_x[frame], playback.frame_y[frame]))
+        np.testing.assert_allclose(center, expected)
+        self.assertEqual(playback.readout.get_text(), playback.readouts[frame])
+
+    def test_readout_callback(self):
+        """With a callback the readout should bypass the in-axes text."""
+        texts = []
+        playback = self.make_playback(readout=texts.append)
+        self.assertNotIn(playback.readout, playback.artists)
+        playback.update(5)
+        self.assertEqual(texts, [playback.readouts[5]])
+
+
+if __name__ == '__main__':
+    unittest.main()
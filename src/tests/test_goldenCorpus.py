@@ -0,0 +1,40 @@
+import unittest
+from src.drivers.goldenCorpus import CASES, budget, compare, load_corpus, run_case
+
+
+class TestGoldenCorpus(unittest.TestCase):
+    """
+    Regression gate for the flight model: every reference rocket must reproduce
+    its stored summary and trajectory and stay within its wall-time budget.
+    After an intended change of results, regenerate the corpus with
+    python -m src.drivers.goldenCorpus and commit the new references; name
+    cases on the command line to write only those, e.g. new ones.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = load_corpus()
+
+    def test_corpus_is_complete(self):
+        """Every case should have a reference, spanning motor classes, nose shapes and parachute sizes."""
+        self.assertEqual(set(self.corpus), set(CASES))
+        # Every class between the smallest and the largest, with no gaps
+        classes = sorted({reference["motor_class"] for reference in self.corpus.values()})
+        self.assertEqual(classes, [chr(letter) for letter in range(ord("G"), ord("O") + 1)])
+        shapes = {reference["rocket_specs"]["nose_cone"]["shape"] for reference in self.corpus.values()}
+        self.assertEqual(shapes, {"tangent_ogive", "elliptic", "conic", "parabolic"})
+        areas = {reference["rocket_specs"]["parachute"]["area"] for reference in self.corpus.values()}
+        self.assertGreaterEqual(len(areas), 3)
+
+    def test_cases_match_references(self):
+        """Each case should agree with its reference and finish within its time budget."""
+        for name, reference in self.corpus.items():
+            with self.subTest(case=name):
+                summary, trajectory, seconds = run_case(reference["rocket_specs"], reference["options"], repeats=2)
+                self.assertEqual(compare(reference, summary, trajectory), [])
+                self.assertLessEqual(seconds, budget(reference),
+                                     f"{name} took {seconds:.3f} s, budget {budget(reference):.3f} s")
+
+
+if __name__ == '__main__':
+    unittest.main()
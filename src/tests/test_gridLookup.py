@@ -0,0 +1,32 @@
+import unittest
+import numpy as np
+from src.drivers.gridLookup import ScalarRows, grid_cell, grid_cells
+
+
+class TestGridLookup(unittest.TestCase):
+
+    def test_grid_cell(self):
+        """Values should map to their cell and fraction, clamped at both edges."""
+        self.assertEqual(grid_cell(12.5, 10.0, 1.0, 8), (2, 0.5))
+        self.assertEqual(grid_cell(-3.0, 10.0, 1.0, 8), (0, 0.0))
+        self.assertEqual(grid_cell(25.0, 10.0, 1.0, 8), (8, 1.0))
+
+    def test_grid_cells(self):
+        """The array version should match grid_cell value by value."""
+        values = np.array([12.5, -3.0, 25.0, 10.0, 17.999])
+        i, u = grid_cells(values, 10.0, 1.0, 8)
+        for value, index, fraction in zip(values, i, u):
+            self.assertEqual((index, fraction), grid_cell(value, 10.0, 1.0, 8))
+
+    def test_scalar_rows(self):
+        """Rows should match the table and be copied once per design."""
+        table = np.arange(12.0).reshape(3, 2, 2)
+        rows = ScalarRows(table)
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(rows[2], table[2].tolist())
+        self.assertIs(rows[2], rows[2])
+        self.assertEqual(len(rows), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
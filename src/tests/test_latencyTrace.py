@@ -0,0 +1,150 @@
+import os
+import unittest
+import json
+import shutil
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # Replays need no display
+
+import matplotlib.pyplot as plt
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtTest import QTest
+from src.drivers.latencyTrace import LatencyTracer, TracedMainWindow, load_script, replay
+
+
+class Editor:
+    """Minimal ui: a spin box, a list and a slow button, all updating one label."""
+
+    def __init__(self, window, slow_ms=30):
+        central = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(central)
+        self.spinbox = QtWidgets.QDoubleSpinBox()
+        self.spinbox.setDecimals(1)
+        self.spinbox.setMaximum(100.0)
+        self.list = QtWidgets.QListWidget()
+        for item in ("Small", "Medium", "Large"):
+            self.list.addItem(item)
+        self.button = QtWidgets.QPushButton("Run")
+        self.label = QtWidgets.QLabel("-")
+        for widget in (self.spinbox, self.list, self.button, self.label):
+            layout.addWidget(widget)
+        window.setCentralWidget(central)
+
+        self.spinbox.valueChanged.connect(lambda value: self.label.setText(f"{value:.1f}"))
+        self.list.itemClicked.connect(lambda item: self.label.setText(item.text()))
+        self.button.clicked.connect(lambda: (time.sleep(slow_ms / 1000), self.label.setText("done")))
+
+
+class TestLatencyTrace(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        self.window = TracedMainWindow()
+        self.ui = Editor(self.window)
+        self.tracer = LatencyTracer(self.window)
+        self.tracer.track(self.ui.spinbox, "spinbox_edit", "spinbox")
+        self.tracer.track(self.ui.list, "list_select", "list")
+        self.tracer.track(self.ui.button, "run", "button")
+        self.window.show()
+        QTest.qWaitForWindowExposed(self.window)
+
+    def tearDown(self):
+        self.tracer.close()
+        self.window.close()
+        # Delete the window now; left to the garbage collector, its reference cycles may be freed in the
+        # middle of a later test's event handling
+        self.window.deleteLater()
+        QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    def test_replay(self):
+        """Each step should be measured from its input event to the repaint and recorded again."""
+        steps = [
+            {"action": "spinbox_edit", "widget": "spinbox", "delay": 0.0, "value": 12.5},
+            {"action": "list_select", "widget": "list", "delay": 0.0, "row": 2},
+            {"action": "run", "widget": "button", "delay": 0.0},
+            {"action": "spinbox_edit", "widget": "spinbox", "delay": 0.0, "value": 12.5},  # No change
+        ]
+        summary = replay(self.tracer, self.ui, steps)
+        self.assertEqual({action: stats["count"] for action, stats in summary.items()},
+                         {"spinbox_edit": 1, "list_select": 1, "run": 1})
+        self.assertGreaterEqual(summary["run"]["p50"], 30.0)
+        self.assertLess(summary["spinbox_edit"]["max"], summary["run"]["p50"])
+        self.assertEqual(self.ui.spinbox.value(), 12.5)
+        self.assertEqual(self.ui.label.text(), "done")
+        self.assertEqual([(s["action"], s["widget"], s.get("value"), s.get("row")) for s in self.tracer.steps],
+                         [("spinbox_edit", "spinbox", 12.5, None), ("list_select", "list", None, 2),
+                          ("run", "button", None, None)])
+
+    def test_signal_from_code(self):
+        """A signal without an input event is measured from the signal itself."""
+        self.ui.spinbox.setValue(7.0)
+        self.assertIsNotNone(self.tracer.pending)
+        while self.tracer.pending is not None:
+            self.app.processEvents()
+        self.assertEqual(self.tracer.summary()["spinbox_edit"]["count"], 1)
+        self.assertLess(self.tracer.summary()["spinbox_edit"]["max"], 1000.0)
+
+    def test_signal_before_repaint(self):
+        """A second edit before the first one's repaint is recorded in the script but not timed."""
+        self.ui.spinbox.setValue(7.0)
+        self.ui.spinbox.setValue(8.0)
+        self.assertEqual([s["value"] for s in self.tracer.steps], [7.0, 8.0])
+        while self.tracer.pending is not None:
+            self.app.processEvents()
+        self.assertEqual(self.tracer.summary()["spinbox_edit"]["count"], 1)
+
+    def test_script_round_trip(self):
+        replay(self.tracer, self.ui, [{"action": "run", "widget": "button", "delay": 0.0}])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.json")
+            self.tracer.save_script(path)
+            self.assertEqual(load_script(path), self.tracer.steps)
+        text = self.tracer.format_summary()
+        self.assertIn("run", text)
+        self.assertIn("p99 (ms)", text)
+
+
+class TestGuiReplay(unittest.TestCase):
+
+    def test_rocket_gui(self):
+        """Replaying edits, a selection, Display and Plot on the GUI should measure each of them."""
+        from rocketGUI import Ui_MainWindow
+
+        app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        window = TracedMainWindow()
+        ui = Ui_MainWindow()
+        ui.setupUi(window)
+        tracer = ui.enable_latency_trace(window)
+        window.show()
+        scratch = tempfile.mkdtemp()
+        try:
+            ui.json_path = shutil.copy(ui.json_path, os.path.join(scratch, "rocket_specs.json"))
+            steps = [
+                {"action": "spinbox_edit", "widget": "af_d_input", "delay": 0.0, "value": 4.0},
+                {"action": "list_select", "widget": "motor_list", "delay": 0.0, "row": 3},
+                {"action": "display_rocket", "widget": "display_button", "delay": 0.0},
+                {"action": "simulate", "widget": "plot_button", "delay": 0.0},
+            ]
+            summary = replay(tracer, ui, steps)
+            self.assertEqual({action: stats["count"] for action, stats in summary.items()},
+                             {"spinbox_edit": 1, "list_select": 1, "display_rocket": 1, "simulate": 1})
+            with open(ui.json_path, "r") as file:
+                rocket_specs = json.load(file)
+            self.assertEqual(rocket_specs["air_frame"]["diameter"], 4.0)
+            self.assertEqual(rocket_specs["motor"]["thrust"], 1500)
+            self.assertIsNotNone(ui.last_flight)
+        finally:
+            ui.live_preview.shutdown()
+            tracer.close()
+            window.close()
+            plt.close("all")
+            shutil.rmtree(scratch)
+        app.processEvents()
+
+
+if __name__ == '__main__':
+    unittest.main()
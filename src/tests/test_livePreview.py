@@ -0,0 +1,39 @@
+import unittest
+import json
+import threading
+from src.drivers.aeroCalcs import AeroCalcs
+from src.drivers.closedForm import APOGEE_ERROR, estimate_apogee
+from src.drivers.livePreview import FULL_MAX_STEP, PreviewCancelled, estimate_flight
+
+
+class TestLivePreview(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Load the default rocket specs."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+
+    def test_closed_form_close_to_full(self):
+        """The instant closed-form apogee should be within its error bound of the full run."""
+        closed_form = estimate_apogee([self.rocket_specs])
+        full = estimate_flight(self.rocket_specs)
+        self.assertAlmostEqual(closed_form["apogee"][0], full["apogee"], delta=APOGEE_ERROR * full["apogee"])
+        self.assertGreater(full["burnout_velocity"], 0)
+
+    def test_cancelled_run_stops(self):
+        """A run whose cancel event is set should stop with PreviewCancelled."""
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with self.assertRaises(PreviewCancelled):
+            estimate_flight(self.rocket_specs, FULL_MAX_STEP, cancel_event)
+
+    def test_static_margin(self):
+        """The static margin is the CG-CP distance in airframe diameters."""
+        aero = AeroCalcs(self.rocket_specs)
+        expected = (aero.calculate_center_of_gravity() - aero.calculate_center_of_pressure()) / 3.0
+        self.assertAlmostEqual(aero.calculate_static_margin(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.aeroCalcs import AeroCalcs
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.marginFilter import MarginFilter
+from src.drivers.specUtils import with_field
+from src.drivers.sweepRunner import SweepRunner
+
+
+class TestMarginFilter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build an airframe length sweep from unstable to over-stable designs."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        # Margins of roughly -0.5, 0.4, 2.9, 4.9 and 8.4 calibers
+        cls.designs = [with_field(cls.rocket_specs, "air_frame", "length", length) for length in (10, 20, 40, 55, 80)]
+        cls.designs.append(with_field(cls.rocket_specs, "motor", "thrust", -1))  # Invalid spec
+
+    def test_margins_match_aero_calcs(self):
+        """Margins should equal AeroCalcs.calculate_static_margin, with NaN for invalid specs."""
+        margins = MarginFilter().margins(self.designs)
+        expected = [AeroCalcs(specs).calculate_static_margin() for specs in self.designs[:-1]]
+        np.testing.assert_array_equal(margins[:-1], expected)
+        self.assertTrue(np.isnan(margins[-1]))
+
+    def test_drop_counts(self):
+        """Out-of-band and invalid designs should be dropped and counted."""
+        margin_filter = MarginFilter(min_margin=1.0, max_margin=6.0)
+        runs, _, in_band = margin_filter.apply(self.designs)
+        np.testing.assert_array_equal(runs, [2, 3])
+        np.testing.assert_array_equal(in_band, [False, False, True, True, False, False])
+        counters = margin_filter.counters
+        self.assertEqual((counters["unstable"], counters["overstable"], counters["invalid"]), (2, 1, 1))
+        self.assertEqual(counters["skipped_integrations"], 4)
+
+    def test_flag_only(self):
+        """With drop=False every valid design is kept and only flagged."""
+        runs, _, in_band = MarginFilter(max_margin=6.0, drop=False).apply(self.designs)
+        np.testing.assert_array_equal(runs, [0, 1, 2, 3, 4])
+        self.assertEqual(in_band.sum(), 2)
+
+    def test_sweep_skips_filtered_designs(self):
+        """A filtered sweep should integrate only in-band designs and report the time saved."""
+        margin_filter = MarginFilter(min_margin=1.0, max_margin=6.0)
+        with SweepRunner(self.designs, workers=1, margin_filter=margin_filter).run() as results:
+            apogee = results.summary("apogee")
+            self.assertTrue(np.all(np.isnan(apogee[[0, 1, 4, 5]])))
+            # The two in-band designs share one batch
+            batch = BatchPhysCalcs(self.designs[2:4])
+            t, _, y, _, _ = batch.simulate()
+            np.testing.assert_array_equal(apogee[2:4], batch.summarize(t, y)["apogee"])
+            self.assertIsNone(results.trajectory(0))
+            np.testing.assert_array_equal(results.in_band, [False, False, True, True, False, False])
+        self.assertEqual(margin_filter.counters["integrated"], 2)
+        self.assertGreater(margin_filter.saved_seconds(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
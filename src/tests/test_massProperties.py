@@ -0,0 +1,73 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.aeroArrays import AeroArrays
+from src.drivers.aeroCalcs import AeroCalcs
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.massProperties import MassPropertiesTable
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.specUtils import with_field
+
+
+class TestMassProperties(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build tables for a low-thrust default design and a longer, faster-burning variant."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            rocket_specs = json.load(file)
+        cls.rocket_specs = with_field(rocket_specs, "motor", "thrust", 300)
+        cls.designs = [cls.rocket_specs,
+                       with_field(with_field(cls.rocket_specs, "air_frame", "length", 80), "motor", "burn_time", 2.0)]
+        cls.table = MassPropertiesTable(cls.designs, propellant_fraction=0.5)
+
+    def test_mass_from_components(self):
+        """Mass should start at the component total and lose the propellant by burnout."""
+        components = AeroArrays.from_specs(self.designs).component_masses()
+        total = sum(mass for mass, _ in components.values())
+        np.testing.assert_allclose(self.table.mass[:, 0], total)
+        np.testing.assert_allclose(self.table.mass[:, -1], total - 0.5 * components["motor"][0])
+        for design, burn_time in enumerate(self.table.burn_time):
+            self.assertEqual(self.table.mass_at(burn_time + 5, design), self.table.mass[design, -1])
+
+    def test_cg_matches_aero_calcs_at_ignition(self):
+        """The full-motor CG should be AeroCalcs' CG, and move forward during the burn."""
+        cg = AeroCalcs(self.rocket_specs).calculate_center_of_gravity() * 0.0254
+        self.assertAlmostEqual(self.table.cg[0, 0], cg, places=12)
+        self.assertTrue(np.all(np.diff(self.table.cg, axis=1) > 0))
+        self.assertTrue(np.all(self.table.inertia > 0))
+
+    def test_lookups_agree(self):
+        """Scalar, vectorized and history lookups should interpolate the same table."""
+        self.assertEqual(len(MassPropertiesTable(self.designs)._mass_rows), 0)  # Copied on the first mass_at
+        for t in (0.0, 0.3, 1.7, 3.75, 20.0):
+            masses = self.table.mass_array(t)
+            history = self.table.history(np.array([t]))[:, 0]
+            for design in range(2):
+                self.assertAlmostEqual(self.table.mass_at(t, design), masses[design], places=12)
+                self.assertAlmostEqual(history[design], masses[design], places=12)
+                self.assertAlmostEqual(self.table.properties_at(t, design)[0], masses[design], places=12)
+
+    def test_simulation_mass_history(self):
+        """Simulations with the table should record its mass history in single and batch mode."""
+        phys_calcs = PhysCalcs(self.rocket_specs, mass_table=True)
+        t, x, y, vx, vy = phys_calcs.simulate()
+        self.assertAlmostEqual(phys_calcs.mass[0], self.table.mass[0, 0], places=12)
+        self.assertAlmostEqual(phys_calcs.mass[-1], self.table.mass[0, -1], places=12)
+        self.assertGreater(y.max(), 1000)
+
+        batch = BatchPhysCalcs(self.designs, mass_table=True)
+        summary = batch.simulate(output="summary")
+        single = phys_calcs.simulate(output="summary")
+        self.assertAlmostEqual(summary["apogee"][0], single["apogee"], delta=1e-3 * single["apogee"])
+
+    def test_legacy_mass_is_default(self):
+        """Without the table the legacy initial mass is used."""
+        phys_calcs = PhysCalcs(self.rocket_specs)
+        phys_calcs.simulate()
+        aero_calcs = AeroCalcs(self.rocket_specs)
+        self.assertEqual(phys_calcs.mass[0], aero_calcs.calculate_center_of_gravity() + aero_calcs.spec.motor.mass)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.monteCarlo import NORMAL_CLIP, MonteCarlo
+
+
+def linear_model(rocket_specs_list):
+    """Closed-form stand-in for the simulation: apogee linear in thrust, drift linear in wind."""
+    thrust = np.array([specs["motor"]["thrust"] for specs in rocket_specs_list])
+    wind = np.array([specs["launch_conditions"]["wind"] for specs in rocket_specs_list])
+    return {"apogee": 2.0 * thrust + 0.001 * thrust ** 2, "landing_x": 300.0 * wind + 50.0}
+
+
+class TestMonteCarlo(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Thrust and wind dispersions around the default rocket."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.dispersions = {("motor", "thrust"): ("normal", 100.0), ("launch_conditions", "wind"): ("uniform", 4.0)}
+        thrust = 4000 + 100 * np.random.default_rng(0).standard_normal(2_000_000)
+        cls.true_mean = np.mean(2.0 * thrust + 0.001 * thrust ** 2)
+
+    def study(self, **kwargs):
+        settings = {"tolerances": {"mean_apogee": 2.0, "p99_landing_radius": 20.0}, "simulate": linear_model,
+                    "min_runs": 128}
+        settings.update(kwargs)
+        return MonteCarlo(self.rocket_specs, self.dispersions, **settings)
+
+    def test_designs(self):
+        """Unit points should map through the inverse CDFs, with normal tails clipped."""
+        study = self.study()
+        designs = study.designs(np.array([[0.5, 0.5], [0.0, 1.0], [0.975, 0.25]]))
+        self.assertAlmostEqual(designs[0]["motor"]["thrust"], 4000.0)
+        self.assertAlmostEqual(designs[0]["launch_conditions"]["wind"], 0.0)
+        self.assertAlmostEqual(designs[1]["motor"]["thrust"], 4000.0 - 100 * NORMAL_CLIP)
+        self.assertAlmostEqual(designs[1]["launch_conditions"]["wind"], 4.0)
+        self.assertAlmostEqual(designs[2]["motor"]["thrust"], 4000.0 + 100 * 1.959964, places=3)
+        self.assertAlmostEqual(designs[2]["launch_conditions"]["wind"], -2.0)
+        self.assertEqual(self.rocket_specs["motor"]["thrust"], 4000)
+
+    def test_variance_reduction_converges_sooner(self):
+        """Sobol sampling should meet the tolerances in fewer runs than plain random sampling, with or without pairs."""
+        tolerances = {"mean_apogee": 10.0, "p99_landing_radius": 20.0}
+        reduced = self.study(tolerances=tolerances).run()
+        plain = self.study(sampling="random", tolerances=tolerances).run()
+        paired = self.study(sampling="random", antithetic=True, tolerances=tolerances).run()
+        self.assertTrue(reduced["converged"] and plain["converged"] and paired["converged"])
+        self.assertFalse(reduced["antithetic"])
+        self.assertLess(reduced["runs"], plain["runs"])
+        self.assertLess(reduced["runs"], paired["runs"])
+        value, half_width = reduced["estimates"]["mean_apogee"]
+        self.assertLess(abs(value - self.true_mean), 3 * half_width + 0.5)
+        self.assertLessEqual(half_width, 10.0)
+        # The radius is 300 |wind + 1/6|, so its 99th percentile is close to 300 * (4 + 1/6)
+        self.assertAlmostEqual(reduced["estimates"]["p99_landing_radius"][0], 1250 - 0.02 * 1250, delta=20)
+        self.assertEqual(reduced["saved_runs"], reduced["fixed_runs"] - reduced["runs"])
+        self.assertGreater(reduced["saved_runs"], 0)
+
+    def test_max_runs(self):
+        """A study that cannot meet its tolerances should stop at max_runs without claiming savings."""
+        report = self.study(sampling="lhs", tolerances={"mean_apogee": 1e-6}, max_runs=1024, fixed_runs=5000).run()
+        self.assertFalse(report["converged"])
+        self.assertLessEqual(report["runs"], 1024)
+        self.assertIsNone(report["saved_runs"])
+        self.assertEqual(report["fixed_runs"], 5000)
+
+    def test_rejects_unknown_options(self):
+        with self.assertRaises(ValueError):
+            self.study(sampling="halton")
+        with self.assertRaises(ValueError):
+            MonteCarlo(self.rocket_specs, {("motor", "thrust"): ("lognormal", 1.0)})
+
+    def test_simulated_study(self):
+        """A small study should run end to end on the flight model."""
+        study = MonteCarlo(self.rocket_specs, self.dispersions, replicates=4, batch_size=4, min_runs=32,
+                           tolerances={"mean_apogee": 1e6, "p99_landing_radius": 1e6})
+        report = study.run()
+        self.assertEqual(report["runs"], 32)
+        self.assertTrue(report["converged"])
+        self.assertIn("sobol, 32 runs (converged)", study.format_report())
+
+
+if __name__ == '__main__':
+    unittest.main()
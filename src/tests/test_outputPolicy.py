@@ -0,0 +1,81 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.outputPolicy import OutputPolicy
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.specUtils import with_field
+
+
+class TestOutputPolicy(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Simulate the default rocket once with full output."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.full = PhysCalcs(cls.rocket_specs).simulate()
+
+    def test_full_is_default(self):
+        """Full output should keep every step, the mass history and the dense output."""
+        phys_calcs = PhysCalcs(self.rocket_specs)
+        result = phys_calcs.simulate(output="full")
+        for a, b in zip(result, self.full):
+            np.testing.assert_array_equal(a, b)
+        self.assertEqual(len(phys_calcs.mass), len(result[0]))
+        self.assertIsNotNone(phys_calcs.solution)
+
+    def test_summary_matches_summarize(self):
+        """Streaming summaries should equal summarize() on the stored trajectory."""
+        t, x, y, vx, vy = self.full
+        expected = BatchPhysCalcs.summarize(t, y, vx, vy, x)
+        phys_calcs = PhysCalcs(self.rocket_specs)
+        summary = phys_calcs.simulate(output="summary")
+        for key, value in expected.items():
+            self.assertEqual(summary[key], value[0])
+        self.assertIsNone(phys_calcs.solution)
+
+    def test_batch_summary_matches_summarize(self):
+        """Batch summary output should equal summarize() for every design."""
+        designs = [with_field(self.rocket_specs, "motor", "thrust", thrust) for thrust in (800, 1500, 3000)]
+        batch = BatchPhysCalcs(designs)
+        t, x, y, vx, vy = batch.simulate()
+        expected = batch.summarize(t, y, vx, vy, x)
+        summary = BatchPhysCalcs(designs).simulate(output="summary")
+        for key, value in expected.items():
+            np.testing.assert_array_equal(summary[key], value)
+
+    def test_fixed_rate(self):
+        """Fixed output should be sampled on a uniform grid."""
+        t, x, y, vx, vy = PhysCalcs(self.rocket_specs).simulate(output=OutputPolicy("fixed", dt=0.5))
+        np.testing.assert_allclose(np.diff(t), 0.5)
+        self.assertEqual(len(t), 200)
+        self.assertAlmostEqual(y.max(), self.full[2].max(), delta=5.0)
+
+    def test_adaptive_keeps_key_points(self):
+        """Adaptive output should thin the trajectory but keep the apogee and the last step."""
+        t_full, _, y_full, _, _ = self.full
+        phys_calcs = PhysCalcs(self.rocket_specs)
+        t, x, y, vx, vy = phys_calcs.simulate(output="adaptive")
+        self.assertLess(len(t), len(t_full))
+        self.assertTrue(np.all(np.isin(t, t_full)))
+        self.assertEqual(y.max(), y_full.max())
+        self.assertEqual(t[-1], t_full[-1])
+        self.assertEqual(len(phys_calcs.mass), len(t))
+
+    def test_adaptive_batch(self):
+        """Adaptive batch output should keep every design's apogee step."""
+        designs = [with_field(self.rocket_specs, "motor", "thrust", thrust) for thrust in (800, 3000)]
+        t_full, _, y_full, _, _ = BatchPhysCalcs(designs).simulate()
+        t, x, y, vx, vy = BatchPhysCalcs(designs).simulate(output="adaptive")
+        self.assertEqual(y.shape, (2, len(t)))
+        np.testing.assert_array_equal(y.max(axis=1), y_full.max(axis=1))
+
+    def test_unknown_policy(self):
+        """Unknown policy names should be rejected."""
+        with self.assertRaises(ValueError):
+            PhysCalcs(self.rocket_specs).simulate(output="sparse")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import json
+import os
+import tempfile
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.reportRenderer import ReportPage, ReportRenderer
+from src.drivers.rocketSpec import RocketSpec
+from src.drivers.rocketDrawing import RocketDrawing
+from src.drivers.specUtils import with_field
+
+
+class TestReportRenderer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Three designs that differ in thrust."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.designs = [with_field(cls.rocket_specs, "motor", "thrust", thrust) for thrust in (1500, 2500, 3500)]
+
+    def test_reports_written(self):
+        """Every design should get one file per format, in input order, without pyplot figures."""
+        figures = plt.get_fignums()
+        with tempfile.TemporaryDirectory() as output_dir:
+            paths = ReportRenderer(output_dir, ["png", "pdf"], workers=1, batch_size=2).run(self.designs)
+            self.assertEqual(len(paths), 3)
+            for i, design_paths in enumerate(paths):
+                self.assertEqual([os.path.splitext(path)[1] for path in design_paths], [".png", ".pdf"])
+                self.assertTrue(os.path.basename(design_paths[0]).startswith(f"design_{i:05d}_"))
+                self.assertTrue(all(os.path.getsize(path) > 0 for path in design_paths))
+        self.assertEqual(plt.get_fignums(), figures)
+
+    def test_page_reuses_axes(self):
+        """Rendering more designs should not add axes or accumulate artists."""
+        t, x, y, vx, vy = PhysCalcs(self.rocket_specs).simulate()
+        summary = {"apogee": 1.0, "flight_time": 2.0, "max_velocity": 3.0, "landing_x": 4.0}
+        with tempfile.TemporaryDirectory() as output_dir:
+            page = ReportPage(output_dir)
+            page.render("first", RocketSpec.from_dict(self.rocket_specs), t, x, y, vx, vy, summary)
+            axes = list(page.figure.axes)
+            counts = [len(ax.get_children()) for ax in axes]
+            page.render("second", RocketSpec.from_dict(self.rocket_specs), t, x, y, vx, vy, summary)
+            self.assertEqual(page.figure.axes, axes)
+            self.assertEqual([len(ax.get_children()) for ax in axes], counts)
+
+    def test_page_renders_repeatably(self):
+        """Every render should draw the grid, and a design should come out the same after others."""
+        t, x, y, vx, vy = PhysCalcs(self.rocket_specs).simulate()
+        summary = {"apogee": 1.0, "flight_time": 2.0, "max_velocity": 3.0, "landing_x": 4.0}
+        with tempfile.TemporaryDirectory() as output_dir:
+            page = ReportPage(output_dir)
+            images = []
+            for specs in (self.designs[0], self.designs[2], self.designs[0]):
+                path, = page.render("page", RocketSpec.from_dict(specs), t, x, y, vx, vy, summary)
+                for ax in (page.path_ax, page.altitude_ax):
+                    self.assertTrue(all(line.get_visible() for line in ax.get_xgridlines() + ax.get_ygridlines()))
+                with open(path, "rb") as file:
+                    images.append(file.read())
+        self.assertEqual(images[0], images[2])
+        self.assertNotEqual(images[0], images[1])
+
+    def test_plots_into_given_axes(self):
+        """With ax the plot methods and RocketDrawing should not create pyplot figures."""
+        figures = plt.get_fignums()
+        figure = Figure()
+        ax = figure.add_subplot(111)
+        t = np.linspace(0, 10, 50)
+        lc = PhysCalcs(self.rocket_specs).plot_y_position_with_gradient(t, t * (10 - t), np.abs(10 - 2 * t), ax=ax)
+        self.assertIn(lc, ax.collections)
+        RocketDrawing(self.rocket_specs, 10.0, 12.0)
+        self.assertEqual(plt.get_fignums(), figures)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import json
+import tempfile
+import numpy as np
+from PyQt5 import QtCore
+from src.drivers.aeroArrays import AeroArrays
+from src.drivers.resultsTable import ResultsTable, ResultsTableModel
+from src.drivers.shardedSweep import ShardedSweep
+from src.drivers.specUtils import with_field
+
+
+class TestResultsTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Run a small sharded thrust sweep with one invalid design."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.designs = [with_field(cls.rocket_specs, "motor", "thrust", thrust) for thrust in (3000, 1000, 4000, 2000)]
+        cls.designs.append(with_field(cls.rocket_specs, "motor", "thrust", -1))
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        sweep = ShardedSweep.create(cls.temp_dir.name, cls.designs, shard_size=2)
+        sweep.work()
+        sweep.merge()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def column(self, table, name):
+        return [table.value(row, name) for row in range(len(table))]
+
+    def test_design_columns(self):
+        """Merged results should carry the margin, motor and geometry of each design."""
+        table = ResultsTable.open(self.temp_dir.name)
+        self.assertEqual(table.n_rows, 5)
+        np.testing.assert_array_equal(table.columns["static_margin"][:4],
+                                      AeroArrays.from_specs(self.designs[:4]).calculate_static_margin())
+        np.testing.assert_array_equal(table.columns["thrust"][:4], [3000, 1000, 4000, 2000])
+        self.assertTrue(np.isnan(table.columns["thrust"][4]))
+
+    def test_sort_and_filter(self):
+        """Sorting should keep NaN last either way, and filters should combine."""
+        table = ResultsTable.open(self.temp_dir.name)
+        table.sort("apogee", descending=True)
+        self.assertEqual(self.column(table, "run"), [2, 0, 3, 1, 4])
+        table.sort("apogee")
+        self.assertEqual(self.column(table, "run"), [1, 3, 0, 2, 4])
+        table.set_filter("thrust", low=1500)
+        self.assertEqual(self.column(table, "run"), [3, 0, 2])
+        table.set_filter("thrust", high=3500)
+        self.assertEqual(self.column(table, "run"), [1, 3, 0])
+        table.set_filter("thrust")
+        table.set_valid_only(True)
+        self.assertEqual(self.column(table, "run"), [1, 3, 0, 2])
+
+    def test_design_lookup(self):
+        """A visible row should map back to its design's specs."""
+        table = ResultsTable.open(self.temp_dir.name)
+        table.sort("thrust", descending=True)
+        self.assertEqual(table.design(0), self.designs[2])
+        self.assertEqual(table.design(3), self.designs[1])
+
+    def test_model(self):
+        """The model should format cells on request and sort through the table."""
+        model = ResultsTableModel(ResultsTable.open(self.temp_dir.name))
+        names = model.table.names
+        self.assertEqual(model.rowCount(), 5)
+        self.assertEqual(model.headerData(names.index("apogee"), QtCore.Qt.Horizontal), "Apogee (m)")
+        model.sort(names.index("thrust"), QtCore.Qt.AscendingOrder)
+        self.assertEqual(model.data(model.index(0, names.index("thrust"))), "1000")
+        self.assertEqual(model.data(model.index(4, names.index("apogee"))), "-")
+        self.assertTrue(model.data(model.index(0, names.index("total_impulse"))).startswith("L"))
+
+
+if __name__ == '__main__':
+    unittest.main()
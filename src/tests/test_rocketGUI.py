@@ -0,0 +1,62 @@
+import os
+import unittest
+import json
+import shutil
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # No display needed
+
+import matplotlib.pyplot as plt
+from PyQt5 import QtCore, QtWidgets
+from rocketGUI import Ui_MainWindow
+
+
+class TestRocketGUI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        """Build the GUI on a scratch copy of the specs file."""
+        self.window = QtWidgets.QMainWindow()
+        self.ui = Ui_MainWindow()
+        self.ui.setupUi(self.window)
+        self.scratch = tempfile.mkdtemp()
+        self.ui.json_path = shutil.copy(self.ui.json_path, os.path.join(self.scratch, "rocket_specs.json"))
+
+    def tearDown(self):
+        self.ui.live_preview.shutdown()
+        self.window.close()
+        # Delete the window now rather than leaving it to the garbage collector mid-way through a later test
+        self.window.deleteLater()
+        QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+        plt.close("all")
+        shutil.rmtree(self.scratch)
+
+    def test_invalid_design_is_reported(self):
+        """Zero nose cone length or fin semi-span should be shown as a message, not escape the slots."""
+        # Plot a valid design first, so the invalid one has a previous flight to discard
+        self.ui.plot_y_position()
+        self.assertIsNotNone(self.ui.last_flight)
+        for section, key in (("nose_cone", "length"), ("fins", "semi_span")):
+            with self.subTest(field=f"{section}.{key}"):
+                self.ui.update_json(section, key, 0.0)
+                self.ui.display_rocket_design()
+                texts = [text.get_text() for text in self.ui.design_figure.axes[0].texts]
+                self.assertTrue(any(f"{section}.{key}" in text for text in texts), texts)
+
+                self.ui.plot_y_position()
+                self.assertTrue(self.ui.flight_message.get_visible())
+                self.assertIn(f"{section}.{key}", self.ui.flight_message.get_text())
+                self.assertIsNone(self.ui.last_flight)
+
+                # A valid design plots again and hides the message
+                self.ui.update_json(section, key, 5.0)
+                self.ui.plot_y_position()
+                self.assertFalse(self.ui.flight_message.get_visible())
+                self.assertIsNotNone(self.ui.last_flight)
+
+
+if __name__ == '__main__':
+    unittest.main()
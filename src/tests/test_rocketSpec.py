@@ -0,0 +1,71 @@
+import unittest
+import copy
+import dataclasses
+import json
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.rocketSpec import RocketSpec
+
+
+class TestRocketSpec(unittest.TestCase):
+
+    def setUp(self):
+        """Load the default rocket specs."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            self.rocket_specs = json.load(file)
+
+    def invalid(self, section, key, value):
+        specs = copy.deepcopy(self.rocket_specs)
+        if value is None:
+            del specs[section][key]
+        else:
+            specs[section][key] = value
+        return specs
+
+    def test_converts_to_si(self):
+        """JSON fields should be converted from their declared units to SI."""
+        spec = RocketSpec.from_dict(self.rocket_specs)
+        self.assertAlmostEqual(spec.air_frame.diameter, self.rocket_specs["air_frame"]["diameter"] * 0.0254)
+        self.assertAlmostEqual(spec.motor.mass, self.rocket_specs["motor"]["mass"] / 1000)
+        self.assertAlmostEqual(spec.motor.diameter, self.rocket_specs["motor"]["diameter"] / 1000)
+        self.assertAlmostEqual(spec.material.density, self.rocket_specs["material"]["density"] * 1000)
+        self.assertEqual(spec.fins.form, self.rocket_specs["fins"]["form"])
+
+    def test_frozen(self):
+        """A compiled spec should be immutable."""
+        spec = RocketSpec.from_dict(self.rocket_specs)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            spec.motor.thrust = 0
+
+    def test_round_trip(self):
+        """to_dict should give back the original JSON values."""
+        round_trip = RocketSpec.from_dict(self.rocket_specs).to_dict()
+        for section, values in self.rocket_specs.items():
+            for key, value in values.items():
+                if isinstance(value, str):
+                    self.assertEqual(round_trip[section][key], value)
+                else:
+                    self.assertAlmostEqual(round_trip[section][key], value)
+
+    def test_rejects_invalid_specs(self):
+        """Missing, non-positive or inconsistent fields should raise ValueError."""
+        cases = [
+            ("motor", "thrust", -100),
+            ("motor", "burn_time", None),
+            ("air_frame", "diameter", "3"),
+            ("fins", "form", 2.5),
+            ("nose_cone", "shape", "blunt"),
+            ("material", "thickness", 100),
+        ]
+        for section, key, value in cases:
+            with self.subTest(field=f"{section}.{key}", value=value):
+                with self.assertRaises(ValueError):
+                    RocketSpec.from_dict(self.invalid(section, key, value))
+
+    def test_phys_calcs_validates_before_simulating(self):
+        """PhysCalcs should reject an invalid spec when it is constructed."""
+        with self.assertRaises(ValueError):
+            PhysCalcs(self.invalid("parachute", "area", 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
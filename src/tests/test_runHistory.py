@@ -0,0 +1,72 @@
+import unittest
+import json
+import numpy as np
+from matplotlib.figure import Figure
+from src.drivers.runHistory import RunHistory, RunOverlay
+from src.drivers.specUtils import with_field
+
+
+class TestRunHistory(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Synthetic trajectories for designs that differ in thrust."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.t = np.linspace(0, 50, 1001)
+        cls.designs = [with_field(cls.rocket_specs, "motor", "thrust", 1000 + 100 * i) for i in range(20)]
+
+    def add(self, history, i):
+        y = (100 + i) * self.t * (50 - self.t)
+        return history.add(self.designs[i], self.t, y, np.abs(np.gradient(y, self.t)), {"apogee": y.max()})
+
+    def test_capacity_and_order(self):
+        """Only the newest runs should be kept, oldest first, with fixed memory."""
+        history = RunHistory(capacity=4, points=64)
+        nbytes = history.nbytes
+        for i in range(10):
+            self.add(history, i)
+        runs = history.runs()
+        self.assertEqual(len(history), 4)
+        self.assertEqual([r.run for r in runs], [7, 8, 9, 10])
+        self.assertEqual(history.nbytes, nbytes)
+        self.assertEqual(runs[-1].y.shape, (64,))
+        self.assertEqual(runs[-1].t.dtype, np.float32)
+
+    def test_rerun_replaces_entry(self):
+        """Re-running a design should move it to the newest slot instead of adding a copy."""
+        history = RunHistory(capacity=4)
+        for i in (0, 1, 2):
+            self.add(history, i)
+        record = self.add(history, 0)
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.runs()[-1].spec_hash, record.spec_hash)
+        self.assertEqual([r.run for r in history.runs()], [2, 3, 4])
+
+    def test_downsampled_trajectory(self):
+        """Stored trajectories should span the run and track the original closely."""
+        history = RunHistory(points=256)
+        record = self.add(history, 3)
+        y = 103 * self.t * (50 - self.t)
+        self.assertAlmostEqual(record.t[-1], 50.0, places=4)
+        np.testing.assert_allclose(record.y, np.interp(record.t, self.t, y), rtol=1e-6, atol=1e-2)
+        self.assertAlmostEqual(record.summary["apogee"], y.max())
+
+    def test_overlay_reuses_artists(self):
+        """Overlay updates should reuse the same lines and hide unused ones."""
+        history = RunHistory(capacity=5)
+        ax = Figure().add_subplot(111)
+        overlay = RunOverlay(ax, history.capacity)
+        lines = list(ax.lines)
+        for i in range(8):
+            self.add(history, i)
+            shown = overlay.update(history.runs())
+        self.assertEqual(ax.lines[:], lines)
+        self.assertEqual(len(shown), 5)
+        self.assertEqual(shown[-1].get_label(), f"Run 8: {history.runs()[-1].summary['apogee']:.0f}")
+        overlay.update(history.runs()[:2])
+        self.assertEqual(sum(line.get_visible() for line in lines), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import json
+import os
+import tempfile
+from src.drivers.runMetrics import RunMetrics
+from src.drivers.shardedSweep import ShardedSweep
+from src.drivers.specUtils import with_field
+from src.drivers.sweepRunner import SweepRunner
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRunMetrics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a small thrust sweep with one invalid design."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.designs = [with_field(cls.rocket_specs, "motor", "thrust", thrust) for thrust in (1000, 2000, 3000)]
+        cls.invalid = with_field(cls.rocket_specs, "motor", "thrust", -1)
+
+    def test_rates_and_utilization(self):
+        """Rates and utilization should cover the last export window only."""
+        clock = FakeClock()
+        metrics = RunMetrics(clock=clock)
+        clock.now = 10.0
+        metrics.record(8, 4.0, worker="a")
+        metrics.record(8, 4.0, worker="b", failures=1)
+        metrics.set_queue_depth(3)
+        first = metrics.snapshot(advance=True)
+        self.assertEqual(first["runs"], 16)
+        self.assertEqual(first["failures"], 1)
+        self.assertAlmostEqual(first["runs_per_second"], 1.6)
+        self.assertAlmostEqual(first["workers"]["a"]["utilization"], 0.4)
+        self.assertEqual(first["latency_seconds"]["p50"], 4.0)
+
+        # A task spanning two windows only counts its overlap with the second
+        clock.now = 15.0
+        metrics.record(8, 8.0, worker="a")
+        second = metrics.snapshot()
+        self.assertAlmostEqual(second["runs_per_second"], 8 / 5)
+        self.assertAlmostEqual(second["workers"]["a"]["utilization"], 1.0)
+        self.assertAlmostEqual(second["workers"]["a"]["mean_utilization"], 12 / 9)  # Overlapping tasks
+        self.assertAlmostEqual(second["workers"]["b"]["seconds_since_done"], 5.0)
+        self.assertEqual(second["queue_depth"], 3)
+
+    def test_exports(self):
+        """Exports should rewrite the Prometheus file and append to the JSONL series."""
+        metrics = RunMetrics()
+        metrics.record_cache(True)
+        metrics.record_cache(False)
+        metrics.record(4, 0.5, worker=7)
+        with tempfile.TemporaryDirectory() as directory:
+            metrics.prometheus_path = os.path.join(directory, "sweep.prom")
+            metrics.jsonl_path = os.path.join(directory, "sweep.jsonl")
+            metrics.export()
+            metrics.export()
+            with open(metrics.prometheus_path, "r") as file:
+                text = file.read()
+            with open(metrics.jsonl_path, "r") as file:
+                series = [json.loads(line) for line in file]
+        self.assertIn("rocket_runs_total 4\n", text)
+        self.assertIn("rocket_cache_hit_ratio 0.5\n", text)
+        self.assertIn('rocket_run_latency_seconds{quantile="0.99"} 0.5\n', text)
+        self.assertIn("rocket_run_latency_seconds_count 4\n", text)
+        self.assertIn('rocket_worker_utilization{worker="7"}', text)
+        self.assertEqual(len(series), 2)
+        self.assertEqual(series[-1]["cache_hit_rate"], 0.5)
+
+    def test_sweep_reports_batches(self):
+        """A sweep should report every batch and end with an empty queue."""
+        metrics = RunMetrics()
+        with SweepRunner(self.designs, workers=1, batch_size=2, store_trajectories=False,
+                         metrics=metrics).run():
+            pass
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot["runs"], snapshot["tasks"], snapshot["queue_depth"]), (3, 2, 0))
+        self.assertEqual(snapshot["workers"][str(os.getpid())]["runs"], 3)
+
+    def test_sharded_sweep_counts_failures(self):
+        """Invalid designs in a shard should count as failures."""
+        metrics = RunMetrics()
+        with tempfile.TemporaryDirectory() as directory:
+            sweep = ShardedSweep.create(directory, self.designs + [self.invalid], shard_size=2)
+            sweep.work(metrics=metrics)
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot["runs"], snapshot["failures"], snapshot["queue_depth"]), (3, 1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
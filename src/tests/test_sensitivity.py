@@ -0,0 +1,56 @@
+import unittest
+import json
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.sensitivity import SensitivityAnalysis
+from src.drivers.specUtils import numeric_fields, with_field
+
+
+class TestSensitivityAnalysis(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Run the sensitivity analysis once on the default rocket specs."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.analysis = SensitivityAnalysis(cls.rocket_specs)
+        cls.rows = cls.analysis.run()
+
+    def test_covers_every_numeric_field(self):
+        """There should be one row per numeric field in the specs."""
+        fields = {(row["section"], row["key"]) for row in self.rows}
+        self.assertEqual(fields, set(numeric_fields(self.rocket_specs)))
+        self.assertNotIn(("nose_cone", "shape"), fields)
+
+    def test_ranked_by_apogee_influence(self):
+        """Rows should be sorted by decreasing normalized apogee sensitivity."""
+        magnitudes = [abs(row["rel_apogee"]) for row in self.rows]
+        self.assertEqual(magnitudes, sorted(magnitudes, reverse=True))
+
+    def test_thrust_derivative_matches_sequential_runs(self):
+        """The batched thrust derivative should match two sequential simulations."""
+        h = self.analysis.step_size(self.rocket_specs["motor"]["thrust"])
+        apogees = []
+        for sign in (1, -1):
+            specs = with_field(self.rocket_specs, "motor", "thrust", self.rocket_specs["motor"]["thrust"] + sign * h)
+            t, _, y, _, _ = PhysCalcs(specs).simulate()
+            apogees.append(BatchPhysCalcs.summarize(t, y)["apogee"][0])
+        expected = (apogees[0] - apogees[1]) / (2 * h)
+
+        row = next(r for r in self.rows if (r["section"], r["key"]) == ("motor", "thrust"))
+        self.assertGreater(row["d_apogee"], 0)
+        self.assertAlmostEqual(row["d_apogee"], expected, delta=0.05 * abs(expected))
+
+    def test_unused_field_has_zero_sensitivity(self):
+        """Fields the flight model ignores should have no influence."""
+        row = next(r for r in self.rows if (r["section"], r["key"]) == ("fins", "sweep_angle"))
+        self.assertEqual(row["d_apogee"], 0)
+
+    def test_format_table(self):
+        """The text table should have a header, a rule and one line per field."""
+        table = self.analysis.format_table()
+        self.assertEqual(len(table.splitlines()), len(self.rows) + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import json
+import os
+import tempfile
+import time
+import numpy as np
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.shardedSweep import ShardedSweep, load_columns
+from src.drivers.specUtils import with_field
+
+
+class TestShardedSweep(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a small thrust sweep with one invalid design."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.designs = [with_field(cls.rocket_specs, "motor", "thrust", thrust) for thrust in (1000, 2000, 3000, 4000)]
+        cls.designs.append(with_field(cls.rocket_specs, "motor", "thrust", -1))
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+        self.sweep = ShardedSweep.create(self.directory, self.designs, shard_size=2)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_deterministic_manifests(self):
+        """Shards should cover consecutive runs, and re-creating the same study is a no-op."""
+        self.assertEqual(self.sweep.n_shards, 3)
+        with open(os.path.join(self.directory, "shards", "shard_00001.json"), "r") as file:
+            self.assertEqual([run for run, _ in json.load(file)["runs"]], [2, 3])
+        ShardedSweep.create(self.directory, self.designs, shard_size=2)
+        with self.assertRaises(ValueError):
+            ShardedSweep.create(self.directory, self.designs[:3], shard_size=2)
+
+    def test_work_and_merge(self):
+        """Workers should finish every shard once, and the merge should match a direct batch."""
+        first = self.sweep.work(worker_id="a")
+        second = ShardedSweep(self.directory).work(worker_id="b")
+        self.assertEqual(sorted(first), [0, 1, 2])
+        self.assertEqual(second, [])
+
+        merged = self.sweep.merge()
+        np.testing.assert_array_equal(merged["run"], np.arange(5))
+        np.testing.assert_array_equal(merged["valid"], [True, True, True, True, False])
+        batch = BatchPhysCalcs(self.designs[:2])
+        t, x, y, vx, vy = batch.simulate()
+        np.testing.assert_array_equal(merged["apogee"][:2], batch.summarize(t, y)["apogee"])
+        self.assertTrue(np.isnan(merged["apogee"][4]))
+        # The merged set is also saved as one .npy per field
+        saved = load_columns(os.path.join(self.directory, "merged"))
+        np.testing.assert_array_equal(saved["flight_time"], merged["flight_time"])
+
+    def test_claims_are_exclusive(self):
+        """A held lock should keep other workers off the shard until it goes stale."""
+        self.assertEqual(self.sweep.claim("a"), 0)
+        self.assertEqual(self.sweep.claim("b"), 1)
+        # Simulate a crashed worker by ageing its lock
+        lock = os.path.join(self.directory, "locks", "shard_00000.lock")
+        os.utime(lock, (time.time() - 3600, time.time() - 3600))
+        self.assertEqual(self.sweep.claim("c"), 0)
+
+    def test_merge_requires_every_shard(self):
+        """Merging before every shard is done should fail."""
+        self.sweep.run_shard(0)
+        with self.assertRaises(RuntimeError):
+            self.sweep.merge()
+
+
+if __name__ == '__main__':
+    unittest.main()
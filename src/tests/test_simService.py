@@ -0,0 +1,86 @@
+import unittest
+import asyncio
+import json
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.runMetrics import RunMetrics
+from src.drivers.simService import SimulationService, request
+from src.drivers.specUtils import with_field
+
+
+class TestSimulationService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Load the default rocket specs."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+
+    def run_service(self, scenario, **kwargs):
+        """Start a service on a free port, run the scenario coroutine against it and stop it."""
+        async def main():
+            service = SimulationService(port=0, workers=1, **kwargs)
+            await service.start()
+            try:
+                return await scenario(service)
+            finally:
+                await service.stop()
+        return asyncio.run(main())
+
+    def test_matches_direct_simulation(self):
+        """The served summary should equal a direct PhysCalcs run."""
+        async def scenario(service):
+            return await service.simulate(self.rocket_specs)
+        result = self.run_service(scenario)
+        t, x, y, vx, vy = PhysCalcs(self.rocket_specs).simulate()
+        expected = BatchPhysCalcs.summarize(t, y, vx, vy, x)
+        self.assertAlmostEqual(result["apogee"], expected["apogee"][0])
+        self.assertAlmostEqual(result["flight_time"], expected["flight_time"][0])
+
+    def test_coalesces_and_caches(self):
+        """Concurrent identical requests should share one job; repeats should hit the cache."""
+        async def scenario(service):
+            results = await asyncio.gather(*[service.simulate(self.rocket_specs) for _ in range(4)])
+            await service.simulate(self.rocket_specs)
+            return results, service.metrics()
+        results, metrics = self.run_service(scenario)
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertEqual(metrics["jobs"], 1)
+        self.assertEqual(metrics["coalesced"], 3)
+        self.assertEqual(metrics["cache_hits"], 1)
+        self.assertEqual(metrics["queue_depth"], 0)
+
+    def test_run_metrics(self):
+        """Run metrics should count cache lookups and finished jobs."""
+        run_metrics = RunMetrics()
+
+        async def scenario(service):
+            await asyncio.gather(*[service.simulate(self.rocket_specs) for _ in range(3)])
+            await service.simulate(self.rocket_specs)
+        self.run_service(scenario, run_metrics=run_metrics)
+        snapshot = run_metrics.snapshot()
+        self.assertEqual((snapshot["runs"], snapshot["cache_hits"], snapshot["cache_misses"]), (1, 1, 3))
+        self.assertEqual(snapshot["queue_depth"], 0)
+
+    def test_http_endpoints(self):
+        """The HTTP API should serve results, metrics and reject invalid specs."""
+        async def scenario(service):
+            loop = asyncio.get_running_loop()
+            call = lambda *args: loop.run_in_executor(None, lambda: request(*args, port=service.port))
+            ok = await call("/simulate", {"rocket_specs": self.rocket_specs, "trajectory": True})
+            bad = await call("/simulate", {"rocket_specs": with_field(self.rocket_specs, "motor", "mass", -1)})
+            metrics = await call("/metrics")
+            missing = await call("/nowhere")
+            return ok, bad, metrics, missing
+        ok, bad, metrics, missing = self.run_service(scenario)
+        self.assertEqual(ok[0], 200)
+        self.assertEqual(len(ok[1]["trajectory"]["t"]), len(ok[1]["trajectory"]["y"]))
+        self.assertEqual(bad[0], 400)
+        self.assertEqual(metrics[0], 200)
+        self.assertEqual(metrics[1]["requests"], 2)
+        self.assertIsNotNone(metrics[1]["latency_ms"]["p50"])
+        self.assertEqual(missing[0], 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
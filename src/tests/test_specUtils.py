@@ -0,0 +1,15 @@
+import unittest
+from src.drivers.specUtils import motor_class
+
+
+class TestSpecUtils(unittest.TestCase):
+
+    def test_motor_class(self):
+        """Impulse classes should follow the doubling letter scale."""
+        self.assertEqual(motor_class(2.5), "A")
+        self.assertEqual(motor_class(2.6), "B")
+        self.assertEqual(motor_class(15000), "N")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import json
+import os
+import tempfile
+import numpy as np
+from src.drivers.surrogate import Surrogate
+
+
+class TestSurrogate(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a small two-parameter surrogate in a temporary directory."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmpdir.name, "surrogate.bin")
+        cls.parameters = [("motor", "thrust", 2000.0, 4000.0), ("air_frame", "length", 40.0, 60.0)]
+        Surrogate.build(cls.rocket_specs, cls.path, parameters=cls.parameters, points=3)
+        cls.surrogate = Surrogate(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.surrogate
+        cls.tmpdir.cleanup()
+
+    def test_memory_mapped(self):
+        """The tables should be read through memory maps, not loaded into RAM."""
+        self.assertIsInstance(self.surrogate.values, np.memmap)
+        self.assertIsInstance(self.surrogate.errors, np.memmap)
+        self.assertEqual(self.surrogate.values.shape, (3, 3, 3))
+        self.assertEqual(self.surrogate.errors.shape, (2, 2, 3))
+
+    def test_grid_node_matches_simulation(self):
+        """At a grid node the surrogate should reproduce the full simulation."""
+        point = [3000.0, 50.0]
+        estimate = self.surrogate.query(point)
+        exact = self.surrogate.exact(point)
+        for name in ("apogee", "max_velocity", "flight_time"):
+            self.assertAlmostEqual(estimate[name], exact[name], delta=1e-3 * abs(exact[name]))
+
+    def test_reported_error_at_cell_centre(self):
+        """At a cell centre the reported error should equal the actual error."""
+        point = [2500.0, 45.0]
+        estimate = self.surrogate.query(point)
+        exact = self.surrogate.exact(point)
+        actual = abs(estimate["apogee"] - exact["apogee"])
+        self.assertAlmostEqual(estimate["apogee_error"], actual, delta=1e-3 * exact["apogee"])
+
+    def test_vectorized_query(self):
+        """Querying many points at once should match querying them one by one."""
+        points = np.array([[2100.0, 41.0], [3900.0, 59.0], [5000.0, 50.0]])
+        batch = self.surrogate.query(points)
+        for i, point in enumerate(points):
+            self.assertAlmostEqual(batch["apogee"][i], self.surrogate.query(point)["apogee"])
+        np.testing.assert_array_equal(batch["in_range"], [True, True, False])
+
+    def test_rejects_other_files(self):
+        """Files without the surrogate magic should be refused."""
+        path = os.path.join(self.tmpdir.name, "other.bin")
+        with open(path, "wb") as file:
+            file.write(b"not a surrogate")
+        with self.assertRaises(ValueError):
+            Surrogate(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
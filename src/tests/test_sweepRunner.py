@@ -0,0 +1,62 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.specUtils import with_field
+from src.drivers.sweepRunner import SUMMARY_FIELDS, SharedResults, SweepRunner
+
+
+class TestSweepRunner(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a small thrust sweep around the default rocket specs."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.designs = [with_field(cls.rocket_specs, "motor", "thrust", thrust)
+                       for thrust in (1000, 2000, 3000, 4000)]
+
+    def test_parallel_matches_batch(self):
+        """Parallel results should equal simulating each design on its own."""
+        with SweepRunner(self.designs, workers=2, batch_size=1).run() as results:
+            for i, specs in enumerate(self.designs):
+                batch = BatchPhysCalcs([specs])
+                t, x, y, vx, vy = batch.simulate()
+                expected = batch.summarize(t, y, vx, vy, x)
+                for field in SUMMARY_FIELDS:
+                    self.assertAlmostEqual(results.summary(field)[i], expected[field][0])
+                np.testing.assert_array_equal(results.trajectory(i)[:, 2], y[0])
+
+    def test_results_are_views(self):
+        """Summaries and trajectories should be read straight from shared memory."""
+        with SweepRunner(self.designs, workers=1).run() as results:
+            self.assertFalse(results.summaries.flags.owndata)
+            trajectory = results.trajectory(0)
+            self.assertTrue(np.shares_memory(trajectory, results.trajectories))
+            # Ragged rows are packed back to back without gaps
+            lengths = results.index[:, 1]
+            self.assertEqual(results.counter.value, lengths.sum())
+
+    def test_overflow_keeps_summary(self):
+        """Runs whose trajectory does not fit keep their summary but no trajectory."""
+        runner = SweepRunner(self.designs[:2], workers=1, batch_size=1, points_per_run=600)
+        with runner.run() as results:
+            self.assertFalse(np.isnan(results.summaries).any())
+            self.assertIsNone(results.trajectory(1))
+
+    def test_summaries_only(self):
+        """Without trajectories only the summary table is filled."""
+        with SweepRunner(self.designs, workers=1, store_trajectories=False).run() as results:
+            self.assertTrue((results.index[:, 0] == -1).all())
+            self.assertTrue((results.summary("apogee") > 0).all())
+
+    def test_write_and_read(self):
+        """A summary row and trajectory written by hand should read back unchanged."""
+        with SharedResults(1, 10) as results:
+            trajectory = np.arange(15.0).reshape(3, 5)
+            results.write(0, dict.fromkeys(SUMMARY_FIELDS, 1.0), trajectory)
+            np.testing.assert_array_equal(results.trajectory(0), trajectory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import json
+import numpy as np
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.trajectoryAnalytics import FlightEvents, TrajectoryAnalytics
+
+
+class TestTrajectoryAnalytics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Simulate and analyze the default rocket once."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.phys_calcs = PhysCalcs(cls.rocket_specs)
+        cls.analytics = TrajectoryAnalytics.run(cls.phys_calcs)
+        cls.events = cls.analytics.events()
+
+    def test_series_shapes(self):
+        """Derived series should cover every solver step, with speed from the returned velocities."""
+        a = self.analytics
+        for series in (a.speed, a.mach, a.dynamic_pressure, a.acceleration):
+            self.assertEqual(series.shape, a.t.shape)
+        np.testing.assert_array_equal(a.speed, np.sqrt(a.vx**2 + a.vy**2))
+
+    def test_apogee_and_landing_match_summary(self):
+        """Exact event times should agree with the interpolated batch summary."""
+        a = self.analytics
+        summary = BatchPhysCalcs.summarize(a.t, a.y)
+        self.assertAlmostEqual(self.events.apogee, summary["apogee"][0], delta=0.5)
+        self.assertAlmostEqual(self.events.landing_time, summary["flight_time"][0], delta=0.05)
+        # Vertical velocity of the raw state vanishes at apogee
+        self.assertAlmostEqual(self.phys_calcs.solution(self.events.apogee_time)[3], 0.0, places=6)
+
+    def test_events_are_ordered(self):
+        """Burnout, apogee and landing should happen in order; maxima during the ascent."""
+        e = self.events
+        self.assertLess(e.burnout_time, e.apogee_time)
+        self.assertLess(e.apogee_time, e.landing_time)
+        for time in (e.max_q_time, e.max_acceleration_time, e.max_mach_time):
+            self.assertLessEqual(time, e.apogee_time)
+        self.assertEqual(e.deployment_time, e.apogee_time)
+        self.assertIsInstance(e, FlightEvents)
+        self.assertIn("max_q", e.as_dict())
+
+    def test_max_acceleration_at_burnout(self):
+        """Thrust-to-mass peaks at the end of the burn, which the refinement should find."""
+        motor = self.phys_calcs.motor
+        state = self.phys_calcs.solution(motor.burn_time)
+        expected = np.hypot(*self.phys_calcs.dynamics(motor.burn_time, state, motor.burn_time, motor.thrust)[2:4])
+        self.assertAlmostEqual(self.events.max_acceleration_time, motor.burn_time)
+        self.assertAlmostEqual(self.events.max_acceleration, expected)
+
+    def test_acceleration_matches_model(self):
+        """The vectorized acceleration should equal PhysCalcs.dynamics step by step, whatever the model options."""
+        specs = json.loads(json.dumps(self.rocket_specs))
+        specs["launch_conditions"]["wind"] = 15.0
+        for phys_calcs in (self.phys_calcs, PhysCalcs(specs, drag_table=True, mass_table=True)):
+            with self.subTest(wind=phys_calcs.wind is not None):
+                analytics = self.analytics if phys_calcs is self.phys_calcs else TrajectoryAnalytics.run(phys_calcs)
+                motor = phys_calcs.motor
+                expected = [np.hypot(*phys_calcs.dynamics(s, column, motor.burn_time, motor.thrust)[2:4])
+                            for s, column in zip(analytics.t, analytics.state.T)]
+                np.testing.assert_allclose(analytics.acceleration, expected, rtol=1e-9, atol=1e-9)
+
+    def test_refined_apogee_bounds_samples(self):
+        """The refined apogee should lie at or just above the highest solver step."""
+        highest = self.analytics.state[1].max()
+        self.assertGreaterEqual(self.events.apogee, highest)
+        self.assertLess(self.events.apogee - highest, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
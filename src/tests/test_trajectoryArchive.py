@@ -0,0 +1,103 @@
+import unittest
+import json
+import os
+import tempfile
+from unittest import mock
+import numpy as np
+from src.drivers.specUtils import spec_hash
+from src.drivers.trajectoryArchive import TrajectoryArchive, TrajectoryArchiveWriter
+
+
+def make_run(n, scale):
+    """A synthetic run of n rows whose values are easy to check."""
+    t = np.linspace(0, 10, n)
+    return {"t": t, "x": scale * t, "y": scale * t**2, "vx": np.full(n, scale),
+            "vy": 2 * scale * t, "mass": np.full(n, 5.0)}
+
+
+class TestTrajectoryArchive(unittest.TestCase):
+
+    def setUp(self):
+        """Write five runs of different lengths in chunks of two."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "archive")
+        with open("src/config/rocket_specs.json", "r") as file:
+            self.rocket_specs = json.load(file)
+        self.lengths = [10, 20, 5, 7, 12]
+        with TrajectoryArchiveWriter(self.path, chunk_runs=2) as writer:
+            for i, n in enumerate(self.lengths):
+                writer.add_run(make_run(n, i + 1), metadata={"run": i}, rocket_specs=self.rocket_specs)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_random_access(self):
+        """Any run should read back with its own length and values."""
+        archive = TrajectoryArchive(self.path)
+        self.assertEqual(len(archive), 5)
+        self.assertEqual(len(archive.chunks), 3)
+        for i in (4, 0, 3):
+            run = archive.run(i)
+            self.assertEqual(len(run["t"]), self.lengths[i])
+            np.testing.assert_allclose(run["x"], make_run(self.lengths[i], i + 1)["x"], rtol=1e-6)
+            self.assertIsInstance(run["y"], np.memmap)
+
+    def test_metadata(self):
+        """Metadata should include the caller's fields and the spec hash."""
+        archive = TrajectoryArchive(self.path)
+        metadata = archive.metadata(3)
+        self.assertEqual(metadata["run"], 3)
+        self.assertEqual(metadata["spec_hash"], spec_hash(self.rocket_specs))
+
+    def test_float32_downcast(self):
+        """Columns are stored as float32 unless asked otherwise."""
+        archive = TrajectoryArchive(self.path)
+        self.assertEqual(archive.run(0)["t"].dtype, np.float32)
+
+    def test_append(self):
+        """Reopening an archive appends new chunks after the existing ones."""
+        with TrajectoryArchiveWriter(self.path, chunk_runs=2) as writer:
+            writer.add_run(make_run(3, 9))
+        archive = TrajectoryArchive(self.path)
+        self.assertEqual(len(archive), 6)
+        self.assertEqual(len(archive.run(5)["t"]), 3)
+
+    def test_chunk_scan(self):
+        """Scanning chunks should give per-run reductions for every run."""
+        archive = TrajectoryArchive(self.path)
+        peaks = []
+        for start, offsets, columns in archive.iter_chunks():
+            peaks.extend(np.maximum.reduceat(columns["y"], offsets[:-1]))
+        np.testing.assert_allclose(peaks, [100 * (i + 1) for i in range(5)], rtol=1e-6)
+
+    def test_crash_before_manifest(self):
+        """A chunk renamed into place before a crash, but never listed, is replaced by the next flush."""
+        writer = TrajectoryArchiveWriter(self.path, chunk_runs=2)
+        writer.add_run(make_run(4, 7))
+        with mock.patch.object(writer, "_write_manifest", side_effect=OSError("crash")):
+            with self.assertRaises(OSError):
+                writer.flush()
+        self.assertTrue(os.path.isdir(os.path.join(self.path, "chunk_00003")))
+
+        with TrajectoryArchiveWriter(self.path, chunk_runs=2) as writer:
+            writer.add_run(make_run(3, 9))
+        archive = TrajectoryArchive(self.path)
+        self.assertEqual(len(archive), 6)
+        np.testing.assert_allclose(archive.run(5)["x"], make_run(3, 9)["x"], rtol=1e-6)
+
+    def test_mismatched_columns(self):
+        """Columns of different lengths are rejected."""
+        run = make_run(4, 1)
+        run["x"] = run["x"][:3]
+        with TrajectoryArchiveWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.add_run(run)
+
+    def test_out_of_range(self):
+        """Run indices past the end raise IndexError."""
+        with self.assertRaises(IndexError):
+            TrajectoryArchive(self.path).run(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
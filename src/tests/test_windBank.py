@@ -0,0 +1,97 @@
+import unittest
+import json
+import os
+import pickle
+import tempfile
+import numpy as np
+from src.drivers.batchSim import BatchPhysCalcs
+from src.drivers.physCalcs import PhysCalcs
+from src.drivers.specUtils import with_field
+from src.drivers.sweepRunner import SweepRunner
+from src.drivers.windBank import REFERENCE_HEIGHT, WindBank, WindProfiles, shear_profile
+
+
+class TestWindBank(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a small bank: calm, 5 m/s and 15 m/s, three gusty profiles each."""
+        with open("src/config/rocket_specs.json", "r") as file:
+            cls.rocket_specs = json.load(file)
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.bank = WindBank.create(os.path.join(cls.temp_dir.name, "bank"), [0.0, 5.0, 15.0], ensemble=3, seed=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_bank_layout(self):
+        """Profiles should be memory-mapped, grouped by reference speed, and pickle as a path."""
+        self.assertEqual(len(self.bank), 9)
+        self.assertIsInstance(self.bank.profiles, np.memmap)
+        np.testing.assert_array_equal(self.bank.reference_speed, np.repeat([0.0, 5.0, 15.0], 3))
+        np.testing.assert_array_equal(self.bank.profiles[:3], 0.0)
+        self.assertLess(len(pickle.dumps(self.bank)), 200)
+        reopened = pickle.loads(pickle.dumps(self.bank))
+        np.testing.assert_array_equal(reopened.profiles, self.bank.profiles)
+
+    def test_shear_and_gusts(self):
+        """Mean profiles should follow the shear laws, and gusts should average out around them."""
+        altitude = np.array([REFERENCE_HEIGHT, 100.0, 1000.0])
+        power = shear_profile(altitude, [5.0])[0]
+        self.assertAlmostEqual(power[0], 5.0)
+        self.assertAlmostEqual(power[2], 5.0 * 100 ** (1 / 7))
+        self.assertAlmostEqual(shear_profile(altitude, [5.0], "log")[0, 0], 5.0)
+        big = WindBank.create(os.path.join(self.temp_dir.name, "big"), [10.0], ensemble=2000, seed=2)
+        mean = shear_profile(big.altitude, [10.0])[0]
+        np.testing.assert_allclose(big.profiles[:].mean(axis=0)[1:], mean[1:], rtol=0.03)
+
+    def test_lookup(self):
+        """Scalar and vectorized lookups should interpolate the profile and clamp at the grid edges."""
+        wind = self.bank.select([4, 8])
+        altitude = np.array([1234.5, 25000.0])
+        expected = [np.interp(a, self.bank.altitude, self.bank.profiles[i]) for a, i in zip(altitude, (4, 8))]
+        np.testing.assert_allclose(wind.lookup_array(altitude), expected)
+        self.assertEqual(len(wind._rows), 0)  # Array lookups copy nothing
+        self.assertAlmostEqual(wind.lookup(1234.5, design=0), expected[0])
+        self.assertEqual(wind.lookup(-5.0, design=1), self.bank.profiles[8, 0])
+
+    def test_wind_in_flight(self):
+        """Calm profiles should not change a flight; wind should push it off its windless path."""
+        t, x, y, vx, vy = PhysCalcs(self.rocket_specs).simulate()
+        calm = PhysCalcs(self.rocket_specs, wind_bank=self.bank, wind_profile=1).simulate()
+        for a, b in zip((t, x, y, vx, vy), calm):
+            np.testing.assert_array_equal(a, b)
+        windy = PhysCalcs(self.rocket_specs, wind_bank=self.bank, wind_profile=7).simulate()
+        self.assertGreater(abs(windy[1][-1] - x[-1]), 1000)
+
+        # launch_conditions.wind alone gives the mean power-law profile
+        specs = with_field(self.rocket_specs, "launch_conditions", "wind", 15.0)
+        self.assertIsInstance(PhysCalcs(specs).wind, WindProfiles)
+        self.assertNotEqual(PhysCalcs(specs).simulate()[1][-1], x[-1])
+
+    def test_batch_matches_single(self):
+        """A batch should fly each design with its own profile, like PhysCalcs."""
+        profiles = [2, 5, 8]
+        batch = BatchPhysCalcs([self.rocket_specs] * 3, wind_bank=self.bank, wind_profiles=profiles)
+        summary = batch.simulate(output="summary")
+        for j, profile in enumerate(profiles):
+            single = PhysCalcs(self.rocket_specs, wind_bank=self.bank, wind_profile=profile)
+            expected = single.simulate(output="summary")
+            self.assertAlmostEqual(summary["landing_x"][j], expected["landing_x"], delta=1.0)
+        with self.assertRaises(ValueError):
+            BatchPhysCalcs([self.rocket_specs] * 3, wind_bank=self.bank, wind_profiles=[0])
+
+    def test_sweep_workers_share_bank(self):
+        """Pool workers should fly the profiles given per run."""
+        designs = [self.rocket_specs] * 4
+        with SweepRunner(designs, workers=2, batch_size=2, store_trajectories=False, wind_bank=self.bank,
+                         wind_profiles=[0, 8, 0, 8]).run() as results:
+            landing = results.summary("landing_x").copy()
+        self.assertEqual(landing[0], landing[2])
+        self.assertEqual(landing[1], landing[3])
+        self.assertNotAlmostEqual(landing[0], landing[1], delta=100)
+
+
+if __name__ == '__main__':
+    unittest.main()